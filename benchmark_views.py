@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+View construction benchmark for Hell Let Loose Discord Bot
+Times building the /maps and /tanks selector views with and without the option cache
+"""
+
+import asyncio
+import sys
+import timeit
+
+import discord
+
+from data.data_manager import data_manager
+from cogs.base_selector import BaseSelectorView, FactionSelectorDropdown
+from cogs.maps_command import StaticMapView
+
+ITERATIONS = 2000
+
+
+def build_maps_view():
+    StaticMapView()
+
+
+def build_tanks_views():
+    factions = data_manager.get_factions('tanks')
+    view = discord.ui.View(timeout=300)
+    view.add_item(FactionSelectorDropdown('tanks', factions))
+    BaseSelectorView('tanks', factions[0] if factions else None)
+
+
+def measure(build, cold: bool, iterations: int) -> float:
+    """Average microseconds per view build"""
+    def run():
+        if cold:
+            # Drop rendered options so every build starts from the raw content
+            data_manager.render_cache.invalidate('maps')
+            data_manager.render_cache.invalidate('tanks')
+        build()
+
+    run()
+    return timeit.timeit(run, number=iterations) / iterations * 1_000_000
+
+
+async def main(iterations: int):
+    # Views need a running event loop to be constructed
+    data_manager.warm_up()
+
+    print(f"⏱️ Building each view {iterations} times\n")
+    for name, build in (('/maps', build_maps_view), ('/tanks', build_tanks_views)):
+        cold = measure(build, True, iterations)
+        warm = measure(build, False, iterations)
+        print(f"{name:8} uncached {cold:8.1f} µs   cached {warm:8.1f} µs   ({cold / warm:.1f}x)")
+
+    print(f"\n📊 Render cache: {data_manager.render_cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS))
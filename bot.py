@@ -4,6 +4,9 @@ import asyncio
 import os
 import logging
 from config.settings import Settings
+from data.data_manager import data_manager
+from data.sqlite_store import SQLiteContentStore, import_json
+from data.stream_store import StreamingJSONStore
 
 # Set up logging
 logging.basicConfig(
@@ -23,6 +26,7 @@ async def on_ready():
     logger.info(f"🌍 Environment: {Settings.ENVIRONMENT}")
     logger.info(f"🖼️ Using external assets: {Settings.USE_EXTERNAL_ASSETS}")
     logger.info(f"📁 Assets directory: {Settings.ASSETS_DIR}")
+    logger.info(f"🧠 Asset memory cache: {Settings.ASSET_CACHE_MAX_MB} MB")
     
     # Show available assets (only in debug mode)
     if Settings.DEBUG:
@@ -135,6 +139,34 @@ async def main():
     asset_count = len(Settings._asset_cache) if hasattr(Settings, '_asset_cache') else 0
     print(f"🎨 Loaded {asset_count} asset files")
     
+    if Settings.PREBUILD_DERIVATIVES:
+        # Render size-targeted map derivatives in the background while we connect
+        print("🖼️ Pre-rendering oversized asset derivatives in the background...")
+        asyncio.get_running_loop().run_in_executor(None, Settings.build_asset_derivatives)
+    
+    if Settings.PREBUILD_PYRAMIDS:
+        # Zoom tiles are cut from the full maps, so build them before players ask
+        print("🔍 Building map zoom pyramids in the background...")
+        asyncio.get_running_loop().run_in_executor(None, Settings.build_map_pyramids)
+    
+    if Settings.CONTENT_BACKEND == 'sqlite':
+        # Only changed data files are re-imported, so this is cheap on every boot
+        print("🗄️ Importing content into SQLite...")
+        imported = import_json(str(Settings.DATA_DIR), str(Settings.CONTENT_DB_PATH))
+        data_manager.use_store(SQLiteContentStore(Settings.CONTENT_DB_PATH))
+        print(f"🗄️ Using SQLite content store ({len(imported)} categories re-imported)")
+    elif Settings.CONTENT_BACKEND == 'stream':
+        # Files are indexed on first use; nothing is parsed up front
+        data_manager.use_store(StreamingJSONStore(Settings.DATA_DIR, Settings.CONTENT_ITEM_CACHE_SIZE))
+        print("📑 Streaming content from data/*.json on demand")
+    else:
+        # Load all content up front so the first clicks don't pay for parsing
+        print("📚 Loading content...")
+        warm_up = data_manager.warm_up(use_snapshot=Settings.USE_CONTENT_SNAPSHOT)
+        print(f"📚 Loaded {warm_up['snapshot_categories']} categories from snapshot "
+              f"({warm_up['snapshot_ms']:.1f} ms) and {warm_up['json_categories']} from JSON "
+              f"({warm_up['json_ms']:.1f} ms)")
+    
     print("🔄 Loading command modules...")
     
     async with bot:
@@ -150,6 +182,11 @@ async def main():
         if failed_cogs:
             print(f"⚠️ Failed to load: {', '.join(failed_cogs)}")
         
+        # Pick up edits to data/*.json (or the content store) without a restart
+        data_manager.set_history_size(Settings.CONTENT_HISTORY_SIZE)
+        data_manager.overlays.max_guilds = Settings.GUILD_OVERLAY_CACHE_SIZE
+        data_manager.start_auto_reload(Settings.DATA_RELOAD_INTERVAL)
+        
         # Get bot token
         token = Settings.DISCORD_TOKEN
         if not token:
@@ -2,8 +2,9 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from data.data_manager import data_manager
+from data.records import ItemRecord
 from config.settings import Settings
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
 import aiohttp
 import io
 import logging
@@ -11,69 +12,163 @@ import os
 
 logger = logging.getLogger(__name__)
 
+def embed_from_template(template: Dict[str, Any]) -> discord.Embed:
+    """Build a fresh embed from a cached Embed.to_dict() template
+    
+    The fields list is copied so per-request add_field calls never leak
+    into the cached template.
+    """
+    data = dict(template)
+    if 'fields' in data:
+        data['fields'] = list(data['fields'])
+    return discord.Embed.from_dict(data)
+
+# Discord's limit on options per select
+PAGE_SIZE = 25
+
+# custom_id prefix of selector components handled by handle_selector_interaction
+SELECTOR_ID_PREFIX = 'hll_sel'
+
+def encode_selector_id(action: str, category: str, faction: Optional[str], page: int) -> str:
+    """Encode a selector component's state into its custom_id"""
+    return f"{SELECTOR_ID_PREFIX}:{action}:{page}:{category}:{faction or ''}"
+
+def decode_selector_id(custom_id: str) -> Optional[Tuple[str, int, str, Optional[str]]]:
+    """(action, page, category, faction) from a selector custom_id, None if it isn't one"""
+    parts = custom_id.split(':', 4)
+    if len(parts) != 5 or parts[0] != SELECTOR_ID_PREFIX:
+        return None
+    _, action, page, category, faction = parts
+    try:
+        return action, int(page), category, faction or None
+    except ValueError:
+        return None
+
+# custom_id prefix of "Related" buttons handled by handle_related_interaction
+RELATED_ID_PREFIX = 'hll_rel'
+
+# Buttons per related row (one action row)
+RELATED_LIMIT = 5
+
+CATEGORY_EMOJIS = {
+    'maps': '🗺️',
+    'tanks': '🛡️',
+    'weapons': '🔫',
+    'roles': '🎖️',
+    'vehicles': '🚚',
+    'tips': '💡',
+}
+
+# category -> coroutine(interaction, key) for categories send_item can't show (e.g. maps)
+ENTRY_OPENERS: Dict[str, Callable[[discord.Interaction, str], Awaitable[None]]] = {}
+
+# category -> builder(guild_id) of select options, for categories listed differently (e.g. maps)
+OPTION_BUILDERS: Dict[str, Callable[[Optional[int]], List[discord.SelectOption]]] = {}
+
+def encode_related_id(category: str, faction: Optional[str], key: str) -> str:
+    return f"{RELATED_ID_PREFIX}:{category}:{faction or ''}:{key}"
+
+def decode_related_id(custom_id: str) -> Optional[Tuple[str, Optional[str], str]]:
+    """(category, faction, key) from a related button's custom_id, None if it isn't one"""
+    parts = custom_id.split(':', 3)
+    if len(parts) != 4 or parts[0] != RELATED_ID_PREFIX:
+        return None
+    _, category, faction, key = parts
+    return category, faction or None, key
+
 class BaseSelectorDropdown(discord.ui.Select):
-    """Generic dropdown for selecting items from any category"""
+    """Generic dropdown for selecting items from any category (one page of them)"""
     
-    def __init__(self, category: str, faction: str = None, items: Dict[str, Any] = None):
+    def __init__(self, category: str, faction: str = None, page: int = 0, guild_id: Optional[int] = None):
         self.category = category
         self.faction = faction
+        # Guild whose content overlay applies, if any
+        self.guild_id = guild_id
         
-        if items is None:
-            items = data_manager.get_items(category, faction)
+        pages = self.get_pages(category, faction, guild_id)
+        self.page_count = len(pages)
+        self.page = max(0, min(page, self.page_count - 1))
         
-        if not items:
+        placeholder = f"Choose a {category.rstrip('s')}..."
+        if self.page_count > 1:
+            placeholder = f"Choose a {category.rstrip('s')}... (page {self.page + 1}/{self.page_count})"
+        
+        super().__init__(
+            placeholder=placeholder,
+            min_values=1,
+            max_values=1,
+            options=list(pages[self.page]),
+            custom_id=encode_selector_id('pick', category, faction, self.page)
+        )
+    
+    @classmethod
+    def get_pages(cls, category: str, faction: str = None,
+                  guild_id: Optional[int] = None) -> List[List[discord.SelectOption]]:
+        """Options split into pages of PAGE_SIZE, built once per content version"""
+        builder = OPTION_BUILDERS.get(category)
+        return data_manager.get_rendered(
+            'select_pages', category, faction,
+            lambda: cls.paginate(builder(guild_id) if builder else cls.build_options(category, faction, guild_id)),
+            guild_id=guild_id
+        )
+    
+    @staticmethod
+    def paginate(options: List[discord.SelectOption]) -> List[List[discord.SelectOption]]:
+        return [options[start:start + PAGE_SIZE] for start in range(0, len(options), PAGE_SIZE)]
+    
+    @staticmethod
+    def build_options(category: str, faction: str = None, guild_id: Optional[int] = None) -> List[discord.SelectOption]:
+        """Build the select options for a category/faction"""
+        records = data_manager.get_records(category, faction, guild_id)
+        
+        if not records:
             logger.warning(f"No items found for category '{category}' with faction '{faction}'")
             # Create a placeholder option to prevent Discord errors
-            options = [discord.SelectOption(
+            return [discord.SelectOption(
                 label="No items available",
                 value="none",
                 description="No content found for this category"
             )]
-        else:
-            # Create options from items
-            options = []
-            for key, item in items.items():
-                try:
-                    label = item.get('display_name', key.title())
-                    description = item.get('short_description', '')[:100]  # Discord limit
-                    emoji = item.get('emoji', None)
-                    
-                    options.append(discord.SelectOption(
-                        label=label,
-                        value=key,
-                        description=description,
-                        emoji=emoji
-                    ))
-                except Exception as e:
-                    logger.error(f"Error creating option for {key}: {e}")
-                    # Add a fallback option
-                    options.append(discord.SelectOption(
-                        label=key.title(),
-                        value=key,
-                        description="Item details unavailable"
-                    ))
         
-        super().__init__(
-            placeholder=f"Choose a {category.rstrip('s')}...",
-            min_values=1,
-            max_values=1,
-            options=options[:25]  # Discord limit
-        )
+        return [
+            discord.SelectOption(
+                label=record.display_name,
+                value=record.key,
+                description=record.short_description[:100],  # Discord limit
+                emoji=record.emoji
+            )
+            for record in records.values()
+        ]
     
     async def callback(self, interaction: discord.Interaction):
-        if self.values[0] == "none":
+        await self.choose(interaction, self.values[0])
+    
+    async def choose(self, interaction: discord.Interaction, selected_key: str):
+        if selected_key == "none":
             await interaction.response.send_message(
                 "❌ No content available for this category.",
                 ephemeral=True
             )
             return
-            
-        selected_key = self.values[0]
-        item_data = data_manager.get_item(self.category, selected_key, self.faction)
         
-        if not item_data:
+        opener = ENTRY_OPENERS.get(self.category)
+        if opener:
+            await opener(interaction, selected_key)
+        else:
+            await self.send_item(interaction, selected_key)
+    
+    async def send_item(self, interaction: discord.Interaction, selected_key: str):
+        """Send an item's embed and attachments as a personal response"""
+        # Derivatives and collages may render on a cold item, so acknowledge first
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True, thinking=True)
+        
+        await data_manager.aload_overlay(self.category, self.guild_id)
+        record = data_manager.get_record(self.category, selected_key, self.faction, self.guild_id)
+        
+        if not record:
             logger.error(f"No data found for {self.category}/{selected_key}")
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ Sorry, data for '{selected_key}' could not be found.",
                 ephemeral=True
             )
@@ -82,23 +177,32 @@ class BaseSelectorDropdown(discord.ui.Select):
         logger.info(f"🔍 Processing {self.category} selection: {selected_key}")
         
         try:
-            embed = self.create_embed(item_data, selected_key)
-            files = await self.get_files(item_data, selected_key)
+            upload_limit = Settings.get_upload_limit(interaction.guild)
+            batches = await self.get_file_batches(record, upload_limit)
+            files = batches[0] if batches else []
+            embed = self.create_embed(record, sent_files=files)
+            related = RelatedView(self.category, self.faction, selected_key)
             
             logger.info(f"📎 Created {len(files)} file attachments")
             
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 embed=embed,
                 files=files,
+                view=related if related.children else discord.utils.MISSING,
                 ephemeral=True
             )
+            
+            # Images that didn't fit alongside the embed follow in their own messages
+            for overflow in batches[1:]:
+                await interaction.followup.send(files=overflow, ephemeral=True)
+            
             logger.info(f"✅ Successfully sent {self.category} info for {selected_key}")
             
         except discord.errors.RequestEntityTooLarge:
             logger.error(f"❌ Files too large for {selected_key}, trying without attachments")
             try:
-                embed = self.create_embed(item_data, selected_key, include_thumbnails=False)
-                await interaction.response.send_message(
+                embed = self.create_embed(record, include_thumbnails=False)
+                await interaction.followup.send(
                     embed=embed,
                     ephemeral=True
                 )
@@ -127,114 +231,91 @@ class BaseSelectorDropdown(discord.ui.Select):
         except Exception as e:
             logger.error(f"❌ Failed to send error message: {e}")
     
-    def create_embed(self, item_data: Dict[str, Any], key: str, include_thumbnails: bool = True) -> discord.Embed:
-        """Create embed from item data"""
-        try:
-            embed = discord.Embed(
-                title=item_data.get('title', key.title()),
-                color=int(item_data.get('color', '0x5865F2'), 16)
-            )
-        except ValueError:
-            # Fallback if color is invalid
-            embed = discord.Embed(
-                title=item_data.get('title', key.title()),
-                color=0x5865F2
-            )
+    def create_embed(self, record: ItemRecord, include_thumbnails: bool = True,
+                     sent_files: Optional[List[discord.File]] = None) -> discord.Embed:
+        """Create embed from an item record
         
-        # Add all fields from data
-        field_count = 0
-        for field_key, field_value in item_data.items():
-            if field_key.startswith('field_') and field_count < 25:  # Discord embed limit
-                try:
-                    field_name = field_key.replace('field_', '').replace('_', ' ').title()
-                    # Truncate field values if too long
-                    if len(str(field_value)) > 1024:
-                        field_value = str(field_value)[:1021] + "..."
-                    
-                    embed.add_field(
-                        name=field_name,
-                        value=field_value,
-                        inline=item_data.get(f"{field_key}_inline", False)
-                    )
-                    field_count += 1
-                except Exception as e:
-                    logger.error(f"Error adding field {field_key}: {e}")
+        sent_files lets the thumbnail point at a derivative attachment when the
+        original was too large and got swapped for a different format.
+        """
+        # Title, color and fields only change with the content, so render them once per version
+        template = data_manager.get_rendered(
+            'embed', self.category, (self.faction, record.key),
+            lambda: self.render_embed(record).to_dict(),
+            guild_id=self.guild_id
+        )
+        embed = embed_from_template(template)
         
         # Set thumbnail if available and requested
-        if include_thumbnails and 'thumbnail' in item_data:
-            thumbnail_path = item_data['thumbnail']
-            # Remove "attachment://" prefix if present
-            if thumbnail_path.startswith('attachment://'):
-                thumbnail_path = thumbnail_path.replace('attachment://', '')
-            
+        if include_thumbnails and record.thumbnail:
             if Settings.USE_EXTERNAL_ASSETS:
-                embed.set_thumbnail(url=Settings.get_asset_url(thumbnail_path))
+                embed.set_thumbnail(url=Settings.get_asset_url(record.thumbnail))
             else:
                 # For local assets - use attachment format
+                thumbnail_path = self._attachment_name(record.thumbnail, sent_files)
                 embed.set_thumbnail(url=f"attachment://{thumbnail_path}")
                 logger.info(f"🖼️ Set thumbnail to attachment://{thumbnail_path}")
         
         return embed
     
-    async def get_files(self, item_data: Dict[str, Any], key: str) -> List[discord.File]:
-        """Get files for the embed"""
-        files = []
+    def render_embed(self, record: ItemRecord) -> discord.Embed:
+        """Render the content part of an item's embed (everything but attachments)"""
+        embed = discord.Embed(title=record.title, color=record.color)
+        for field in record.fields:
+            embed.add_field(name=field.name, value=field.value, inline=field.inline)
+        return embed
+    
+    @staticmethod
+    def _attachment_name(filename: str, sent_files: Optional[List[discord.File]]) -> str:
+        """Get the name an asset was actually attached under (derivatives keep the stem)"""
+        if not sent_files:
+            return filename
+        stem = os.path.splitext(filename)[0]
+        for file in sent_files:
+            if file.filename == filename:
+                return filename
+        for file in sent_files:
+            if os.path.splitext(file.filename)[0] == stem:
+                return file.filename
+        return filename
+    
+    async def get_file_batches(self, record: ItemRecord, max_bytes: int) -> List[List[discord.File]]:
+        """Get attachments split into messages that each fit the upload limit
         
+        The first batch goes with the embed (thumbnail first); the rest are
+        sent as follow-ups. Oversized assets are swapped for derivatives.
+        """
         if Settings.USE_EXTERNAL_ASSETS:
             logger.info("🌐 Using external assets, no files to attach")
-            return files
+            return []
         
-        logger.info("📁 Using local assets, creating file attachments")
+        logger.info("📁 Using local assets, planning file attachments")
         
-        # Local file handling - thumbnail
-        if 'thumbnail' in item_data:
-            thumbnail_file = item_data['thumbnail']
-            # Remove "attachment://" prefix if present
-            if thumbnail_file.startswith('attachment://'):
-                thumbnail_file = thumbnail_file.replace('attachment://', '')
-            
-            logger.info(f"🔍 Looking for thumbnail: {thumbnail_file}")
-            
-            if Settings.DEBUG:
-                Settings.debug_asset_loading(thumbnail_file)
-            
-            file_obj = Settings.get_asset_file(thumbnail_file)
-            if file_obj:
-                files.append(file_obj)
-                logger.info(f"✅ Added thumbnail file: {thumbnail_file}")
-            else:
-                logger.warning(f"❌ Failed to load thumbnail: {thumbnail_file}")
+        names = [record.thumbnail] if record.thumbnail else []
+        gallery = list(record.gallery)
+        if Settings.DEBUG:
+            for name in record.asset_names:
+                Settings.debug_asset_loading(name)
         
-        # Additional images for local hosting
-        additional_images = item_data.get('additional_images', [])
-        if additional_images:
-            logger.info(f"🔍 Processing {len(additional_images)} additional images")
-            
-            for image in additional_images:
-                logger.info(f"🔍 Looking for additional image: {image}")
-                
-                if Settings.DEBUG:
-                    Settings.debug_asset_loading(image)
-                
-                file_obj = Settings.get_asset_file(image)
+        # Additional images are combined into one collage attachment when possible
+        plan, missing = await Settings.aplan_asset_attachments(names, max_bytes, gallery, record.key)
+        for name in missing:
+            logger.warning(f"❌ Failed to load or fit attachment: {name}")
+        
+        batches = []
+        for planned_batch in plan:
+            files = []
+            for planned in planned_batch:
+                file_obj = await Settings.aget_planned_file(planned, max_bytes)
                 if file_obj:
                     files.append(file_obj)
-                    logger.info(f"✅ Added additional image: {image}")
-                else:
-                    logger.warning(f"❌ Failed to load additional image: {image}")
-        
-        # Check total file size to prevent Discord errors
-        total_size = sum(file.fp.seek(0, 2) or file.fp.tell() for file in files)
-        for file in files:
-            file.fp.seek(0)  # Reset file pointer
+                    logger.info(f"✅ Added attachment: {file_obj.filename}")
+            if files:
+                batches.append(files)
         
-        if total_size > 25 * 1024 * 1024:  # 25MB Discord limit
-            logger.warning(f"⚠️ Total file size ({total_size / 1024 / 1024:.1f}MB) exceeds Discord limit")
-            files = files[:3]  # Limit to first 3 files
-            logger.info(f"📎 Reduced to {len(files)} files to stay under size limit")
-        
-        logger.info(f"📎 Total files prepared: {len(files)}")
-        return files
+        total_files = sum(len(files) for files in batches)
+        logger.info(f"📎 Total files prepared: {total_files} in {len(batches)} message(s)")
+        return batches
 
 
 class FactionSelectorDropdown(discord.ui.Select):
@@ -243,6 +324,21 @@ class FactionSelectorDropdown(discord.ui.Select):
     def __init__(self, category: str, factions: List[str]):
         self.category = category
         
+        options = data_manager.get_rendered(
+            'faction_options', category, tuple(factions),
+            lambda: self.build_options(factions)
+        )
+        
+        super().__init__(
+            placeholder="Choose a faction...",
+            min_values=1,
+            max_values=1,
+            options=list(options)
+        )
+    
+    @staticmethod
+    def build_options(factions: List[str]) -> List[discord.SelectOption]:
+        """Build faction options with display names and flags"""
         options = []
         faction_config = {
             'us': {'name': 'United States', 'emoji': '🇺🇸'},
@@ -259,26 +355,19 @@ class FactionSelectorDropdown(discord.ui.Select):
                 value=faction,
                 emoji=config['emoji']
             ))
-        
-        super().__init__(
-            placeholder="Choose a faction...",
-            min_values=1,
-            max_values=1,
-            options=options
-        )
+        return options
     
     async def callback(self, interaction: discord.Interaction):
         selected_faction = self.values[0]
-        items = data_manager.get_items(self.category, selected_faction)
-        
-        if not items:
+        await data_manager.aload_overlay(self.category, interaction.guild_id)
+        if not data_manager.get_records(self.category, selected_faction, interaction.guild_id):
             await interaction.response.send_message(
                 f"❌ No {self.category} found for {selected_faction.title()}.",
                 ephemeral=True
             )
             return
         
-        view = BaseSelectorView(self.category, selected_faction, items)
+        view = BaseSelectorView(self.category, selected_faction, guild_id=interaction.guild_id)
         await interaction.response.send_message(
             f"🎯 Selected {selected_faction.title()}. Choose an item:",
             view=view,
@@ -287,20 +376,182 @@ class FactionSelectorDropdown(discord.ui.Select):
 
 
 class BaseSelectorView(discord.ui.View):
-    """Generic view for item selection"""
+    """Generic paginated view for item selection
+    
+    The view is stateless: every component carries its action, page, category
+    and faction in its custom_id and is handled by handle_selector_interaction,
+    so nothing is kept in memory per user and old messages keep working.
+    The guild (for content overlays) comes from the interaction.
+    """
     
-    def __init__(self, category: str, faction: str = None, items: Dict[str, Any] = None):
-        super().__init__(timeout=300)
+    def __init__(self, category: str, faction: str = None, page: int = 0, guild_id: Optional[int] = None):
+        super().__init__(timeout=None)
         
-        if items is None:
-            items = data_manager.get_items(category, faction)
+        dropdown = BaseSelectorDropdown(category, faction, page, guild_id)
+        self.add_item(dropdown)
         
-        self.add_item(BaseSelectorDropdown(category, faction, items))
+        page, page_count = dropdown.page, dropdown.page_count
+        if page_count > 1:
+            self.add_page_button("⏮", 'first', category, faction, 0, page == 0)
+            self.add_page_button("◀", 'prev', category, faction, page - 1, page == 0)
+            self.add_page_button(f"{page + 1}/{page_count}", 'at', category, faction, page, True)
+            self.add_page_button("▶", 'next', category, faction, page + 1, page == page_count - 1)
+            self.add_page_button("⏭", 'last', category, faction, page_count - 1, page == page_count - 1)
+        
+        if page_count > 3:
+            self.add_item(self.build_jump_select(category, faction, page, guild_id))
+        
+        # Nothing to keep around - stopped views aren't stored by discord.py
+        self.stop()
     
-    async def on_timeout(self):
-        """Handle view timeout"""
-        for item in self.children:
-            item.disabled = True
+    def add_page_button(self, label: str, action: str, category: str, faction: Optional[str],
+                        page: int, disabled: bool):
+        self.add_item(discord.ui.Button(
+            label=label,
+            style=discord.ButtonStyle.secondary,
+            custom_id=encode_selector_id(action, category, faction, page),
+            disabled=disabled,
+            row=1
+        ))
+    
+    @staticmethod
+    def build_jump_select(category: str, faction: Optional[str], page: int,
+                          guild_id: Optional[int] = None) -> discord.ui.Select:
+        """Jump to any of the (up to 25) pages around the current one"""
+        pages = BaseSelectorDropdown.get_pages(category, faction, guild_id)
+        start = max(0, min(page - PAGE_SIZE // 2, len(pages) - PAGE_SIZE))
+        options = []
+        for number in range(start, min(len(pages), start + PAGE_SIZE)):
+            first, last = pages[number][0].label, pages[number][-1].label
+            options.append(discord.SelectOption(
+                label=f"Page {number + 1}",
+                value=str(number),
+                description=f"{first} – {last}"[:100],
+                default=number == page
+            ))
+        return discord.ui.Select(
+            placeholder="Jump to page...",
+            options=options,
+            custom_id=encode_selector_id('jump', category, faction, page),
+            row=2
+        )
+
+
+class RelatedButton(discord.ui.Button):
+    """Opens an entry linked to the one on screen
+    
+    Stateless buttons encode the entry in their custom_id and are handled by
+    handle_related_interaction; buttons on a live view open it themselves.
+    """
+    
+    def __init__(self, category: str, faction: Optional[str], key: str, name: str,
+                 stateless: bool = True, row: Optional[int] = None):
+        super().__init__(
+            label=name[:80],
+            emoji=CATEGORY_EMOJIS.get(category),
+            style=discord.ButtonStyle.secondary,
+            custom_id=encode_related_id(category, faction, key) if stateless else None,
+            row=row
+        )
+        self.category = category
+        self.faction = faction
+        self.key = key
+    
+    @classmethod
+    def for_entry(cls, category: str, faction: Optional[str], key: str,
+                  stateless: bool = True, row: Optional[int] = None) -> List['RelatedButton']:
+        """Buttons for the entries linked to an entry (precomputed by the cross-reference index)"""
+        buttons = []
+        for (related_category, related_faction, related_key), name in data_manager.get_related(
+                category, key, faction, RELATED_LIMIT):
+            # custom_ids are capped at 100 characters
+            if len(encode_related_id(related_category, related_faction, related_key)) <= 100:
+                buttons.append(cls(related_category, related_faction, related_key, name, stateless, row))
+        return buttons
+    
+    async def callback(self, interaction: discord.Interaction):
+        await open_entry(interaction, self.category, self.faction, self.key)
+
+
+class RelatedView(discord.ui.View):
+    """Stateless row of "Related" buttons for an item's embed"""
+    
+    def __init__(self, category: str, faction: Optional[str], key: str):
+        super().__init__(timeout=None)
+        for button in RelatedButton.for_entry(category, faction, key):
+            self.add_item(button)
+        # Handled by handle_related_interaction, nothing to keep around
+        self.stop()
+
+
+async def open_entry(interaction: discord.Interaction, category: str, faction: Optional[str], key: str):
+    """Send any entry as a personal response, however its category is shown"""
+    opener = ENTRY_OPENERS.get(category)
+    if opener:
+        await opener(interaction, key)
+    else:
+        await BaseSelectorDropdown(category, faction, guild_id=interaction.guild_id).send_item(interaction, key)
+
+
+async def handle_related_interaction(interaction: discord.Interaction) -> bool:
+    """Handle a stateless "Related" button, returning False if it isn't one"""
+    entry = decode_related_id((interaction.data or {}).get('custom_id', ''))
+    if entry is None:
+        return False
+    
+    category, faction, key = entry
+    logger.info(f"🔗 Related {category}/{key} opened by {interaction.user}")
+    try:
+        await open_entry(interaction, category, faction, key)
+    except Exception as e:
+        logger.error(f"❌ Error opening related {category}/{key}: {e}")
+        if not interaction.response.is_done():
+            await interaction.response.send_message(
+                f"❌ Sorry, there was an error loading '{key}'. Please try again later.",
+                ephemeral=True
+            )
+        else:
+            await interaction.followup.send(
+                f"❌ Sorry, there was an error loading '{key}'. Please try again later.",
+                ephemeral=True
+            )
+    return True
+
+
+async def handle_selector_interaction(interaction: discord.Interaction) -> bool:
+    """Handle a component of a BaseSelectorView, returning False if it isn't one"""
+    state = decode_selector_id((interaction.data or {}).get('custom_id', ''))
+    if state is None:
+        return False
+    
+    action, page, category, faction = state
+    try:
+        # Selector options are rendered from the guild's overlay, so have it loaded
+        await data_manager.aload_overlay(category, interaction.guild_id)
+        if action == 'pick':
+            dropdown = BaseSelectorDropdown(category, faction, page=page, guild_id=interaction.guild_id)
+            await dropdown.choose(interaction, interaction.data['values'][0])
+            return True
+        
+        if action == 'jump':
+            page = int(interaction.data['values'][0])
+        
+        await interaction.response.edit_message(
+            view=BaseSelectorView(category, faction, page=page, guild_id=interaction.guild_id)
+        )
+    except Exception as e:
+        logger.error(f"❌ Error handling {category} selector {action} (page {page}): {e}")
+        if not interaction.response.is_done():
+            await interaction.response.send_message(
+                f"❌ Sorry, there was an error loading {category}. Please try again later.",
+                ephemeral=True
+            )
+        else:
+            await interaction.followup.send(
+                f"❌ Sorry, there was an error loading {category}. Please try again later.",
+                ephemeral=True
+            )
+    return True
 
 
 class GenericSelector(commands.Cog):
@@ -316,25 +567,34 @@ class GenericSelector(commands.Cog):
         """Dynamically create the slash command"""
         
         @app_commands.command(name=self.command_name, description=self.description)
-        async def generic_command(interaction: discord.Interaction):
+        @app_commands.describe(name=f"Jump straight to a {self.category.rstrip('s')} (optional)")
+        async def generic_command(interaction: discord.Interaction, name: Optional[str] = None):
             logger.info(f"🚀 {self.command_name} command triggered by {interaction.user}")
             
+            if name:
+                await self.send_named_item(interaction, name)
+                return
+            
             try:
-                factions = data_manager.get_factions(self.category)
+                # A cold category is prepared once off the loop, however many commands arrive
+                guild_id = interaction.guild_id
+                await data_manager.aprepare(self.category, guild_id)
+                factions = data_manager.get_factions(self.category, guild_id)
                 
                 if len(factions) <= 1:
                     # Single faction or no factions, go directly to items
-                    items = data_manager.get_items(self.category)
-                    logger.info(f"📋 Found {len(items)} items in {self.category}")
+                    faction = factions[0] if factions and not data_manager.is_item(self.category, factions[0], guild_id) else None
+                    records = data_manager.get_records(self.category, faction, guild_id)
+                    logger.info(f"📋 Found {len(records)} items in {self.category}")
                     
-                    if not items:
+                    if not records:
                         await interaction.response.send_message(
                             f"❌ No {self.category} data available at this time.",
                             ephemeral=True
                         )
                         return
                     
-                    view = BaseSelectorView(self.category, None, items)
+                    view = BaseSelectorView(self.category, faction, guild_id=guild_id)
                     await interaction.response.send_message(
                         f"🎯 Select a {self.category.rstrip('s')}:",
                         view=view,
@@ -359,8 +619,39 @@ class GenericSelector(commands.Cog):
                     ephemeral=True
                 )
         
+        @generic_command.autocomplete('name')
+        async def name_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+            await data_manager.aload_overlay(self.category, interaction.guild_id)
+            return [
+                app_commands.Choice(name=display_name[:100], value=self.encode_choice(faction, key))
+                for faction, key, display_name
+                in data_manager.get_name_index(self.category, guild_id=interaction.guild_id).complete(current)
+            ]
+        
         # Add the command to the bot's tree
         self.bot.tree.add_command(generic_command)
+    
+    @staticmethod
+    def encode_choice(faction: Optional[str], key: str) -> str:
+        return f"{faction}/{key}" if faction else key
+    
+    async def send_named_item(self, interaction: discord.Interaction, name: str):
+        """Send an item picked through autocomplete (or typed by name) directly"""
+        guild_id = interaction.guild_id
+        await data_manager.aload_overlay(self.category, guild_id)
+        faction, _, key = name.rpartition('/')
+        if not data_manager.get_record(self.category, key, faction or None, guild_id):
+            # Free text rather than an autocomplete value - look it up by name
+            entry = data_manager.get_name_index(self.category, guild_id=guild_id).resolve(name)
+            if not entry:
+                await interaction.response.send_message(
+                    f"❌ No {self.category.rstrip('s')} called '{name}' found.",
+                    ephemeral=True
+                )
+                return
+            faction, key, _ = entry
+        
+        await BaseSelectorDropdown(self.category, faction or None, guild_id=guild_id).send_item(interaction, key)
 
 async def setup(bot):
     # This cog is imported by content_manager, no direct setup needed
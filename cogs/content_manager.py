@@ -1,5 +1,16 @@
+import discord
 from discord.ext import commands
-from .base_selector import GenericSelector
+from discord import app_commands
+from data.data_manager import data_manager
+from .base_selector import GenericSelector, handle_related_interaction, handle_selector_interaction
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Discord allows 25 fields and 6000 characters per embed
+MAX_EMBED_FIELDS = 25
+MAX_EMBED_CHARS = 6000
 
 class ContentManager(commands.Cog):
     """Manages registration of all content types"""
@@ -46,6 +57,73 @@ class ContentManager(commands.Cog):
                 content['description']
             )
             selector.create_command()
+    
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Route stateless selector and related components (their state lives in the custom_id)"""
+        if interaction.type is discord.InteractionType.component:
+            if not await handle_selector_interaction(interaction):
+                await handle_related_interaction(interaction)
+
+    @staticmethod
+    async def require_admin(interaction: discord.Interaction) -> bool:
+        permissions = getattr(interaction.user, 'guild_permissions', None)
+        if permissions is None or not permissions.administrator:
+            await interaction.response.send_message(
+                "❌ You need Administrator permission to manage content versions.",
+                ephemeral=True
+            )
+            return False
+        return True
+    
+    @app_commands.command(
+        name="content-history",
+        description="List the content revisions kept for rollback (admin)"
+    )
+    async def content_history(self, interaction: discord.Interaction):
+        if not await self.require_admin(interaction):
+            return
+        
+        current = data_manager.revision
+        revisions = [current] + data_manager.history()[::-1]
+        footer = "Use /content-rollback to restore a previous revision"
+        embed = discord.Embed(title="🗂️ Content Revisions", color=0x5865F2)
+        for revision in revisions[:MAX_EMBED_FIELDS]:
+            versions = ", ".join(f"{category} v{version}" for category, version in sorted(revision.versions.items()))
+            name = f"{'▶️ ' if revision is current else ''}Revision {revision.number} • <t:{int(revision.created_at)}:R>"
+            value = versions[:1024] or "No content loaded"
+            # Leave room for the footer below
+            if len(embed) + len(name) + len(value) + len(footer) + 40 > MAX_EMBED_CHARS:
+                break
+            embed.add_field(name=name, value=value, inline=False)
+        
+        hidden = len(revisions) - len(embed.fields)
+        if hidden:
+            footer = f"{hidden} older revisions not shown • {footer}"
+        embed.set_footer(text=footer)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(
+        name="content-rollback",
+        description="Restore a previous content revision (admin)"
+    )
+    @app_commands.describe(revision="Revision number from /content-history (defaults to the previous one)")
+    async def content_rollback(self, interaction: discord.Interaction, revision: Optional[int] = None):
+        if not await self.require_admin(interaction):
+            return
+        
+        try:
+            restored = data_manager.rollback(revision)
+        except ValueError as e:
+            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+            return
+        
+        logger.warning(f"⏪ Content rolled back by {interaction.user} (now revision {restored.number})")
+        await interaction.response.send_message(
+            f"⏪ Content restored (now revision {restored.number}). "
+            f"It stays live until a data file is edited again.",
+            ephemeral=True
+        )
 
 async def setup(bot):
     await bot.add_cog(ContentManager(bot))
@@ -3,8 +3,13 @@ from discord.ext import commands
 from discord import app_commands
 from data.data_manager import data_manager
 from config.settings import Settings
+from media.pyramid import ZOOM_LEVELS, tiles_per_side
+from media.compositor import LAYER_LABELS
+from .base_selector import ENTRY_OPENERS, OPTION_BUILDERS, BaseSelectorDropdown, BaseSelectorView, RelatedButton, embed_from_template
+import io
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,112 @@ MAP_NAME_FIXES = {
     'elsenborn': 'ElsenbornRidge',
 }
 
+# Variants that can be composed from the NoGrid base when their PNG isn't shipped
+COMPOSED_VARIANTS = {
+    'Grid': ('grid',),
+    'defaultgarries': ('grid', 'garrisons'),
+}
+
+def get_map_display_name(map_key: str) -> str:
+    """Get proper display name for map"""
+    display_name = map_key.title().replace('_', ' ')
+    name_map = {
+        'sme': 'Sainte-Mère-Église',
+        'phl': 'Purple Heart Lane',
+        'smdmv2': 'Saint-Marie-du-Mont V2',
+        'elalamein': 'El Alamein'
+    }
+    return name_map.get(map_key.lower(), display_name)
+
+def get_map_name_index(guild_id: Optional[int] = None):
+    """Prefix index over map keys and display names, for autocomplete"""
+    return data_manager.get_name_index('maps', lambda map_key, _: get_map_display_name(map_key), guild_id)
+
+async def map_name_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    """Suggest maps whose key or display name starts with what was typed"""
+    await data_manager.aload_overlay('maps', interaction.guild_id)
+    return [
+        app_commands.Choice(name=display_name, value=map_key)
+        for _, map_key, display_name in get_map_name_index(interaction.guild_id).complete(current)
+    ]
+
+def build_map_embed(map_name: str, map_info: Dict[str, Any], variant: str, user: discord.User,
+                    content_version=None, guild_id: Optional[int] = None) -> discord.Embed:
+    """Create a formatted embed for map information
+    
+    content_version is the maps version map_info was read at, for views that
+    outlive a content update (defaults to the current version).
+    """
+    # The briefing only changes with maps.json, so render it once per content version
+    template = data_manager.get_rendered(
+        'map_embed', 'maps', map_name,
+        lambda: render_map_embed(map_name, map_info).to_dict(),
+        version=content_version,
+        guild_id=guild_id
+    )
+    embed = embed_from_template(template)
+    
+    # Add footer with variant info
+    embed.set_footer(text=f"Map Variant: {variant} | Personal View for {user.display_name}")
+    
+    return embed
+
+def render_map_embed(map_name: str, map_info: Dict[str, Any]) -> discord.Embed:
+    """Render the per-map part of a map embed (no per-user footer)"""
+    embed = discord.Embed(
+        title=map_info.get("title", f"{map_name} — Tactical Map Briefing"),
+        color=0x5865F2
+    )
+    
+    # Add fields with proper formatting
+    fields = [
+        ("🌍 Terrain", map_info.get("terrain", "No terrain info available")),
+        ("🎯 Key Points", map_info.get("points", "No key points info available")),
+        ("👥 Infantry Strategy", map_info.get("infantry", "No infantry strategy available")),
+        ("🚗 Armor Strategy", map_info.get("armor", "No armor strategy available"))
+    ]
+    
+    for name, value in fields:
+        # Truncate if too long
+        if len(value) > 1024:
+            value = value[:1021] + "..."
+        embed.add_field(name=name, value=value, inline=False)
+    
+    return embed
+
+async def send_composed_map(interaction: discord.Interaction, map_key: str, map_info: Dict[str, Any],
+                            layers: Sequence[str], variant: str, content_version=None):
+    """Compose a map from its NoGrid base plus overlay layers and send it privately"""
+    actual_map_name = MAP_NAME_FIXES.get(map_key, map_key.title())
+    
+    # A cold composition decodes the full base image, so acknowledge first
+    if not interaction.response.is_done():
+        await interaction.response.defer(ephemeral=True, thinking=True)
+    
+    try:
+        file_obj = await Settings.aget_composite_map_file(
+            actual_map_name,
+            layers,
+            map_info.get('overlays'),
+            Settings.get_upload_limit(interaction.guild)
+        )
+    except Exception as e:
+        logger.error(f"❌ Error composing {actual_map_name} with {list(layers)}: {e}")
+        file_obj = None
+    
+    embed = build_map_embed(actual_map_name, map_info, variant, interaction.user, content_version, interaction.guild_id)
+    if file_obj:
+        embed.set_image(url=f"attachment://{file_obj.filename}")
+        await interaction.followup.send(embed=embed, file=file_obj, ephemeral=True)
+        logger.info(f"✅ Sent composed map {file_obj.filename} to {interaction.user}")
+    else:
+        embed.add_field(
+            name="⚠️ Image Not Available",
+            value=f"Map image for `{actual_map_name}` could not be composed.",
+            inline=False
+        )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
 class PersonalVariantButton(discord.ui.Button):
     """Variant button that sends personal responses only"""
     def __init__(self, label, suffix, map_key, map_info):
@@ -57,17 +168,49 @@ class PersonalVariantButton(discord.ui.Button):
                 logger.info(f"✅ Sent map {actual_map_name} with external image to {interaction.user}")
                 
             else:
+                # A first click on an oversized map renders a derivative, so acknowledge first
+                await interaction.response.defer(ephemeral=True, thinking=True)
+                
+                # Oversized maps are swapped for a derivative that fits the guild's limit
+                upload_limit = Settings.get_upload_limit(interaction.guild)
+                
+                # Reuse the CDN copy if this image was already uploaded once under this limit
+                cdn_url = await Settings.resolve_uploaded_asset_url(image_filename, upload_limit)
+                message = None
+                if cdn_url:
+                    embed.set_image(url=cdn_url)
+                    message = await interaction.followup.send(embed=embed, ephemeral=True, wait=True,
+                                                              **self.zoom_view_kwargs(image_filename))
+                    # Checked after sending so the CDN round trip never delays the reply
+                    if await Settings.verify_uploaded_asset_url(image_filename, upload_limit):
+                        logger.info(f"✅ Sent map {actual_map_name} with cached CDN image to {interaction.user}")
+                        return
+                    # The link is dead - upload the image into the message just sent
+                    embed.set_image(url=None)
+                
                 # Use local file
                 logger.info(f"📁 Looking for local asset: {image_filename}")
                 
                 if Settings.DEBUG:
                     Settings.debug_asset_loading(image_filename)
                 
-                file_obj = Settings.get_asset_file(image_filename)
+                file_obj = await Settings.aget_asset_file(image_filename, max_bytes=upload_limit)
+                if file_obj is None and self.suffix in COMPOSED_VARIANTS and Settings.compositor_available():
+                    # No prebuilt PNG for this variant - compose it from the base and overlays
+                    await send_composed_map(interaction, self.map_key, self.map_info,
+                                            COMPOSED_VARIANTS[self.suffix], self.suffix,
+                                            self.view.content_version)
+                    return
+                
                 if file_obj:
-                    embed.set_image(url=f"attachment://{image_filename}")
-                    await interaction.response.send_message(embed=embed, file=file_obj, ephemeral=True)
-                    logger.info(f"✅ Sent map {actual_map_name} with local image to {interaction.user}")
+                    embed.set_image(url=f"attachment://{file_obj.filename}")
+                    if message:
+                        message = await message.edit(embed=embed, attachments=[file_obj])
+                    else:
+                        message = await interaction.followup.send(embed=embed, file=file_obj, ephemeral=True, wait=True,
+                                                                  **self.zoom_view_kwargs(image_filename))
+                    logger.info(f"✅ Sent map {actual_map_name} with local image {file_obj.filename} to {interaction.user}")
+                    await self.remember_uploaded_image(message, image_filename, file_obj.filename, upload_limit)
                 else:
                     # No image found, send embed only with warning
                     embed.add_field(
@@ -75,7 +218,10 @@ class PersonalVariantButton(discord.ui.Button):
                         value=f"Map image `{image_filename}` could not be loaded.",
                         inline=False
                     )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
+                    if message:
+                        await message.edit(embed=embed)
+                    else:
+                        await interaction.followup.send(embed=embed, ephemeral=True)
                     logger.warning(f"⚠️ No image found for {image_filename}, sent text only to {interaction.user}")
                     
         except discord.HTTPException as e:
@@ -88,7 +234,7 @@ class PersonalVariantButton(discord.ui.Button):
                     inline=False
                 )
                 try:
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
+                    await self.send_reply(interaction, embed)
                 except Exception as e2:
                     logger.error(f"❌ Failed to send fallback message: {e2}")
             else:
@@ -99,7 +245,7 @@ class PersonalVariantButton(discord.ui.Button):
                         description=f"Sorry, there was an error loading the map. Please try again later.",
                         color=0xff0000
                     )
-                    await interaction.response.send_message(embed=error_embed, ephemeral=True)
+                    await self.send_reply(interaction, error_embed)
                 except Exception as e2:
                     logger.error(f"❌ Failed to send error message: {e2}")
                 
@@ -111,42 +257,178 @@ class PersonalVariantButton(discord.ui.Button):
                     description=f"Sorry, there was an error loading the map. Please try again later.",
                     color=0xff0000
                 )
-                await interaction.response.send_message(embed=error_embed, ephemeral=True)
+                await self.send_reply(interaction, error_embed)
             except Exception as e2:
                 logger.error(f"❌ Failed to send error message: {e2}")
     
+    @staticmethod
+    async def send_reply(interaction: discord.Interaction, embed: discord.Embed):
+        """Send a private reply, as a follow-up once the click has been deferred"""
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=embed, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    def zoom_view_kwargs(self, image_filename: str) -> Dict[str, Any]:
+        """Attach zoom/pan buttons when zoom tiles can be served"""
+        if not Settings.zoom_available():
+            return {}
+        return {'view': MapZoomView(self.map_key, self.map_info, self.suffix, image_filename)}
+    
+    async def remember_uploaded_image(self, message: discord.Message, image_filename: str, sent_filename: str,
+                                      upload_limit: Optional[int] = None):
+        """Record the CDN URL of an uploaded map image so later clicks under the same limit skip the upload"""
+        if not Settings.REUSE_UPLOADED_ASSETS:
+            return
+        
+        try:
+            url = None
+            for attachment in message.attachments:
+                if attachment.filename == sent_filename:
+                    url = attachment.url
+                    break
+            if not url and message.embeds and message.embeds[0].image:
+                url = message.embeds[0].image.url
+            
+            if url:
+                await Settings.remember_uploaded_asset_url(image_filename, url, upload_limit)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not record CDN URL for {image_filename}: {e}")
+    
     def create_map_embed(self, map_name: str, map_info: Dict[str, Any], user: discord.User) -> discord.Embed:
         """Create a formatted embed for map information"""
-        embed = discord.Embed(
-            title=map_info.get("title", f"{map_name} — Tactical Map Briefing"),
-            color=0x5865F2
+        return build_map_embed(map_name, map_info, self.suffix, user, self.view.content_version, self.view.guild_id)
+
+
+class MapLayerSelect(discord.ui.Select):
+    """Pick any combination of overlay layers to compose onto the NoGrid base"""
+    def __init__(self, map_key: str, map_info: Dict[str, Any], layers: Sequence[str]):
+        options = [
+            discord.SelectOption(label=LAYER_LABELS[layer], value=layer)
+            for layer in layers
+        ]
+        super().__init__(
+            placeholder="🧩 Combine overlay layers...",
+            min_values=1,
+            max_values=len(options),
+            options=options,
+            row=1
         )
+        self.map_key = map_key
+        self.map_info = map_info
+    
+    async def callback(self, interaction: discord.Interaction):
+        variant = " + ".join(LAYER_LABELS[layer] for layer in self.values)
+        logger.info(f"🧩 Composing {self.map_key} with {self.values} for {interaction.user}")
+        await send_composed_map(interaction, self.map_key, self.map_info, self.values, variant,
+                                self.view.content_version)
+
+
+class MapZoomButton(discord.ui.Button):
+    """Zoom or pan step within a MapZoomView"""
+    def __init__(self, label: str, action: tuple, row: int, disabled: bool = False):
+        super().__init__(label=label, style=discord.ButtonStyle.secondary, row=row, disabled=disabled)
+        self.action = action
+    
+    async def callback(self, interaction: discord.Interaction):
+        await self.view.navigate(interaction, self.action)
+
+
+class MapZoomView(discord.ui.View):
+    """Personal zoom/pan view over a map variant's prebuilt tile pyramid"""
+    def __init__(self, map_key: str, map_info: Dict[str, Any], suffix: str, image_filename: str):
+        super().__init__(timeout=300)
+        self.map_key = map_key
+        self.map_info = map_info
+        self.suffix = suffix
+        self.image_filename = image_filename
+        self.level = 0
+        self.x = 0
+        self.y = 0
+        self.update_buttons()
+    
+    def update_buttons(self):
+        """Rebuild buttons for the current position, disabling moves off the pyramid"""
+        self.clear_items()
+        n = tiles_per_side(self.level)
+        deepest = self.level >= ZOOM_LEVELS - 1
         
-        # Add fields with proper formatting
-        fields = [
-            ("🌍 Terrain", map_info.get("terrain", "No terrain info available")),
-            ("🎯 Key Points", map_info.get("points", "No key points info available")),
-            ("👥 Infantry Strategy", map_info.get("infantry", "No infantry strategy available")),
-            ("🚗 Armor Strategy", map_info.get("armor", "No armor strategy available"))
-        ]
+        quadrants = (("↖️ Zoom", 0, 0), ("↗️ Zoom", 1, 0), ("↙️ Zoom", 0, 1), ("↘️ Zoom", 1, 1))
+        for label, qx, qy in quadrants:
+            self.add_item(MapZoomButton(label, ('in', qx, qy), row=0, disabled=deepest))
+        self.add_item(MapZoomButton("🔎 Zoom Out", ('out',), row=0, disabled=self.level == 0))
         
-        for name, value in fields:
-            # Truncate if too long
-            if len(value) > 1024:
-                value = value[:1021] + "..."
-            embed.add_field(name=name, value=value, inline=False)
+        pans = (("⬅️", -1, 0), ("⬆️", 0, -1), ("⬇️", 0, 1), ("➡️", 1, 0))
+        for label, dx, dy in pans:
+            inside = 0 <= self.x + dx < n and 0 <= self.y + dy < n
+            self.add_item(MapZoomButton(label, ('pan', dx, dy), row=1, disabled=not inside))
+    
+    def apply(self, action: tuple):
+        """Move to the tile an action points at"""
+        kind = action[0]
+        if kind == 'in' and self.level < ZOOM_LEVELS - 1:
+            self.level += 1
+            self.x = self.x * 2 + action[1]
+            self.y = self.y * 2 + action[2]
+        elif kind == 'out' and self.level > 0:
+            self.level -= 1
+            self.x //= 2
+            self.y //= 2
+        elif kind == 'pan':
+            n = tiles_per_side(self.level)
+            self.x = min(max(self.x + action[1], 0), n - 1)
+            self.y = min(max(self.y + action[2], 0), n - 1)
+    
+    async def navigate(self, interaction: discord.Interaction, action: tuple):
+        self.apply(action)
+        self.update_buttons()
+        await interaction.response.defer()
+        
+        try:
+            # Prebuilt tiles are a cache hit; cold ones are cut off the event loop
+            data = await Settings.aget_map_zoom_tile(self.image_filename, self.level, self.x, self.y)
+        except Exception as e:
+            logger.error(f"❌ Error loading zoom tile {self.level}/{self.x}/{self.y} of {self.image_filename}: {e}")
+            data = None
+        
+        if data is None:
+            await interaction.followup.send("❌ Sorry, that part of the map could not be loaded.", ephemeral=True)
+            return
         
-        # Add footer with variant info
-        embed.set_footer(text=f"Map Variant: {self.suffix} | Personal View for {user.display_name}")
+        tile_filename = f"{os.path.splitext(self.image_filename)[0]}_z{self.level}_{self.x}_{self.y}.webp"
+        embed = discord.Embed(
+            title=self.map_info.get("title", get_map_display_name(self.map_key)),
+            color=0x5865F2
+        )
+        embed.set_image(url=f"attachment://{tile_filename}")
+        n = tiles_per_side(self.level)
+        position = "Overview" if self.level == 0 else f"Section {self.x + 1},{self.y + 1} of {n}x{n}"
+        embed.set_footer(
+            text=f"Map Variant: {self.suffix} | Zoom {self.level + 1}/{ZOOM_LEVELS} • {position} | "
+                 f"Personal View for {interaction.user.display_name}"
+        )
         
-        return embed
+        await interaction.edit_original_response(
+            embed=embed,
+            attachments=[discord.File(io.BytesIO(data), filename=tile_filename)],
+            view=self
+        )
+    
+    async def on_timeout(self):
+        """Handle view timeout"""
+        for item in self.children:
+            item.disabled = True
 
 
 class PersonalVariantView(discord.ui.View):
     """Personal view for map variants - sent as ephemeral response"""
-    def __init__(self, map_key: str, map_info: Dict[str, Any]):
+    def __init__(self, map_key: str, map_info: Dict[str, Any], guild_id: Optional[int] = None):
         super().__init__(timeout=300)  # Personal views can have timeout
         
+        # map_info is pinned for the view's lifetime; render it under the version it came from
+        self.guild_id = guild_id
+        self.content_version = data_manager.get_version('maps', guild_id)
+        
         # Define variants with their display names
         variants = {
             "🗺️ Grid": "Grid",
@@ -156,7 +438,7 @@ class PersonalVariantView(discord.ui.View):
         }
         
         # Check which variants actually exist for this map
-        available_variants = self.check_available_variants(map_key, variants)
+        available_variants = self.check_available_variants(map_key, map_info, variants)
         
         if not available_variants:
             # If no variants found, add all as fallback
@@ -164,22 +446,51 @@ class PersonalVariantView(discord.ui.View):
         
         for label, suffix in available_variants.items():
             self.add_item(PersonalVariantButton(label, suffix, map_key, map_info))
+        
+        # Arbitrary layer combinations when the map has a NoGrid base to compose on
+        layers = self.composable_layers(map_key, map_info)
+        if layers:
+            self.add_item(MapLayerSelect(map_key, map_info, layers))
+        
+        # Tanks and guides that mention this map
+        for button in RelatedButton.for_entry('maps', None, map_key, stateless=False, row=2):
+            self.add_item(button)
     
-    def check_available_variants(self, map_key: str, variants: Dict[str, str]) -> Dict[str, str]:
+    def check_available_variants(self, map_key: str, map_info: Dict[str, Any], variants: Dict[str, str]) -> Dict[str, str]:
         """Check which map variants actually exist in assets"""
         if Settings.USE_EXTERNAL_ASSETS:
             # Can't check external assets, return all
             return variants
         
         actual_map_name = MAP_NAME_FIXES.get(map_key, map_key.title())
-        available = {}
+        available_suffixes = list(Settings.get_map_variants(actual_map_name))
+        
+        # Variants without a shipped PNG can still be composed from the base
+        layers = self.composable_layers(map_key, map_info)
+        for suffix, needed in COMPOSED_VARIANTS.items():
+            if suffix not in available_suffixes and layers and set(needed) <= set(layers):
+                available_suffixes.append(suffix)
         
-        for label, suffix in variants.items():
-            filename = f"{actual_map_name}_{suffix}.png"
-            if Settings.get_asset_file(filename) is not None:
-                available[label] = suffix
+        return {
+            label: suffix
+            for label, suffix in variants.items()
+            if suffix in available_suffixes
+        }
+    
+    def composable_layers(self, map_key: str, map_info: Dict[str, Any]) -> Sequence[str]:
+        """Overlay layers that can be composed onto this map's NoGrid base"""
+        if not Settings.compositor_available():
+            return []
+        
+        actual_map_name = MAP_NAME_FIXES.get(map_key, map_key.title())
+        if 'NoGrid' not in Settings.get_map_variants(actual_map_name):
+            return []
         
-        return available
+        points = map_info.get('overlays')
+        return [
+            layer for layer in LAYER_LABELS
+            if Settings.has_overlay_layer(actual_map_name, layer, points)
+        ]
     
     async def on_timeout(self):
         """Handle view timeout"""
@@ -187,68 +498,141 @@ class PersonalVariantView(discord.ui.View):
             item.disabled = True
 
 
-class PersistentMapDropdown(discord.ui.Select):
-    """Static dropdown that sends personal responses only"""
-    def __init__(self):
-        # Load maps data each time to ensure freshness
-        maps_data = data_manager.load_data('maps')
+async def send_map_selection(interaction: discord.Interaction, selected: str, map_info: Dict[str, Any]):
+    """Send the personal variant picker for a map"""
+    try:
+        # Create personal variant view
+        view = PersonalVariantView(selected, map_info, interaction.guild_id)
         
-        if not maps_data:
-            options = [discord.SelectOption(
-                label="No maps available",
-                value="none",
-                description="No map data found"
-            )]
-        else:
-            # Create options with proper character limits
-            options = []
-            for map_key, map_info in maps_data.items():
-                # Get a short description from terrain info
-                description = map_info.get('terrain', '')
-                if len(description) > 94:
-                    truncate_at = 94
-                    for i in range(94, max(60, len(description) - 20), -1):
-                        if description[i] in [' ', '.', ',', ';']:
-                            truncate_at = i
-                            break
-                    description = description[:truncate_at].rstrip() + "..."
-                elif not description:
-                    description = "Tactical map information available"
-                
-                description = description[:100]
-                
-                # Clean up map name for display
-                display_name = self.get_display_name(map_key)
-                
-                options.append(discord.SelectOption(
-                    label=display_name,
-                    value=map_key,
-                    description=description,
-                    emoji="🗺️"
-                ))
+        # Create map selection embed - PERSONAL RESPONSE
+        map_embed = discord.Embed(
+            title=f"🗺️ {get_map_display_name(selected)}",
+            description="Choose a map variant below to view detailed tactical information.",
+            color=0x5865F2
+        )
+        
+        # Add map info preview
+        if map_info.get('terrain'):
+            map_embed.add_field(
+                name="🌍 Terrain Overview",
+                value=map_info['terrain'][:300] + ("..." if len(map_info['terrain']) > 300 else ""),
+                inline=False
+            )
+        
+        map_embed.add_field(
+            name="📋 Available Variants",
+            value="• **🗺️ Grid** - Map with coordinate grid overlay\n"
+                  "• **🌍 No Grid** - Clean map without grid\n" 
+                  "• **⚔️ SP No HQ** - Special variant without HQ markers\n"
+                  "• **🏠 Default Garries** - Map showing default garrison positions",
+            inline=False
+        )
+        
+        map_embed.set_footer(
+            text=f"Personal map view for {interaction.user.display_name} • Expires in 5 minutes"
+        )
+        
+        # Send EPHEMERAL response
+        await interaction.response.send_message(
+            embed=map_embed,
+            view=view,
+            ephemeral=True
+        )
+        
+    except Exception as e:
+        logger.error(f"❌ Error creating map selection for {selected}: {e}")
+        await interaction.response.send_message(
+            f"❌ Error loading map options for '{selected}'. Please try again.",
+            ephemeral=True
+        )
+
+
+async def open_map(interaction: discord.Interaction, map_key: str):
+    """Send a map's variant picker by key (search results, related buttons)"""
+    try:
+        map_info = (await data_manager.aload_data('maps', interaction.guild_id)).get(map_key)
+    except Exception as e:
+        logger.error(f"❌ Error loading maps data: {e}")
+        map_info = None
+    if not map_info:
+        await interaction.response.send_message(
+            f"❌ Map data for '{map_key}' not found.",
+            ephemeral=True
+        )
+        return
+    await send_map_selection(interaction, map_key, map_info)
+
+ENTRY_OPENERS['maps'] = open_map
+
+
+class PersistentMapDropdown(discord.ui.Select):
+    """Static dropdown that sends personal responses only
+    
+    It lists the first page of maps; StaticMapView links the rest through a
+    personal paginated BaseSelectorView.
+    """
+    def __init__(self, guild_id: Optional[int] = None):
+        # Pages are rebuilt only when maps.json (or the guild's overlay of it) changes
+        pages = BaseSelectorDropdown.get_pages('maps', guild_id=guild_id)
+        self.page_count = len(pages)
         
         super().__init__(
             placeholder="🎯 Select a map to view tactical information...", 
             min_values=1, 
             max_values=1, 
-            options=options,
+            options=list(pages[0]),
             custom_id="persistent_map_select"
         )
     
+    @staticmethod
+    def build_options(guild_id: Optional[int] = None) -> List[discord.SelectOption]:
+        """Build map options with descriptions trimmed at a word boundary"""
+        maps_data = data_manager.load_data('maps', guild_id)
+        
+        if not maps_data:
+            return [discord.SelectOption(
+                label="No maps available",
+                value="none",
+                description="No map data found"
+            )]
+        
+        # Create options with proper character limits
+        options = []
+        for map_key, map_info in maps_data.items():
+            # Get a short description from terrain info
+            description = map_info.get('terrain', '')
+            if len(description) > 94:
+                truncate_at = 94
+                for i in range(94, max(60, len(description) - 20), -1):
+                    if description[i] in [' ', '.', ',', ';']:
+                        truncate_at = i
+                        break
+                description = description[:truncate_at].rstrip() + "..."
+            elif not description:
+                description = "Tactical map information available"
+            
+            description = description[:100]
+            
+            options.append(discord.SelectOption(
+                label=get_map_display_name(map_key),
+                value=map_key,
+                description=description,
+                emoji="🗺️"
+            ))
+        
+        return options
+    
     def get_display_name(self, map_key: str) -> str:
         """Get proper display name for map"""
-        display_name = map_key.title().replace('_', ' ')
-        name_map = {
-            'sme': 'Sainte-Mère-Église',
-            'phl': 'Purple Heart Lane',
-            'smdmv2': 'Saint-Marie-du-Mont V2',
-            'elalamein': 'El Alamein'
-        }
-        return name_map.get(map_key.lower(), display_name)
+        return get_map_display_name(map_key)
 
     async def callback(self, interaction: discord.Interaction):
         # Get fresh data for each interaction
-        maps_data = data_manager.load_data('maps')
+        try:
+            maps_data = await data_manager.aload_data('maps', interaction.guild_id)
+        except Exception as e:
+            logger.error(f"❌ Error loading maps data: {e}")
+            maps_data = {}
         
         if self.values[0] == "none" or not maps_data:
             await interaction.response.send_message(
@@ -268,59 +652,27 @@ class PersistentMapDropdown(discord.ui.Select):
             return
         
         logger.info(f"🗺️ Map selected: {selected} by {interaction.user}")
+        await send_map_selection(interaction, selected, map_info)
 
-        try:
-            # Create personal variant view
-            view = PersonalVariantView(selected, map_info)
-            
-            # Create map selection embed - PERSONAL RESPONSE
-            map_embed = discord.Embed(
-                title=f"🗺️ {self.get_display_name(selected)}",
-                description="Choose a map variant below to view detailed tactical information.",
-                color=0x5865F2
-            )
-            
-            # Add map info preview
-            if map_info.get('terrain'):
-                map_embed.add_field(
-                    name="🌍 Terrain Overview",
-                    value=map_info['terrain'][:300] + ("..." if len(map_info['terrain']) > 300 else ""),
-                    inline=False
-                )
-            
-            map_embed.add_field(
-                name="📋 Available Variants",
-                value="• **🗺️ Grid** - Map with coordinate grid overlay\n"
-                      "• **🌍 No Grid** - Clean map without grid\n" 
-                      "• **⚔️ SP No HQ** - Special variant without HQ markers\n"
-                      "• **🏠 Default Garries** - Map showing default garrison positions",
-                inline=False
-            )
-            
-            map_embed.set_footer(
-                text=f"Personal map view for {interaction.user.display_name} • Expires in 5 minutes"
-            )
-            
-            # Send EPHEMERAL response
-            await interaction.response.send_message(
-                embed=map_embed,
-                view=view,
-                ephemeral=True
-            )
-            
-        except Exception as e:
-            logger.error(f"❌ Error creating map selection for {selected}: {e}")
-            await interaction.response.send_message(
-                f"❌ Error loading map options for '{selected}'. Please try again.",
-                ephemeral=True
-            )
+OPTION_BUILDERS['maps'] = PersistentMapDropdown.build_options
 
 
 class StaticMapView(discord.ui.View):
     """Static view that never changes - only sends personal responses"""
-    def __init__(self):
+    def __init__(self, guild_id: Optional[int] = None):
         super().__init__(timeout=None)  # Persistent
-        self.add_item(PersistentMapDropdown())
+        dropdown = PersistentMapDropdown(guild_id)
+        self.add_item(dropdown)
+        
+        if dropdown.page_count > 1:
+            # Paging this shared message would page it for everyone, so browse privately
+            browse_button = discord.ui.Button(
+                label="📚 All Maps",
+                style=discord.ButtonStyle.primary,
+                custom_id="maps_browse"
+            )
+            browse_button.callback = self.browse_all
+            self.add_item(browse_button)
         
         # Add info button
         info_button = discord.ui.Button(
@@ -331,6 +683,15 @@ class StaticMapView(discord.ui.View):
         info_button.callback = self.show_info
         self.add_item(info_button)
     
+    async def browse_all(self, interaction: discord.Interaction):
+        """Send a personal paginated selector of every map"""
+        await data_manager.aload_data('maps', interaction.guild_id)
+        await interaction.response.send_message(
+            "🎯 Select a map:",
+            view=BaseSelectorView('maps', guild_id=interaction.guild_id),
+            ephemeral=True
+        )
+    
     async def show_info(self, interaction: discord.Interaction):
         """Show usage information"""
         info_embed = discord.Embed(
@@ -368,10 +729,10 @@ class StaticMapView(discord.ui.View):
         await interaction.response.send_message(embed=info_embed, ephemeral=True)
 
 
-def create_static_maps_embed() -> discord.Embed:
+def create_static_maps_embed(guild_id: Optional[int] = None) -> discord.Embed:
     """Create the static main maps embed that never changes"""
     # Get current map count
-    maps_data = data_manager.load_data('maps')
+    maps_data = data_manager.load_data('maps', guild_id)
     map_count = len(maps_data) if maps_data else 0
     
     embed = discord.Embed(
@@ -440,12 +801,14 @@ class Maps(commands.Cog):
         name="maps", 
         description="View tactical maps (personal, temporary)"
     )
-    async def maps(self, interaction: discord.Interaction):
+    @app_commands.describe(name="Jump straight to a map (optional)")
+    @app_commands.autocomplete(name=map_name_autocomplete)
+    async def maps(self, interaction: discord.Interaction, name: Optional[str] = None):
         """Original maps command - creates ephemeral response"""
         logger.info(f"🗺️ Personal maps command used by {interaction.user}")
         
         try:
-            maps_data = data_manager.load_data('maps')
+            maps_data = await data_manager.aload_data('maps', interaction.guild_id)
             
             if not maps_data:
                 await interaction.response.send_message(
@@ -454,10 +817,21 @@ class Maps(commands.Cog):
                 )
                 return
             
-            # Create personal dropdown
-            view = discord.ui.View(timeout=300)
-            dropdown = PersistentMapDropdown()
-            view.add_item(dropdown)
+            if name:
+                # Autocomplete sends the key; typed text is resolved by name
+                entry = get_map_name_index(interaction.guild_id).resolve(name)
+                if not entry:
+                    await interaction.response.send_message(
+                        f"❌ Unknown map '{name}'.",
+                        ephemeral=True
+                    )
+                    return
+                map_key = entry[1]
+                await send_map_selection(interaction, map_key, maps_data[map_key])
+                return
+            
+            # Personal selector, paged past Discord's 25 options like the other categories
+            view = BaseSelectorView('maps', guild_id=interaction.guild_id)
             
             # Create welcome embed
             welcome_embed = discord.Embed(
@@ -470,7 +844,7 @@ class Maps(commands.Cog):
                 value=f"Choose any map: {', '.join(list(maps_data.keys())[:5])}{'...' if len(maps_data) > 5 else ''}",
                 inline=False
             )
-            welcome_embed.set_footer(text="Personal view • Expires in 5 minutes")
+            welcome_embed.set_footer(text="Personal view")
             
             await interaction.response.send_message(
                 embed=welcome_embed,
@@ -510,7 +884,7 @@ class Maps(commands.Cog):
         target_channel = channel or interaction.channel
         
         try:
-            maps_data = data_manager.load_data('maps')
+            maps_data = await data_manager.aload_data('maps', interaction.guild_id)
             
             if not maps_data:
                 await interaction.response.send_message(
@@ -520,8 +894,8 @@ class Maps(commands.Cog):
                 return
             
             # Create static view and embed
-            view = StaticMapView()
-            embed = create_static_maps_embed()
+            view = StaticMapView(interaction.guild_id)
+            embed = create_static_maps_embed(interaction.guild_id)
             
             # Send to target channel
             message = await target_channel.send(embed=embed, view=view)
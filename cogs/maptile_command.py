@@ -0,0 +1,104 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from data.data_manager import data_manager
+from config.settings import Settings
+from media.tiles import GridReferenceError
+from .maps_command import MAP_NAME_FIXES, get_map_display_name, get_map_name_index, map_name_autocomplete
+import io
+import logging
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+class MapTiles(commands.Cog):
+    """Grid-square close-ups cropped from the Grid map variant"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+    
+    @app_commands.command(
+        name="maptile",
+        description="Zoom in on a grid square of a map (e.g. E6 or E6-F7)"
+    )
+    @app_commands.describe(
+        map="Map to crop from",
+        grid="Grid square or range, e.g. E6 or E6-F7"
+    )
+    async def maptile(self, interaction: discord.Interaction, map: str, grid: str):
+        """Send a cropped, upscaled tile of a map's grid variant"""
+        logger.info(f"🧩 Map tile {map} {grid} requested by {interaction.user}")
+        
+        try:
+            maps_data = await data_manager.aload_data('maps', interaction.guild_id)
+        except Exception as e:
+            logger.error(f"❌ Error loading maps data: {e}")
+            maps_data = {}
+        
+        entry = get_map_name_index(interaction.guild_id).resolve(map) if maps_data else None
+        map_key = entry[1] if entry else map.lower()
+        map_info = maps_data.get(map_key)
+        if not map_info:
+            await interaction.response.send_message(
+                f"❌ Unknown map '{map}'.",
+                ephemeral=True
+            )
+            return
+        
+        if Settings.USE_EXTERNAL_ASSETS:
+            await interaction.response.send_message(
+                "❌ Map tiles need local map assets.",
+                ephemeral=True
+            )
+            return
+        
+        actual_map_name = MAP_NAME_FIXES.get(map_key, map_key.title())
+        image_filename = f"{actual_map_name}_Grid.png"
+        
+        # Rendering a cold tile decodes the full map, so keep it off the event loop
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        
+        try:
+            tile = await Settings.aget_map_tile(image_filename, grid)
+        except GridReferenceError as e:
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return
+        except Exception as e:
+            logger.error(f"❌ Error rendering tile {grid} of {image_filename}: {e}")
+            await interaction.followup.send(
+                "❌ Sorry, there was an error rendering that map tile. Please try again later.",
+                ephemeral=True
+            )
+            return
+        
+        if tile is None:
+            await interaction.followup.send(
+                f"❌ Grid map image `{image_filename}` is not available.",
+                ephemeral=True
+            )
+            return
+        
+        reference, data = tile
+        tile_filename = f"{actual_map_name}_{reference}.png"
+        display_name = get_map_display_name(map_key)
+        
+        embed = discord.Embed(
+            title=f"🧩 {display_name} — {reference}",
+            color=0x5865F2
+        )
+        embed.set_image(url=f"attachment://{tile_filename}")
+        embed.set_footer(text=f"Grid close-up for {interaction.user.display_name}")
+        
+        await interaction.followup.send(
+            embed=embed,
+            file=discord.File(io.BytesIO(data), filename=tile_filename),
+            ephemeral=True
+        )
+        logger.info(f"✅ Sent tile {reference} of {actual_map_name} ({len(data) / 1024:.0f} KB) to {interaction.user}")
+    
+    @maptile.autocomplete('map')
+    async def maptile_map_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        return await map_name_autocomplete(interaction, current)
+
+async def setup(bot):
+    await bot.add_cog(MapTiles(bot))
@@ -0,0 +1,116 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from data.data_manager import data_manager
+from data.search_index import SearchHit
+from .base_selector import CATEGORY_EMOJIS, open_entry
+from .maps_command import get_map_display_name
+import logging
+import time
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+def hit_title(hit: SearchHit) -> str:
+    """Display name of a search hit"""
+    if hit.category == 'maps':
+        return get_map_display_name(hit.key)
+    return hit.title
+
+def encode_hit(hit: SearchHit) -> str:
+    return f"{hit.category}|{hit.faction or ''}|{hit.key}"
+
+class SearchResultSelect(discord.ui.Select):
+    """Dropdown that opens a search result in its usual embed"""
+    
+    def __init__(self, hits: List[SearchHit]):
+        options = [
+            discord.SelectOption(
+                label=hit_title(hit)[:100],
+                value=encode_hit(hit),
+                description=hit.snippet[:100],
+                emoji=CATEGORY_EMOJIS.get(hit.category)
+            )
+            for hit in hits[:25]  # Discord limit
+        ]
+        super().__init__(
+            placeholder="Open a result...",
+            min_values=1,
+            max_values=1,
+            options=options
+        )
+    
+    async def callback(self, interaction: discord.Interaction):
+        category, faction, key = self.values[0].split('|', 2)
+        faction = faction or None
+        logger.info(f"🔎 Search result {category}/{key} opened by {interaction.user}")
+        await open_entry(interaction, category, faction, key)
+
+
+class SearchResultView(discord.ui.View):
+    def __init__(self, hits: List[SearchHit]):
+        super().__init__(timeout=300)
+        self.add_item(SearchResultSelect(hits))
+    
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+
+
+class Search(commands.Cog):
+    """Full-text search across maps, tanks and every other content type"""
+    
+    RESULT_LIMIT = 10
+    
+    def __init__(self, bot):
+        self.bot = bot
+    
+    @app_commands.command(
+        name="search",
+        description="Search all guides and maps (e.g. \"AT gun\" or \"smoke\")"
+    )
+    @app_commands.describe(query="Words to search for")
+    async def search(self, interaction: discord.Interaction, query: str):
+        """Rank every loaded item against the query and link to the matches"""
+        logger.info(f"🔎 Search '{query}' by {interaction.user}")
+        
+        try:
+            start = time.perf_counter()
+            hits = data_manager.search(query, self.RESULT_LIMIT)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"🔎 {len(hits)} result(s) for '{query}' in {elapsed_ms:.2f} ms")
+            
+            if not hits:
+                await interaction.response.send_message(
+                    f"❌ Nothing found for **{query}**. Try fewer or different words.",
+                    ephemeral=True
+                )
+                return
+            
+            embed = discord.Embed(
+                title=f"🔎 Results for \"{query[:200]}\"",
+                color=0x5865F2
+            )
+            for hit in hits:
+                embed.add_field(
+                    name=f"{CATEGORY_EMOJIS.get(hit.category, '📄')} {hit_title(hit)} · {hit.category.title()}",
+                    value=hit.snippet[:1024] or "\u200b",
+                    inline=False
+                )
+            embed.set_footer(text=f"{len(hits)} result(s) in {elapsed_ms:.1f} ms • Pick one below to open it")
+            
+            await interaction.response.send_message(
+                embed=embed,
+                view=SearchResultView(hits),
+                ephemeral=True
+            )
+        
+        except Exception as e:
+            logger.error(f"❌ Error searching for '{query}': {e}")
+            await interaction.response.send_message(
+                "❌ Sorry, there was an error running that search. Please try again later.",
+                ephemeral=True
+            )
+
+async def setup(bot):
+    await bot.add_cog(Search(bot))
@@ -1,8 +1,22 @@
+import asyncio
+import hashlib
+import io
+import json
 import os
 from dotenv import load_dotenv
 import logging
 from pathlib import Path
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
+from media.byte_cache import AssetByteCache
+from media.url_cache import AssetUrlCache
+from media.derivatives import DerivativeRenderer
+from media.tiles import TileRenderer
+from media.pyramid import PyramidRenderer
+from media.compositor import OverlayCompositor, normalize_layers
+from media.manifest import AssetManifest
+from media.attachments import PlannedAttachment, plan_attachments
+from media.collage import CollageRenderer
 
 load_dotenv()
 
@@ -20,14 +34,79 @@ class Settings:
     USE_EXTERNAL_ASSETS = os.getenv('USE_EXTERNAL_ASSETS', 'false').lower() == 'true'
     EXTERNAL_ASSET_BASE_URL = os.getenv('EXTERNAL_ASSET_BASE_URL', '')
     
+    # Load content from the compiled data snapshot at boot (python -m data.snapshot)
+    USE_CONTENT_SNAPSHOT = os.getenv('USE_CONTENT_SNAPSHOT', 'true').lower() == 'true'
+    
+    # Seconds between checks for edited data files (0 disables hot reload)
+    DATA_RELOAD_INTERVAL = float(os.getenv('DATA_RELOAD_INTERVAL', '30'))
+    
+    # Previous content revisions kept for /content-rollback
+    CONTENT_HISTORY_SIZE = int(os.getenv('CONTENT_HISTORY_SIZE', '5'))
+    
+    # Guilds whose content overlays (data/guilds/<guild_id>/) are kept in memory at once
+    GUILD_OVERLAY_CACHE_SIZE = int(os.getenv('GUILD_OVERLAY_CACHE_SIZE', '32'))
+    
     # Get the project root directory (where bot.py is located)
     PROJECT_ROOT = Path(__file__).parent.parent
     ASSETS_DIR = PROJECT_ROOT / 'assets'
     DATA_DIR = PROJECT_ROOT / 'data'
+    CACHE_DIR = Path(os.getenv('ASSET_CACHE_DIR', str(PROJECT_ROOT / '.cache')))
+    
+    # Content backend: 'json' reads data/*.json, 'sqlite' imports them into CONTENT_DB_PATH,
+    # 'stream' indexes the JSON files and decodes items on demand
+    CONTENT_BACKEND = os.getenv('CONTENT_BACKEND', 'json').lower()
+    CONTENT_DB_PATH = Path(os.getenv('CONTENT_DB_PATH', str(CACHE_DIR / 'content.db')))
+    
+    # Decoded factions/items kept in memory by the stream backend
+    CONTENT_ITEM_CACHE_SIZE = int(os.getenv('CONTENT_ITEM_CACHE_SIZE', '256'))
+    
+    # In-memory asset bytes cache (0 disables it)
+    ASSET_CACHE_MAX_MB = int(os.getenv('ASSET_CACHE_MAX_MB', '128'))
+    
+    # Reuse Discord CDN URLs of already uploaded local assets
+    REUSE_UPLOADED_ASSETS = os.getenv('REUSE_UPLOADED_ASSETS', 'true').lower() == 'true'
+    
+    # Upload limit used when the guild's own limit is unknown (non-boosted: 8 MB)
+    DEFAULT_UPLOAD_LIMIT = int(os.getenv('DEFAULT_UPLOAD_LIMIT_MB', '8')) * 1024 * 1024
+    DERIVATIVES_DIR = CACHE_DIR / 'derivatives'
+    PREBUILD_DERIVATIVES = os.getenv('PREBUILD_DERIVATIVES', 'false').lower() == 'true'
+    
+    # Grid-square map tiles (/maptile)
+    TILES_DIR = CACHE_DIR / 'tiles'
+    TILE_CACHE_MAX_MB = int(os.getenv('TILE_CACHE_MAX_MB', '32'))
+    
+    # Zoom pyramids for map variants (zoom/pan buttons)
+    PYRAMID_DIR = CACHE_DIR / 'pyramid'
+    PREBUILD_PYRAMIDS = os.getenv('PREBUILD_PYRAMIDS', 'false').lower() == 'true'
+    
+    # Map images composed from a NoGrid base plus overlay layers
+    COMPOSITES_DIR = CACHE_DIR / 'composites'
+    
+    # Combine an item's additional_images into a single collage attachment
+    COLLAGE_ADDITIONAL_IMAGES = os.getenv('COLLAGE_ADDITIONAL_IMAGES', 'true').lower() == 'true'
+    COLLAGES_DIR = CACHE_DIR / 'collages'
+    
+    # Worker threads for asset disk I/O and rendering (keeps the event loop free)
+    ASSET_IO_WORKERS = int(os.getenv('ASSET_IO_WORKERS', '4'))
+    
+    # Map image variants, as used in '<MapName>_<suffix>.png' filenames
+    MAP_VARIANT_SUFFIXES = ('Grid', 'NoGrid', 'SP_NoHQ', 'defaultgarries')
     
     # Asset cache to avoid repeated file system checks
     _asset_cache = {}
+    _map_variant_index = {}
     _cache_initialized = False
+    _asset_bytes = AssetByteCache(ASSET_CACHE_MAX_MB * 1024 * 1024)
+    _asset_hashes = {}
+    _asset_urls = AssetUrlCache(CACHE_DIR / 'asset_urls.json')
+    _derivatives = DerivativeRenderer(DERIVATIVES_DIR)
+    _tiles = TileRenderer(TILES_DIR, TILE_CACHE_MAX_MB * 1024 * 1024)
+    _pyramids = PyramidRenderer(PYRAMID_DIR, TILE_CACHE_MAX_MB * 1024 * 1024)
+    _compositor = OverlayCompositor(COMPOSITES_DIR)
+    _composite_index = {}
+    _collages = CollageRenderer(COLLAGES_DIR)
+    _asset_executor = None
+    _asset_manifest = AssetManifest(CACHE_DIR / 'asset_manifest.json')
     
     @classmethod
     def initialize_asset_cache(cls):
@@ -45,6 +124,9 @@ class Settings:
                 if file_path.is_file() and file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
                     cls._asset_cache[file_path.name] = file_path
             
+            # Sizes, dimensions and hashes, so later lookups never touch the disk
+            cls._asset_manifest.load_or_build(cls.ASSETS_DIR, cls._asset_cache.values())
+            cls._build_map_variant_index()
             logger.info(f"🎨 Cached {len(cls._asset_cache)} asset files")
             cls._cache_initialized = True
             
@@ -52,6 +134,32 @@ class Settings:
             logger.error(f"Error initializing asset cache: {e}")
             cls._cache_initialized = True
     
+    @classmethod
+    def _build_map_variant_index(cls):
+        """Index which variant suffixes exist for each map image name"""
+        index = {}
+        for filename in cls._asset_cache:
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() != '.png':
+                continue
+            for suffix in cls.MAP_VARIANT_SUFFIXES:
+                if stem.endswith(f"_{suffix}"):
+                    map_name = stem[:-len(suffix) - 1]
+                    index.setdefault(map_name, set()).add(suffix)
+                    break
+        
+        # Keep suffixes in the canonical variant order
+        cls._map_variant_index = {
+            map_name: [suffix for suffix in cls.MAP_VARIANT_SUFFIXES if suffix in suffixes]
+            for map_name, suffixes in index.items()
+        }
+    
+    @classmethod
+    def get_map_variants(cls, map_name: str) -> List[str]:
+        """Get the variant suffixes available locally for a map image name"""
+        cls.initialize_asset_cache()
+        return cls._map_variant_index.get(map_name, [])
+    
     @classmethod
     def get_asset_url(cls, filename: str) -> str:
         """Get asset URL - for external hosting or attachment format"""
@@ -61,8 +169,12 @@ class Settings:
             return f'attachment://{filename}'
     
     @classmethod
-    def get_asset_file(cls, filename: str) -> Optional['discord.File']:
-        """Get Discord file object for local assets"""
+    def get_asset_file(cls, filename: str, max_bytes: Optional[int] = None) -> Optional['discord.File']:
+        """Get Discord file object for local assets
+        
+        When max_bytes is given and the asset is larger, the best-fitting
+        derivative is sent instead (same stem, possibly a different extension).
+        """
         if cls.USE_EXTERNAL_ASSETS:
             return None
         
@@ -71,25 +183,14 @@ class Settings:
         
         # Check cache first
         if filename in cls._asset_cache:
-            asset_path = cls._asset_cache[filename]
-            try:
-                import discord
-                return discord.File(asset_path, filename=filename)
-            except Exception as e:
-                logger.error(f"❌ Error creating Discord file for {filename}: {e}")
-                return None
+            return cls._make_discord_file(filename, cls._asset_cache[filename], max_bytes)
         
         # If not in cache, try direct path lookup (fallback)
         asset_path = cls.ASSETS_DIR / filename
         if asset_path.exists() and asset_path.is_file():
-            try:
-                import discord
-                # Add to cache for future use
-                cls._asset_cache[filename] = asset_path
-                return discord.File(asset_path, filename=filename)
-            except Exception as e:
-                logger.error(f"❌ Error creating Discord file for {filename}: {e}")
-                return None
+            # Add to cache for future use
+            cls._asset_cache[filename] = asset_path
+            return cls._make_discord_file(filename, asset_path, max_bytes)
         
         # File not found
         if cls.DEBUG:
@@ -101,6 +202,421 @@ class Settings:
         
         return None
     
+    @classmethod
+    async def run_asset_io(cls, func, *args):
+        """Run blocking asset I/O in the bounded asset thread pool"""
+        if cls._asset_executor is None:
+            cls._asset_executor = ThreadPoolExecutor(
+                max_workers=cls.ASSET_IO_WORKERS,
+                thread_name_prefix='asset-io'
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._asset_executor, func, *args)
+    
+    @classmethod
+    async def aget_asset_file(cls, filename: str, max_bytes: Optional[int] = None) -> Optional['discord.File']:
+        """Async get_asset_file - stat/open/read happen off the event loop"""
+        if cls.USE_EXTERNAL_ASSETS:
+            return None
+        return await cls.run_asset_io(cls.get_asset_file, filename, max_bytes)
+    
+    @classmethod
+    async def aget_map_tile(cls, filename: str, reference: str) -> Optional[tuple]:
+        """Async get_map_tile"""
+        return await cls.run_asset_io(cls.get_map_tile, filename, reference)
+    
+    @classmethod
+    async def aget_map_zoom_tile(cls, filename: str, level: int, x: int, y: int) -> Optional[bytes]:
+        """Async get_map_zoom_tile"""
+        return await cls.run_asset_io(cls.get_map_zoom_tile, filename, level, x, y)
+    
+    @classmethod
+    async def aget_composite_map_file(cls, map_name: str, layers, points: Optional[dict] = None,
+                                      max_bytes: Optional[int] = None) -> Optional['discord.File']:
+        """Async get_composite_map_file"""
+        return await cls.run_asset_io(cls.get_composite_map_file, map_name, layers, points, max_bytes)
+    
+    @classmethod
+    def _make_discord_file(cls, filename: str, asset_path: Path, max_bytes: Optional[int] = None,
+                           content_hash: Optional[str] = None, cache_key: Optional[str] = None) -> Optional['discord.File']:
+        """Wrap cached asset bytes in a Discord file without reopening the asset"""
+        try:
+            import discord
+            info = None if cache_key else cls._asset_manifest.get(filename)
+            size = info['size'] if info else asset_path.stat().st_size
+            if max_bytes and size > max_bytes:
+                content_hash = content_hash or cls.get_asset_hash(filename)
+                derivative = None
+                if content_hash:
+                    derivative = cls._derivatives.get_derivative(asset_path, content_hash, max_bytes)
+                if derivative:
+                    label, derivative_path = derivative
+                    data = cls._asset_bytes.read(f"derivative:{derivative_path.name}", derivative_path)
+                    send_name = DerivativeRenderer.derivative_filename(filename, label)
+                    return discord.File(io.BytesIO(data), filename=send_name)
+            
+            data = cls._asset_bytes.read(cache_key or filename, asset_path)
+            return discord.File(io.BytesIO(data), filename=filename)
+        except Exception as e:
+            logger.error(f"❌ Error creating Discord file for {filename}: {e}")
+            return None
+    
+    @classmethod
+    def get_asset_path(cls, filename: str) -> Optional[Path]:
+        """Get the local path of a cached asset"""
+        cls.initialize_asset_cache()
+        return cls._asset_cache.get(filename)
+    
+    @classmethod
+    def get_map_tile(cls, filename: str, reference: str) -> Optional[tuple]:
+        """Get (canonical grid reference, PNG bytes) of a grid-square crop of a map image
+        
+        Raises GridReferenceError for malformed references.
+        """
+        asset_path = cls.get_asset_path(filename)
+        content_hash = cls.get_asset_hash(filename)
+        if asset_path is None or content_hash is None:
+            return None
+        return cls._tiles.get_tile(asset_path, content_hash, reference)
+    
+    @classmethod
+    def zoom_available(cls) -> bool:
+        """Whether map zoom tiles can be served (local assets and Pillow)"""
+        return not cls.USE_EXTERNAL_ASSETS and cls._pyramids.available
+    
+    @classmethod
+    def get_map_zoom_tile(cls, filename: str, level: int, x: int, y: int) -> Optional[bytes]:
+        """Get WebP bytes of one zoom pyramid tile of a map image"""
+        asset_path = cls.get_asset_path(filename)
+        content_hash = cls.get_asset_hash(filename)
+        if asset_path is None or content_hash is None:
+            return None
+        return cls._pyramids.get_tile(asset_path, content_hash, level, x, y)
+    
+    @classmethod
+    def build_map_pyramids(cls) -> int:
+        """Pre-build zoom pyramids for every map variant image"""
+        cls.initialize_asset_cache()
+        if not cls._pyramids.available:
+            logger.warning("⚠️ Pillow not installed, skipping zoom pyramid build")
+            return 0
+        
+        built = 0
+        for map_name, suffixes in cls._map_variant_index.items():
+            for suffix in suffixes:
+                filename = f"{map_name}_{suffix}.png"
+                content_hash = cls.get_asset_hash(filename)
+                if content_hash is None:
+                    continue
+                try:
+                    built += cls._pyramids.build(cls._asset_cache[filename], content_hash)
+                except Exception as e:
+                    logger.error(f"❌ Error building zoom pyramid for {filename}: {e}")
+        
+        logger.info(f"🔍 Zoom pyramids ready ({built} tiles rendered)")
+        return built
+    
+    @classmethod
+    def compositor_available(cls) -> bool:
+        """Whether map overlays can be composed at runtime (local assets and Pillow)"""
+        return not cls.USE_EXTERNAL_ASSETS and cls._compositor.available
+    
+    @classmethod
+    def has_overlay_layer(cls, map_name: str, layer: str, points: Optional[dict] = None) -> bool:
+        """Whether a layer can be drawn for a map (the grid always can)"""
+        if layer == 'grid':
+            return True
+        if points and points.get(layer):
+            return True
+        return cls.get_asset_path(f"{map_name}_overlay_{layer}.png") is not None
+    
+    @classmethod
+    def get_composite_map_file(cls, map_name: str, layers, points: Optional[dict] = None,
+                               max_bytes: Optional[int] = None) -> Optional['discord.File']:
+        """Get a Discord file of '<map_name>_NoGrid.png' composed with overlay layers
+        
+        Overlays come from '<map_name>_overlay_<layer>.png' assets when present,
+        otherwise from vector points (e.g. maps.json 'overlays'). Results are
+        cached by (map, layer set) in memory and on disk.
+        """
+        layers = normalize_layers(layers)
+        points = points or {}
+        index_key = (map_name, layers, json.dumps(points, sort_keys=True))
+        
+        cached = cls._composite_index.get(index_key)
+        if cached is None or not cached[0].exists():
+            base_filename = f"{map_name}_NoGrid.png"
+            base_path = cls.get_asset_path(base_filename)
+            base_hash = cls.get_asset_hash(base_filename)
+            if base_path is None or base_hash is None:
+                return None
+            
+            overlay_paths = {}
+            overlay_hashes = {}
+            for layer in layers:
+                overlay_filename = f"{map_name}_overlay_{layer}.png"
+                overlay_path = cls.get_asset_path(overlay_filename)
+                if overlay_path is not None:
+                    overlay_paths[layer] = overlay_path
+                    overlay_hashes[layer] = cls.get_asset_hash(overlay_filename)
+            
+            cached = cls._compositor.render(base_path, base_hash, layers, overlay_paths, overlay_hashes, points)
+            cls._composite_index[index_key] = cached
+        
+        composite_path, key = cached
+        send_name = f"{map_name}_{'_'.join(layers) or 'base'}.png"
+        return cls._make_discord_file(send_name, composite_path, max_bytes,
+                                      content_hash=key, cache_key=f"composite:{key[:16]}")
+    
+    @classmethod
+    def get_upload_limit(cls, guild=None) -> int:
+        """Get the attachment size limit for a guild (default outside guilds)"""
+        if guild is not None and getattr(guild, 'filesize_limit', None):
+            return guild.filesize_limit
+        return cls.DEFAULT_UPLOAD_LIMIT
+    
+    @classmethod
+    def get_attachment_plan_entry(cls, filename: str, max_bytes: int) -> Optional[PlannedAttachment]:
+        """Describe how an asset would be attached under max_bytes (original or derivative)"""
+        size = cls.get_asset_size(filename)
+        if size is None:
+            return None
+        if size <= max_bytes:
+            return PlannedAttachment(source=filename, filename=filename, size=size)
+        
+        derivative = cls.get_asset_derivative(filename, max_bytes)
+        if derivative is None:
+            # Too large and nothing smaller - the planner will drop it
+            return PlannedAttachment(source=filename, filename=filename, size=size)
+        
+        label, derivative_path = derivative
+        return PlannedAttachment(
+            source=filename,
+            filename=DerivativeRenderer.derivative_filename(filename, label),
+            size=derivative_path.stat().st_size
+        )
+    
+    @classmethod
+    def get_collage_entry(cls, filenames: List[str], name: str) -> Optional[PlannedAttachment]:
+        """Describe a single collage attachment combining several image assets"""
+        if not cls.COLLAGE_ADDITIONAL_IMAGES or not cls._collages.available:
+            return None
+        
+        paths = []
+        hashes = []
+        for filename in filenames:
+            asset_path = cls.get_asset_path(filename)
+            content_hash = cls.get_asset_hash(filename)
+            if asset_path is None or content_hash is None:
+                # Missing images fall back to the individual-attachment path
+                return None
+            paths.append(asset_path)
+            hashes.append(content_hash)
+        
+        if len(paths) < 2:
+            return None
+        
+        try:
+            collage_path = cls._collages.render(paths, hashes)
+        except Exception as e:
+            logger.error(f"❌ Error rendering collage for {name}: {e}")
+            return None
+        if collage_path is None:
+            return None
+        
+        return PlannedAttachment(
+            source=f"collage:{collage_path.stem}",
+            filename=f"{name}_gallery.webp",
+            size=collage_path.stat().st_size,
+            path=collage_path
+        )
+    
+    @classmethod
+    def plan_asset_attachments(cls, filenames: List[str], budget: int, gallery: Optional[List[str]] = None,
+                               gallery_name: str = 'item') -> Tuple[List[List[PlannedAttachment]], List[str]]:
+        """Plan which assets go in which message under a per-message upload budget
+        
+        filenames are in priority order (embed thumbnail first); gallery
+        images follow them and are combined into one collage when possible.
+        Returns (batches, missing) where missing lists assets that can't be sent.
+        """
+        gallery = gallery or []
+        collage = cls.get_collage_entry(gallery, gallery_name) if len(gallery) > 1 else None
+        if collage is not None and collage.size <= budget:
+            names = list(filenames)
+        else:
+            collage = None
+            names = list(filenames) + list(gallery)
+        
+        entries = []
+        missing = []
+        for filename in names:
+            entry = cls.get_attachment_plan_entry(filename, budget)
+            if entry is None:
+                missing.append(filename)
+            else:
+                entries.append(entry)
+        if collage is not None:
+            entries.append(collage)
+        
+        batches, dropped = plan_attachments(entries, budget)
+        missing.extend(entry.source for entry in dropped)
+        return batches, missing
+    
+    @classmethod
+    async def aplan_asset_attachments(cls, filenames: List[str], budget: int, gallery: Optional[List[str]] = None,
+                                      gallery_name: str = 'item') -> Tuple[List[List[PlannedAttachment]], List[str]]:
+        """Async plan_asset_attachments (derivatives and collages may need rendering)"""
+        return await cls.run_asset_io(cls.plan_asset_attachments, filenames, budget, gallery, gallery_name)
+    
+    @classmethod
+    def get_planned_file(cls, planned: PlannedAttachment, max_bytes: int) -> Optional['discord.File']:
+        """Materialise a planned attachment as a Discord file"""
+        if planned.path is not None:
+            return cls._make_discord_file(planned.filename, planned.path, cache_key=planned.source)
+        return cls.get_asset_file(planned.source, max_bytes=max_bytes)
+    
+    @classmethod
+    async def aget_planned_file(cls, planned: PlannedAttachment, max_bytes: int) -> Optional['discord.File']:
+        """Async get_planned_file"""
+        return await cls.run_asset_io(cls.get_planned_file, planned, max_bytes)
+    
+    @classmethod
+    def get_asset_derivative(cls, filename: str, max_bytes: int) -> Optional[tuple]:
+        """Get (label, path) of the best derivative of an asset under max_bytes"""
+        cls.initialize_asset_cache()
+        asset_path = cls._asset_cache.get(filename)
+        content_hash = cls.get_asset_hash(filename)
+        if asset_path is None or content_hash is None:
+            return None
+        return cls._derivatives.get_derivative(asset_path, content_hash, max_bytes)
+    
+    @classmethod
+    def build_asset_derivatives(cls, max_bytes: Optional[int] = None) -> int:
+        """Pre-render derivatives for every asset over the upload limit"""
+        cls.initialize_asset_cache()
+        max_bytes = max_bytes or cls.DEFAULT_UPLOAD_LIMIT
+        
+        assets = []
+        for filename, asset_path in cls._asset_cache.items():
+            size = cls.get_asset_size(filename)
+            if size is None or size <= max_bytes:
+                continue
+            content_hash = cls.get_asset_hash(filename)
+            if content_hash:
+                assets.append((asset_path, content_hash))
+        
+        return cls._derivatives.build_all(assets, max_bytes)
+    
+    @classmethod
+    def get_asset_cache_stats(cls) -> dict:
+        """Get hit/miss/eviction statistics for the in-memory asset cache"""
+        return cls._asset_bytes.stats()
+    
+    @classmethod
+    def get_asset_info(cls, filename: str) -> Optional[dict]:
+        """Get the manifest entry (size, mtime_ns, width, height, sha256) of an asset"""
+        cls.initialize_asset_cache()
+        return cls._asset_manifest.get(filename)
+    
+    @classmethod
+    def get_asset_size(cls, filename: str) -> Optional[int]:
+        """Get an asset's size in bytes from the manifest"""
+        info = cls.get_asset_info(filename)
+        if info:
+            return info['size']
+        asset_path = cls._asset_cache.get(filename)
+        try:
+            return asset_path.stat().st_size if asset_path else None
+        except OSError:
+            return None
+    
+    @classmethod
+    def get_asset_hash(cls, filename: str) -> Optional[str]:
+        """Get the SHA-256 of a local asset's content (from the manifest when listed)"""
+        if filename in cls._asset_hashes:
+            return cls._asset_hashes[filename]
+        
+        info = cls.get_asset_info(filename)
+        if info:
+            cls._asset_hashes[filename] = info['sha256']
+            return info['sha256']
+        
+        asset_path = cls._asset_cache.get(filename)
+        if asset_path is None:
+            return None
+        
+        try:
+            data = cls._asset_bytes.read(filename, asset_path)
+        except Exception as e:
+            logger.error(f"❌ Error hashing asset {filename}: {e}")
+            return None
+        
+        content_hash = hashlib.sha256(data).hexdigest()
+        cls._asset_hashes[filename] = content_hash
+        return content_hash
+    
+    @classmethod
+    def _uploaded_url_key(cls, filename: str, max_bytes: Optional[int] = None) -> Optional[str]:
+        # Runs in the asset pool, so the first lookup also reads the URL cache file there
+        cls._asset_urls.load()
+        content_hash = cls.get_asset_hash(filename)
+        if content_hash is None:
+            return None
+        return AssetUrlCache.make_key(filename, content_hash, max_bytes)
+    
+    @classmethod
+    async def _save_uploaded_asset_urls(cls):
+        entries = cls._asset_urls.pending_changes()
+        if entries is not None:
+            await cls.run_asset_io(cls._asset_urls.write, entries)
+    
+    @classmethod
+    async def resolve_uploaded_asset_url(cls, filename: str, max_bytes: Optional[int] = None) -> Optional[str]:
+        """Get the CDN URL of a local asset previously uploaded under this upload limit
+        
+        The URL isn't checked here; call verify_uploaded_asset_url after sending it.
+        """
+        if cls.USE_EXTERNAL_ASSETS or not cls.REUSE_UPLOADED_ASSETS:
+            return None
+        
+        # Hashing may read the asset from disk on first use
+        key = await cls.run_asset_io(cls._uploaded_url_key, filename, max_bytes)
+        if key is None:
+            return None
+        return cls._asset_urls.get(key)
+    
+    @classmethod
+    async def verify_uploaded_asset_url(cls, filename: str, max_bytes: Optional[int] = None) -> bool:
+        """Check a sent CDN URL still resolves; a dead one is forgotten so the asset is uploaded again"""
+        key = await cls.run_asset_io(cls._uploaded_url_key, filename, max_bytes)
+        if key is None:
+            return False
+        if await cls._asset_urls.verify(key):
+            return True
+        await cls.forget_uploaded_asset_url(filename, max_bytes)
+        return False
+    
+    @classmethod
+    async def remember_uploaded_asset_url(cls, filename: str, url: str, max_bytes: Optional[int] = None):
+        """Record the CDN URL Discord assigned to a local asset sent under this upload limit"""
+        if not cls.REUSE_UPLOADED_ASSETS or not url:
+            return
+        
+        key = await cls.run_asset_io(cls._uploaded_url_key, filename, max_bytes)
+        if key is not None:
+            cls._asset_urls.put(key, url)
+            await cls._save_uploaded_asset_urls()
+            logger.info(f"🔗 Cached CDN URL for {filename}")
+    
+    @classmethod
+    async def forget_uploaded_asset_url(cls, filename: str, max_bytes: Optional[int] = None):
+        """Drop a cached CDN URL so the asset is uploaded again next time"""
+        key = await cls.run_asset_io(cls._uploaded_url_key, filename, max_bytes)
+        if key is not None:
+            cls._asset_urls.discard(key)
+            await cls._save_uploaded_asset_urls()
+    
     @classmethod
     def find_similar_assets(cls, filename: str) -> List[str]:
         """Find assets with similar names (for debugging)"""
@@ -133,14 +649,12 @@ class Settings:
             'total_size': 0
         }
         
-        for file_path in cls._asset_cache.values():
-            try:
-                ext = file_path.suffix.lower()
-                stats['by_extension'][ext] = stats['by_extension'].get(ext, 0) + 1
-                stats['total_size'] += file_path.stat().st_size
-            except Exception:
-                pass
+        for filename, file_path in cls._asset_cache.items():
+            ext = file_path.suffix.lower()
+            stats['by_extension'][ext] = stats['by_extension'].get(ext, 0) + 1
+            stats['total_size'] += cls.get_asset_size(filename) or 0
         
+        stats['memory_cache'] = cls.get_asset_cache_stats()
         return stats
     
     @classmethod
@@ -220,7 +734,11 @@ class Settings:
             asset_path = cls._asset_cache[filename]
             logger.info(f"🔍 Cached path: {asset_path}")
             logger.info(f"🔍 File exists: {asset_path.exists()}")
-            logger.info(f"🔍 File size: {asset_path.stat().st_size} bytes")
+            info = cls._asset_manifest.get(filename)
+            if info:
+                logger.info(f"🔍 Manifest: {info['size']} bytes, {info['width']}x{info['height']}, sha256 {info['sha256'][:12]}")
+            else:
+                logger.info(f"🔍 File size: {asset_path.stat().st_size} bytes")
             logger.info(f"🔍 File readable: {os.access(asset_path, os.R_OK)}")
         else:
             direct_path = cls.ASSETS_DIR / filename
@@ -239,6 +757,12 @@ class Settings:
         """Refresh the asset cache (useful for development)"""
         cls._cache_initialized = False
         cls._asset_cache.clear()
+        cls._map_variant_index = {}
+        cls._composite_index.clear()
+        cls._asset_manifest.clear()
+        cls._asset_bytes.clear()
+        cls._asset_hashes.clear()
+        cls._derivatives.clear()
         cls.initialize_asset_cache()
         logger.info("🔄 Asset cache refreshed")
     
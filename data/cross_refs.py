@@ -0,0 +1,123 @@
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .name_index import normalize
+from .search_index import DocId, item_segments, iter_items, stem
+
+# Names shorter than this ('us', 'at') are too ambiguous to detect in text
+MIN_NAME_LENGTH = 3
+# An explicit tag outweighs any number of passing mentions
+TAG_WEIGHT = 100
+# Links kept per entry, strongest first
+MAX_RELATED = 25
+
+# "Foy – Tactical Map Briefing" -> "Foy"
+TITLE_SUFFIX = re.compile(r"\s[–—-]\s.*$")
+
+
+def words(text: str) -> Tuple[str, ...]:
+    """Normalized, stemmed words, so 'Shermans' mentions 'Sherman'"""
+    return tuple(stem(word) for word in normalize(text).split())
+
+
+def entry_names(key: str, item: Dict[str, Any]) -> Set[str]:
+    """Normalized names an entry is mentioned by: key, display name and aliases"""
+    display = item.get('display_name') or TITLE_SUFFIX.sub('', str(item.get('title', '')))
+    names = {normalize(key.replace('_', ' ')), normalize(display)}
+    names.update(normalize(alias) for alias in item.get('aliases', []))
+    return {name for name in names if len(name) >= MIN_NAME_LENGTH}
+
+
+class CrossReferenceIndex:
+    """Precomputed links between entries of different categories
+    
+    Entries link through explicit tags (a "related" list of "category/key",
+    "category/faction/key" or plain names) and through mentions of another
+    entry's name in their text. Links are symmetric and weighted by how often
+    they occur; related() is a dict lookup. Mentions only link across
+    categories, tags may also link within one.
+    """
+    
+    def __init__(self):
+        self._versions: Optional[Dict[str, int]] = None
+        self._names: Dict[DocId, str] = {}
+        self._related: Dict[DocId, Tuple[DocId, ...]] = {}
+    
+    def is_current(self, versions: Dict[str, int]) -> bool:
+        """Whether the index was built from exactly these category versions"""
+        return versions == self._versions
+
+    def sync(self, contents: Dict[str, Tuple[int, Dict[str, Any]]]) -> bool:
+        """Rebuild from {category: (version, data)} if any version changed"""
+        versions = {category: version for category, (version, _) in contents.items()}
+        if versions == self._versions:
+            return False
+        self.build({category: data for category, (_, data) in contents.items()})
+        self._versions = versions
+        return True
+    
+    def build(self, contents: Dict[str, Dict[str, Any]]):
+        entries = []
+        names = {}
+        by_id = {}
+        # first word -> [(name words, entries)], longest names first
+        phrases: Dict[str, List[Tuple[Tuple[str, ...], List[DocId]]]] = defaultdict(list)
+        phrase_entries: Dict[Tuple[str, ...], List[DocId]] = defaultdict(list)
+        
+        for category, data in contents.items():
+            for faction, key, item in iter_items(data):
+                doc = (category, faction, key)
+                entries.append((doc, item))
+                names[doc] = item.get('display_name') or TITLE_SUFFIX.sub('', str(item.get('title', ''))) or key.title()
+                by_id['/'.join(part for part in doc if part)] = doc
+                for name in entry_names(key, item):
+                    phrase_entries[words(name)].append(doc)
+        for phrase, docs in phrase_entries.items():
+            phrases[phrase[0]].append((phrase, docs))
+        for candidates in phrases.values():
+            candidates.sort(key=lambda candidate: -len(candidate[0]))
+        
+        weights: Dict[DocId, Dict[DocId, int]] = defaultdict(lambda: defaultdict(int))
+        
+        def link(source: DocId, target: DocId, weight: int):
+            if source != target:
+                weights[source][target] += weight
+                weights[target][source] += weight
+        
+        for doc, item in entries:
+            for tag in item.get('related', []):
+                tag = str(tag)
+                targets = [by_id[tag]] if tag in by_id else phrase_entries.get(words(tag), [])
+                for target in targets:
+                    link(doc, target, TAG_WEIGHT)
+            
+            text = words(' '.join(text for _, text in item_segments(item)))
+            position = 0
+            while position < len(text):
+                matched = 1
+                for phrase, targets in phrases.get(text[position], ()):
+                    if text[position:position + len(phrase)] == phrase:
+                        for target in targets:
+                            if target[0] != doc[0]:
+                                link(doc, target, 1)
+                        matched = len(phrase)
+                        break
+                position += matched
+        
+        self._names = names
+        self._related = {
+            doc: tuple(sorted(targets, key=lambda target: (-targets[target], target[0], names[target]))[:MAX_RELATED])
+            for doc, targets in weights.items()
+        }
+    
+    def related(self, doc: DocId, limit: int = 5) -> List[Tuple[DocId, str]]:
+        """(entry, display name) pairs linked to an entry, strongest first"""
+        return [(target, self._names[target]) for target in self._related.get(doc, ())[:limit]]
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._names),
+            'linked_entries': len(self._related),
+            'links': sum(len(targets) for targets in self._related.values()),
+        }
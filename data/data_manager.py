@@ -1,33 +1,204 @@
+import asyncio
+import glob
+from collections import OrderedDict, deque
 import json
 import os
-from typing import Dict, Any, List
+import time
+from typing import Deque, Dict, Any, Callable, List, Mapping, Optional, Tuple, Union
 import logging
+from .snapshot import build_snapshot, load_snapshot
+from .render_cache import RenderCache
+from .search_index import SearchIndex, SearchHit, is_item
+from .name_index import NameIndex
+from .store import ContentStore
+from .records import ItemRecord
+from .revisions import ContentRevision
+from .overlays import GuildOverlays
+from .cross_refs import CrossReferenceIndex
 
 logger = logging.getLogger(__name__)
 
 class DataManager:
     """Centralized data management for all game content"""
     
-    def __init__(self):
+    # Whole categories read from a content store that are kept decoded at once
+    STORE_CATEGORY_CACHE_SIZE = 2
+    
+    def __init__(self, history_size: int = 5):
         self.data_dir = os.path.join(os.path.dirname(__file__))
-        self._cache = {}
+        # Current content; replaced (never modified) whenever anything changes
+        self._revision = ContentRevision.create(0, {}, {})
+        self._revision_counter = 0
+        # Previous revisions kept for rollback
+        self._history: Deque[ContentRevision] = deque(maxlen=history_size)
+        # Content versions are never reused, so nothing rendered can be mistaken for newer content
+        self._version_counter = 0
+        # (mtime_ns, size) of each cached file, to detect edits
+        self._file_stats: Dict[str, Tuple[int, int]] = {}
+        self._reload_task: Optional[asyncio.Task] = None
+        # Parses in progress, shared by every aload_data caller of a category
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Optional backend replacing data/*.json (see use_store)
+        self.store: Optional[ContentStore] = None
+        # Whole categories read from the store: {category: (version, data)}, least recently used first
+        self._store_categories: 'OrderedDict[str, Tuple[int, Dict[str, Any]]]' = OrderedDict()
+        # Embeds, option lists etc. rendered from the current content
+        self.render_cache = RenderCache()
+        # Full-text index, caught up lazily with changed categories on search
+        self.search_index = SearchIndex()
+        # Links between maps, tanks etc., rebuilt whenever content changes
+        self.cross_refs = CrossReferenceIndex()
+        # Cross-reference rebuild running in the executor, if any
+        self._cross_refs_task: Optional[asyncio.Future] = None
+        # Per-guild content layered over the shared categories
+        self.overlays = GuildOverlays(os.path.join(self.data_dir, 'guilds'))
         logger.info(f"📂 Data directory: {self.data_dir}")
     
-    def load_data(self, category: str) -> Dict[str, Any]:
-        """Load data from JSON files with caching"""
+    def _file_path(self, category: str) -> str:
+        return os.path.join(self.data_dir, f"{category}.json")
+    
+    def _stat(self, file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(file_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def _read_file(self, category: str, file_path: str) -> Dict[str, Any]:
+        """Parse and validate a data file (raises on bad content)"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self._validate(category, data)
+        return data
+    
+    def _validate(self, category: str, data: Any):
+        """Reject content that would break the selectors"""
+        if not isinstance(data, dict):
+            raise ValueError(f"{category}.json root should be a dictionary")
+    
+    @property
+    def _cache(self) -> Mapping[str, Dict[str, Any]]:
+        return self._revision.data
+    
+    @property
+    def _versions(self) -> Mapping[str, int]:
+        return self._revision.versions
+    
+    @property
+    def revision(self) -> ContentRevision:
+        """The current content revision (immutable - hold on to it to pin content)"""
+        return self._revision
+    
+    def _next_version(self) -> int:
+        self._version_counter += 1
+        return self._version_counter
+    
+    def _publish(self, data: Mapping[str, Dict[str, Any]], versions: Mapping[str, int], record: bool = True):
+        """Make a new revision current
+        
+        Single reference swap - readers see either the old or the new content,
+        without locks. record=False for cache fills that don't change content.
+        """
+        previous = self._revision
+        self._revision_counter += 1
+        self._revision = ContentRevision.create(self._revision_counter, data, versions)
+        if record and previous.data:
+            self._history.append(previous)
+        for category in set(previous.versions) | set(versions):
+            if previous.versions.get(category) != versions.get(category):
+                self.render_cache.invalidate(category)
+    
+    def _store(self, category: str, data: Dict[str, Any], stat: Optional[Tuple[int, int]]):
+        self._file_stats[category] = stat
+        self._publish(
+            {**self._cache, category: data},
+            {**self._versions, category: self._next_version()}
+        )
+    
+    def _cached_store_category(self, category: str) -> Optional[Dict[str, Any]]:
+        entry = self._store_categories.get(category)
+        if entry is None or entry[0] != self._versions.get(category):
+            return None
+        self._store_categories.move_to_end(category)
+        return entry[1]
+    
+    def _cache_store_category(self, category: str, data: Dict[str, Any]):
+        # Bounded rather than kept in the revision, so store-backed memory stays flat
+        self._store_categories[category] = (self._versions.get(category, 0), data)
+        self._store_categories.move_to_end(category)
+        while len(self._store_categories) > self.STORE_CATEGORY_CACHE_SIZE:
+            self._store_categories.popitem(last=False)
+    
+    def set_history_size(self, history_size: int):
+        """Number of previous revisions kept for rollback"""
+        self._history = deque(self._history, maxlen=history_size)
+    
+    def history(self) -> List[ContentRevision]:
+        """Previous revisions, oldest first"""
+        return list(self._history)
+    
+    def rollback(self, number: Optional[int] = None) -> ContentRevision:
+        """Make a previous revision current again (the latest one by default)
+        
+        The data files aren't touched: the restored content stays live until a
+        file is edited again. Rolling back keeps the replaced revision, so a
+        rollback can itself be rolled back.
+        """
+        if self.store:
+            raise ValueError("Rollback is only available with the JSON content backend")
+        if not self._history:
+            raise ValueError("No previous content revision to roll back to")
+        
+        if number is None:
+            target = self._history[-1]
+        else:
+            target = next((revision for revision in self._history if revision.number == number), None)
+            if target is None:
+                raise ValueError(f"Revision {number} is no longer kept")
+        
+        self._publish(target.data, target.versions)
+        logger.warning(f"⏪ Rolled content back to revision {target.number} (now revision {self._revision.number})")
+        return self._revision
+    
+    def use_store(self, store: ContentStore):
+        """Read content from a storage backend instead of the JSON files"""
+        self.store = store
+        self._file_stats.clear()
+        self._store_categories.clear()
+        self._history.clear()
+        self._publish({}, store.versions(), record=False)
+        logger.info(f"🗄️ Using {store.name} content store ({len(self._versions)} categories)")
+    
+    def load_data(self, category: str, guild_id: Optional[int] = None) -> Dict[str, Any]:
+        """Load data from JSON files with caching, with the guild's overlay applied if it has one"""
+        data = self._load_base(category)
+        if self.overlays.has_overlay(guild_id, category):
+            return self.overlays.get_merged(guild_id, category, data, self.get_version(category))
+        return data
+    
+    def _load_base(self, category: str) -> Dict[str, Any]:
         if category in self._cache:
             return self._cache[category]
         
-        file_path = os.path.join(self.data_dir, f"{category}.json")
+        if self.store:
+            # Whole-category reads are cached until the store's version changes
+            data = self._cached_store_category(category)
+            if data is None:
+                data = self.store.load_category(category)
+                if data:
+                    self._cache_store_category(category, data)
+            return data
+        
+        file_path = self._file_path(category)
         if not os.path.exists(file_path):
             logger.warning(f"📄 Data file not found: {file_path}")
             return {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            stat = self._stat(file_path)
+            data = self._read_file(category, file_path)
             
-            self._cache[category] = data
+            self._store(category, data, stat)
             logger.info(f"✅ Loaded {category}.json")
             return data
         
@@ -35,21 +206,381 @@ class DataManager:
             logger.error(f"❌ Error loading {file_path}: {e}")
             return {}
     
-    def get_factions(self, category: str) -> List[str]:
+    async def aload_data(self, category: str, guild_id: Optional[int] = None) -> Dict[str, Any]:
+        """Load a category off the event loop, sharing one parse between concurrent callers
+        
+        Unlike load_data, parse and validation errors are raised (to every waiter).
+        """
+        if category in self._cache:
+            data = self._cache[category]
+        elif self.store and self._cached_store_category(category) is not None:
+            data = self._cached_store_category(category)
+        else:
+            future = self._inflight.get(category)
+            if future is None:
+                future = asyncio.ensure_future(self._load_in_executor(category))
+                self._inflight[category] = future
+                future.add_done_callback(lambda _: self._inflight.pop(category, None))
+            # Shielded so one cancelled caller doesn't cancel the load for the others
+            data = await asyncio.shield(future)
+        
+        if not self.overlays.has_overlay(guild_id, category):
+            return data
+        await self.aload_overlay(category, guild_id)
+        return self.overlays.get_merged(guild_id, category, data, self.get_version(category))
+    
+    async def aload_overlay(self, category: str, guild_id: Optional[int] = None):
+        """Read the guild's overlay of a category off the event loop if it isn't loaded
+        
+        Call before the synchronous accessors in interaction handlers, which
+        would otherwise read a missing overlay on the loop.
+        """
+        if not self.overlays.has_overlay(guild_id, category) or self.overlays.is_loaded(guild_id, category):
+            return
+        loop = asyncio.get_running_loop()
+        layer = await loop.run_in_executor(None, self.overlays.read_layer, guild_id, category)
+        if not self.overlays.is_loaded(guild_id, category):
+            self.overlays.put_layer(guild_id, category, layer)
+    
+    async def aprepare(self, category: str, guild_id: Optional[int] = None):
+        """Make a category's first reads cheap without blocking the event loop
+        
+        With a store only its per-category setup runs (e.g. indexing a file),
+        so nothing is materialized; otherwise the category is loaded.
+        """
+        if self._use_store(category, guild_id):
+            await asyncio.get_running_loop().run_in_executor(None, self.store.prepare, category)
+        else:
+            await self.aload_data(category, guild_id)
+        await self.aload_overlay(category, guild_id)
+    
+    async def _load_in_executor(self, category: str) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        
+        if self.store:
+            data = await loop.run_in_executor(None, self.store.load_category, category)
+            if data:
+                self._cache_store_category(category, data)
+            return data
+        
+        file_path = self._file_path(category)
+        stat = self._stat(file_path)
+        if stat is None:
+            logger.warning(f"📄 Data file not found: {file_path}")
+            return {}
+        
+        data = await loop.run_in_executor(None, self._read_file, category, file_path)
+        if category not in self._cache:
+            self._store(category, data, stat)
+            logger.info(f"✅ Loaded {category}.json")
+        return self._cache[category]
+    
+    def warm_up(self, use_snapshot: bool = True) -> Dict[str, Any]:
+        """Load every category at boot, from the compiled snapshot where it is fresh
+        
+        Categories whose JSON changed since the snapshot was built are parsed
+        from JSON and the snapshot is rebuilt for the next start.
+        """
+        start = time.perf_counter()
+        from_snapshot = 0
+        stale = []
+        
+        if use_snapshot:
+            data, stats, stale = load_snapshot(self.data_dir)
+            for category, content in data.items():
+                try:
+                    self._validate(category, content)
+                except ValueError as e:
+                    logger.warning(f"⚠️ Snapshot entry for {category} rejected: {e}")
+                    continue
+                self._store(category, content, stats[category])
+                from_snapshot += 1
+        snapshot_ms = (time.perf_counter() - start) * 1000
+        
+        json_start = time.perf_counter()
+        from_json = 0
+        for file_path in sorted(glob.glob(os.path.join(self.data_dir, '*.json'))):
+            category = os.path.splitext(os.path.basename(file_path))[0]
+            if category not in self._cache and self.load_data(category):
+                from_json += 1
+        json_ms = (time.perf_counter() - json_start) * 1000
+        
+        # Half-loaded boot revisions are no rollback targets
+        self._history.clear()
+        self.sync_cross_refs()
+        
+        logger.info(
+            f"⏱️ Content warm-up: {from_snapshot} categories from snapshot in {snapshot_ms:.1f} ms, "
+            f"{from_json} from JSON in {json_ms:.1f} ms"
+        )
+        
+        if use_snapshot and from_json:
+            # Something was missing or stale - refresh the snapshot for next boot
+            try:
+                build_snapshot(self.data_dir)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not rebuild content snapshot: {e}")
+        
+        return {
+            'snapshot_categories': from_snapshot,
+            'json_categories': from_json,
+            'stale': stale,
+            'snapshot_ms': snapshot_ms,
+            'json_ms': json_ms,
+        }
+    
+    def get_version(self, category: str, guild_id: Optional[int] = None) -> Union[int, Tuple[int, int]]:
+        """Get the content version of a category (changes on every reload)
+        
+        For a guild with an overlay of the category it's (base version, overlay version).
+        """
+        if not self.store:
+            self.load_data(category)
+        version = self._versions.get(category, 0)
+        if self.overlays.has_overlay(guild_id, category):
+            return version, self.overlays.version(guild_id, category)
+        return version
+    
+    def get_rendered(self, namespace: str, category: str, key, render,
+                     version: Optional[Union[int, Tuple[int, int]]] = None, guild_id: Optional[int] = None):
+        """Get something rendered from a category's content, re-rendering after reloads
+        
+        Pass the version the content came from when rendering from a pinned
+        (possibly older) revision, so it's never cached as the current one.
+        Renders for a guild with an overlay are cached with its overlay.
+        """
+        if version is None:
+            version = self.get_version(category, guild_id)
+        if self.overlays.has_overlay(guild_id, category):
+            cache = self.overlays.layer(guild_id, category).render_cache
+        else:
+            cache = self.render_cache
+        return cache.get_or_render(namespace, category, key, version, render)
+    
+    def changed_categories(self) -> List[str]:
+        """List categories whose file changed on disk since it was loaded
+        
+        Data files added since boot (or never read yet) count as changed, so
+        the watcher loads them too.
+        """
+        if self.store:
+            return []
+        categories = set(self._cache) | {
+            os.path.splitext(os.path.basename(file_path))[0]
+            for file_path in glob.glob(os.path.join(self.data_dir, '*.json'))
+        }
+        return sorted(
+            category for category in categories
+            if self._stat(self._file_path(category)) != self._file_stats.get(category)
+        )
+    
+    async def reload_category(self, category: str) -> bool:
+        """(Re-)parse a category off the event loop and swap it in if valid"""
+        file_path = self._file_path(category)
+        stat = self._stat(file_path)
+        if stat is None:
+            logger.warning(f"⚠️ {category}.json disappeared, keeping the loaded content")
+            self._file_stats[category] = None
+            return False
+        
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(None, self._read_file, category, file_path)
+        except Exception as e:
+            # Keep serving the previous content; retry once the file changes again
+            logger.error(f"❌ Not reloading {category}.json: {e}")
+            self._file_stats[category] = stat
+            return False
+        
+        verb = "Reloaded" if category in self._cache else "Loaded new"
+        self._store(category, data, stat)
+        logger.info(f"🔄 {verb} {category}.json (version {self._versions[category]})")
+        return True
+    
+    async def sync_store(self) -> List[str]:
+        """Drop cached content of categories whose version changed in the store"""
+        loop = asyncio.get_running_loop()
+        versions = await loop.run_in_executor(None, self.store.versions)
+        changed = [
+            category for category in set(versions) | set(self._versions)
+            if versions.get(category) != self._versions.get(category)
+        ]
+        if changed:
+            self._publish(
+                {category: data for category, data in self._cache.items() if category not in changed},
+                versions,
+                record=False
+            )
+        for category in changed:
+            logger.info(f"🔄 {category} changed in the content store (version {versions.get(category)})")
+        return changed
+    
+    def sync_overlays(self) -> List[Tuple[int, str]]:
+        """Pick up added guild overlays and drop loaded ones whose file changed"""
+        self.overlays.scan()
+        changed = self.overlays.changed()
+        for guild_id, category in changed:
+            logger.info(f"🔄 Overlay {category}.json of guild {guild_id} changed")
+        return changed
+    
+    async def _watch(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.sync_overlays()
+                if self.store:
+                    await self.sync_store()
+                else:
+                    for category in self.changed_categories():
+                        await self.reload_category(category)
+                rebuild = self.refresh_cross_refs()
+                if rebuild is not None:
+                    await rebuild
+            except Exception as e:
+                logger.error(f"❌ Error checking data files for changes: {e}")
+    
+    def start_auto_reload(self, interval: float):
+        """Poll loaded data files for changes in a background task"""
+        if interval <= 0 or self._reload_task is not None:
+            return
+        self._reload_task = asyncio.get_running_loop().create_task(self._watch(interval))
+        logger.info(f"👀 Watching data files for changes every {interval:g}s")
+    
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Full-text search across every loaded category"""
+        if self.store:
+            hits = self.store.search(query, limit)
+            if hits is not None:
+                return hits
+            # No native search - index stored categories in memory, decoding one at a time
+            self.search_index.sync(dict(self._versions), self.store.load_category)
+        else:
+            self.search_index.sync(dict(self._versions), self._cache.__getitem__)
+        return self.search_index.search(query, limit)
+    
+    def _cross_ref_versions(self) -> Dict[str, int]:
+        if self.store:
+            return dict(self._versions)
+        return {category: self._versions.get(category, 0) for category in list(self._cache)}
+    
+    def sync_cross_refs(self):
+        """Rebuild the cross-reference index if any category changed since it was built
+        
+        Blocking (every category is read for the build); on the event loop use
+        refresh_cross_refs instead.
+        """
+        start = time.perf_counter()
+        if self.store:
+            versions = dict(self._versions)
+            if self.cross_refs.is_current(versions):
+                return
+            # Read categories for the build only, rather than keeping them all decoded
+            contents = {
+                category: (version, self.store.load_category(category))
+                for category, version in versions.items()
+            }
+        else:
+            contents = {
+                category: (self._versions.get(category, 0), data)
+                for category, data in list(self._cache.items())
+            }
+        if self.cross_refs.sync(contents):
+            stats = self.cross_refs.stats()
+            logger.info(
+                f"🔗 Cross-referenced {stats['linked_entries']} of {stats['entries']} entries "
+                f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+            )
+    
+    def refresh_cross_refs(self) -> Optional[asyncio.Future]:
+        """Start rebuilding a stale cross-reference index in the executor
+        
+        Returns the (shared) rebuild to await, or None if the index is current.
+        """
+        if self.cross_refs.is_current(self._cross_ref_versions()):
+            return None
+        if self._cross_refs_task is None or self._cross_refs_task.done():
+            loop = asyncio.get_running_loop()
+            self._cross_refs_task = loop.run_in_executor(None, self.sync_cross_refs)
+        return self._cross_refs_task
+    
+    def get_related(self, category: str, key: str, faction: str = None, limit: int = 5) -> List[Tuple[Tuple[str, Optional[str], str], str]]:
+        """Entries linked to an item by tags or mentions, as ((category, faction, key), name)
+        
+        On the event loop a stale index is rebuilt in the background and the
+        links it had are returned meanwhile.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.sync_cross_refs()
+        else:
+            self.refresh_cross_refs()
+        return self.cross_refs.related((category, faction, key), limit)
+    
+    def get_name_index(self, category: str, display_name: Optional[Callable[[str, Dict[str, Any]], str]] = None,
+                       guild_id: Optional[int] = None) -> NameIndex:
+        """Prefix index over a category's keys, display names and aliases (rebuilt per version)
+        
+        display_name(key, item) overrides how entries are named; callers that pass
+        one must always pass the same one for a category.
+        """
+        return self.get_rendered(
+            'name_index', category, None,
+            lambda: NameIndex.build(self.load_data(category, guild_id), display_name),
+            guild_id=guild_id
+        )
+    
+    def get_records(self, category: str, faction: str = None, guild_id: Optional[int] = None) -> Dict[str, ItemRecord]:
+        """Items of a category/faction parsed into records, once per content version"""
+        render = lambda: {
+            key: ItemRecord.from_item(key, item, faction)
+            for key, item in self.get_items(category, faction, guild_id).items()
+            if is_item(item)
+        }
+        if self._use_store(category, guild_id):
+            # Not cached: the store's item cache is what bounds decoded content
+            return render()
+        return self.get_rendered('records', category, faction, render, guild_id=guild_id)
+    
+    def get_record(self, category: str, item_key: str, faction: str = None,
+                   guild_id: Optional[int] = None) -> Optional[ItemRecord]:
+        """Get a specific item as a record"""
+        if self._use_store(category, guild_id):
+            item = self.store.get_item(category, item_key, faction)
+            return ItemRecord.from_item(item_key, item, faction) if is_item(item) else None
+        return self.get_records(category, faction, guild_id).get(item_key)
+    
+    def is_item(self, category: str, key: str, guild_id: Optional[int] = None) -> bool:
+        """Whether a top-level key of a category is an item rather than a faction"""
+        if self._use_store(category, guild_id):
+            return self.store.is_item(category, key)
+        return is_item(self.load_data(category, guild_id).get(key))
+    
+    def _use_store(self, category: str, guild_id: Optional[int]) -> bool:
+        # Overlays are merged onto the whole category, so those reads go through load_data
+        return bool(self.store) and category not in self._cache and not self.overlays.has_overlay(guild_id, category)
+    
+    def get_factions(self, category: str, guild_id: Optional[int] = None) -> List[str]:
         """Get list of available factions for a category"""
-        data = self.load_data(category)
+        if self._use_store(category, guild_id):
+            return self.store.get_factions(category)
+        data = self.load_data(category, guild_id)
         return list(data.keys())
     
-    def get_items(self, category: str, faction: str = None) -> Dict[str, Any]:
+    def get_items(self, category: str, faction: str = None, guild_id: Optional[int] = None) -> Dict[str, Any]:
         """Get items from a category, optionally filtered by faction"""
-        data = self.load_data(category)
+        if self._use_store(category, guild_id):
+            return self.store.get_items(category, faction)
+        data = self.load_data(category, guild_id)
         if faction and faction in data:
             return data[faction]
         return data
     
-    def get_item(self, category: str, item_key: str, faction: str = None) -> Dict[str, Any]:
+    def get_item(self, category: str, item_key: str, faction: str = None, guild_id: Optional[int] = None) -> Dict[str, Any]:
         """Get a specific item"""
-        items = self.get_items(category, faction)
+        if self._use_store(category, guild_id):
+            return self.store.get_item(category, item_key, faction)
+        items = self.get_items(category, faction, guild_id)
         return items.get(item_key, {})
 
 # Global data manager instance
@@ -0,0 +1,82 @@
+import bisect
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .search_index import iter_items
+
+# (faction, key, display name)
+NameEntry = Tuple[Optional[str], str, str]
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse punctuation so 'Sainte-Mère' and 'sainte mère' match"""
+    return ' '.join(re.findall(r"\w+", text.lower()))
+
+
+class NameIndex:
+    """Sorted array of normalized names for prefix lookups (autocomplete)
+    
+    Every item is reachable by its key, display name, aliases and each word of
+    its display name, so 'sher' finds 'M4 Sherman'. Lookups are a bisect plus
+    a scan over the matches, independent of how many entries there are.
+    """
+    
+    def __init__(self, entries: List[NameEntry], terms: List[Tuple[str, int]], exact: Dict[str, int]):
+        self._entries = entries
+        terms.sort()
+        self._terms = [term for term, _ in terms]
+        self._term_entries = [entry for _, entry in terms]
+        # Full keys, names and aliases (not single words) for resolving typed input
+        self._exact = exact
+    
+    @classmethod
+    def build(cls, data: Dict[str, Any],
+              display_name: Optional[Callable[[str, Dict[str, Any]], str]] = None) -> 'NameIndex':
+        entries = []
+        terms = []
+        exact = {}
+        for faction, key, item in iter_items(data):
+            if display_name:
+                name = display_name(key, item)
+            else:
+                name = item.get('display_name') or key.title()
+            index = len(entries)
+            entries.append((faction, key, name))
+            
+            names = {normalize(key), normalize(name)}
+            names.update(normalize(alias) for alias in item.get('aliases', []))
+            for term in names:
+                exact.setdefault(term, index)
+            names.update(normalize(name).split())
+            terms.extend((term, index) for term in names if term)
+        return cls(entries, terms, exact)
+    
+    def complete(self, prefix: str, limit: int = 25) -> List[NameEntry]:
+        """Entries with a name starting with prefix (all entries for an empty prefix)"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return self._entries[:limit]
+        
+        results = []
+        seen = set()
+        position = bisect.bisect_left(self._terms, prefix)
+        while position < len(self._terms) and self._terms[position].startswith(prefix):
+            entry = self._term_entries[position]
+            if entry not in seen:
+                seen.add(entry)
+                results.append(self._entries[entry])
+                if len(results) >= limit:
+                    break
+            position += 1
+        return results
+    
+    def resolve(self, text: str) -> Optional[NameEntry]:
+        """Entry whose key, name or alias is exactly text, else the first prefix match"""
+        term = normalize(text)
+        if term in self._exact:
+            return self._entries[self._exact[term]]
+        matches = self.complete(text, 1)
+        return matches[0] if matches else None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,178 @@
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .render_cache import RenderCache
+
+logger = logging.getLogger(__name__)
+
+
+def merge_overlay(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """Layer overlay onto base without modifying either
+    
+    Dicts merge recursively, other values replace, and null removes the key.
+    Untouched subtrees are shared with base rather than copied.
+    """
+    merged = dict(base)
+    for key, value in overlay.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict) and isinstance(base.get(key), dict):
+            merged[key] = merge_overlay(base[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class OverlayLayer:
+    """One guild's overlay of one category, plus its merge with the base it was last applied to"""
+    
+    __slots__ = ('overlay', 'stat', 'version', 'merged', 'merged_base_version', 'render_cache')
+    
+    def __init__(self, overlay: Dict[str, Any], stat: Optional[Tuple[int, int]]):
+        self.overlay = overlay
+        self.stat = stat
+        self.version = 0
+        self.merged: Optional[Dict[str, Any]] = None
+        self.merged_base_version: Optional[int] = None
+        # Renders of the merged content; dropped along with the layer
+        self.render_cache = RenderCache()
+
+
+class GuildOverlays:
+    """Per-guild content layered over the shared data files
+    
+    Overlays live in <overlay_dir>/<guild_id>/<category>.json and use the
+    same layout as the base file. They are parsed and merged on first use,
+    then served from an LRU bounded to max_guilds guilds.
+    """
+    
+    def __init__(self, overlay_dir: str, max_guilds: int = 32):
+        self.overlay_dir = overlay_dir
+        self.max_guilds = max_guilds
+        # guild -> categories with an overlay file (from the last scan)
+        self._available: Dict[int, Set[str]] = {}
+        # guild -> {category: layer}, least recently used first
+        self._guilds: 'OrderedDict[int, Dict[str, OverlayLayer]]' = OrderedDict()
+        self._version_counter = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.scan()
+    
+    def _file_path(self, guild_id: int, category: str) -> str:
+        return os.path.join(self.overlay_dir, str(guild_id), f"{category}.json")
+    
+    def scan(self):
+        """Re-list which guilds have overlay files"""
+        available = {}
+        try:
+            entries = os.listdir(self.overlay_dir)
+        except OSError:
+            entries = []
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            try:
+                files = os.listdir(os.path.join(self.overlay_dir, entry))
+            except OSError:
+                continue
+            categories = {name[:-5] for name in files if name.endswith('.json')}
+            if categories:
+                available[int(entry)] = categories
+        if available != self._available:
+            logger.info(f"🏷️ Found content overlays for {len(available)} guild(s)")
+        self._available = available
+    
+    def has_overlay(self, guild_id: Optional[int], category: str) -> bool:
+        return guild_id is not None and category in self._available.get(guild_id, ())
+    
+    def guild_categories(self, guild_id: int) -> Set[str]:
+        return set(self._available.get(guild_id, ()))
+    
+    def read_layer(self, guild_id: int, category: str) -> OverlayLayer:
+        """Parse an overlay file (safe to run in an executor; doesn't touch the LRU)"""
+        file_path = self._file_path(guild_id, category)
+        stat = None
+        try:
+            st = os.stat(file_path)
+            stat = (st.st_mtime_ns, st.st_size)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                overlay = json.load(f)
+            if not isinstance(overlay, dict):
+                raise ValueError("root should be a dictionary")
+            return OverlayLayer(overlay, stat)
+        except Exception as e:
+            # A broken overlay must not take the guild's base content down with it;
+            # keeping its stat means it's retried only once the file changes
+            logger.error(f"❌ Ignoring overlay {file_path}: {e}")
+            return OverlayLayer({}, stat)
+    
+    def is_loaded(self, guild_id: int, category: str) -> bool:
+        return category in self._guilds.get(guild_id, {})
+    
+    def put_layer(self, guild_id: int, category: str, layer: OverlayLayer):
+        self._version_counter += 1
+        layer.version = self._version_counter
+        self._guilds.setdefault(guild_id, {})[category] = layer
+        self._guilds.move_to_end(guild_id)
+        while len(self._guilds) > self.max_guilds:
+            evicted, _ = self._guilds.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"🏷️ Evicted overlays of guild {evicted}")
+    
+    def layer(self, guild_id: int, category: str) -> OverlayLayer:
+        """The guild's loaded layer of a category, read from disk on a miss
+        
+        Handlers on the event loop load it first (DataManager.aload_overlay), so
+        this blocking read is only a fallback, e.g. right after an eviction.
+        """
+        layers = self._guilds.get(guild_id)
+        if layers is not None and category in layers:
+            self._guilds.move_to_end(guild_id)
+            return layers[category]
+        layer = self.read_layer(guild_id, category)
+        self.put_layer(guild_id, category, layer)
+        return layer
+    
+    def version(self, guild_id: int, category: str) -> int:
+        return self.layer(guild_id, category).version
+    
+    def get_merged(self, guild_id: int, category: str, base: Dict[str, Any], base_version: int) -> Dict[str, Any]:
+        """Base content with the guild's overlay applied, merged once per (base, overlay) version"""
+        layer = self.layer(guild_id, category)
+        if layer.merged is not None and layer.merged_base_version == base_version:
+            self.hits += 1
+            return layer.merged
+        
+        self.misses += 1
+        layer.merged = merge_overlay(base, layer.overlay)
+        layer.merged_base_version = base_version
+        return layer.merged
+    
+    def changed(self) -> List[Tuple[int, str]]:
+        """Drop loaded overlays whose file changed; they are re-read on next use"""
+        changed = []
+        for guild_id, layers in list(self._guilds.items()):
+            for category, layer in list(layers.items()):
+                try:
+                    stat = os.stat(self._file_path(guild_id, category))
+                    current = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    current = None
+                if current != layer.stat:
+                    del layers[category]
+                    changed.append((guild_id, category))
+        return changed
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'guilds_with_overlays': len(self._available),
+            'cached_guilds': len(self._guilds),
+            'max_guilds': self.max_guilds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
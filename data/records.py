@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_COLOR = 0x5865F2
+
+# Discord embed limits
+MAX_FIELDS = 25
+MAX_FIELD_VALUE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class EmbedField:
+    name: str
+    value: str
+    inline: bool
+
+
+def _asset_name(path: str) -> str:
+    # Remove "attachment://" prefix if present
+    if path.startswith('attachment://'):
+        return path.replace('attachment://', '')
+    return path
+
+
+def _color(value: Any) -> int:
+    try:
+        return int(str(value), 16)
+    except ValueError:
+        # Fallback if color is invalid
+        return DEFAULT_COLOR
+
+
+@dataclass(frozen=True, slots=True)
+class ItemRecord:
+    """An item parsed once into exactly what its embed and attachments need"""
+    
+    key: str
+    faction: Optional[str]
+    title: str
+    display_name: str
+    color: int
+    emoji: Optional[str]
+    short_description: str
+    fields: Tuple[EmbedField, ...]
+    thumbnail: Optional[str]
+    gallery: Tuple[str, ...]
+    
+    @classmethod
+    def from_item(cls, key: str, item: Dict[str, Any], faction: Optional[str] = None) -> 'ItemRecord':
+        fields = []
+        for field_key, field_value in item.items():
+            # *_inline keys are layout flags of another field, not fields
+            if not field_key.startswith('field_') or field_key.endswith('_inline') or len(fields) >= MAX_FIELDS:
+                continue
+            value = str(field_value)
+            # Truncate field values if too long
+            if len(value) > MAX_FIELD_VALUE:
+                value = value[:MAX_FIELD_VALUE - 3] + "..."
+            fields.append(EmbedField(
+                name=field_key.replace('field_', '').replace('_', ' ').title(),
+                value=value,
+                inline=bool(item.get(f"{field_key}_inline", False))
+            ))
+        
+        thumbnail = _asset_name(item['thumbnail']) if item.get('thumbnail') else None
+        gallery = tuple(
+            image for image in map(_asset_name, item.get('additional_images', []))
+            if image != thumbnail
+        )
+        
+        return cls(
+            key=key,
+            faction=faction,
+            title=item.get('title', key.title()),
+            display_name=item.get('display_name', key.title()),
+            color=_color(item.get('color', '0x5865F2')),
+            emoji=item.get('emoji'),
+            short_description=item.get('short_description', ''),
+            fields=tuple(fields),
+            thumbnail=thumbnail,
+            gallery=gallery
+        )
+    
+    @property
+    def asset_names(self) -> Tuple[str, ...]:
+        """Every asset the item attaches, thumbnail first"""
+        return ((self.thumbnail,) if self.thumbnail else ()) + self.gallery
@@ -0,0 +1,36 @@
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+class RenderCache:
+    """Caches values rendered from content, tagged with the content version they came from
+    
+    An entry is only reused while its category is still at the same version,
+    so a DataManager reload invalidates everything rendered from the old data.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str, Hashable], Tuple[int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get_or_render(self, namespace: str, category: str, key: Hashable, version: int,
+                      render: Callable[[], Any]) -> Any:
+        """Return the cached value for (namespace, category, key) at version, rendering on a miss"""
+        entry_key = (namespace, category, key)
+        entry = self._entries.get(entry_key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+        
+        self.misses += 1
+        value = render()
+        # Replacing the entry drops the stale version, keeping the cache bounded by item count
+        self._entries[entry_key] = (version, value)
+        return value
+    
+    def invalidate(self, category: str):
+        """Drop everything rendered from a category"""
+        for entry_key in [k for k in self._entries if k[1] == category]:
+            del self._entries[entry_key]
+    
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,33 @@
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+
+@dataclass(frozen=True)
+class ContentRevision:
+    """An immutable view of every loaded category at one point in time
+    
+    DataManager never modifies a published revision: an update copies the
+    category mapping, swaps in the changed category and publishes the copy,
+    so a reader holding a revision always sees consistent content.
+    """
+    
+    number: int
+    data: Mapping[str, Dict[str, Any]]
+    versions: Mapping[str, int]
+    created_at: float = field(default_factory=time.time)
+    
+    @classmethod
+    def create(cls, number: int, data: Dict[str, Dict[str, Any]], versions: Dict[str, int]) -> 'ContentRevision':
+        return cls(number, MappingProxyType(dict(data)), MappingProxyType(dict(versions)))
+    
+    def get_version(self, category: str) -> int:
+        return self.versions.get(category, 0)
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'revision': self.number,
+            'created_at': self.created_at,
+            'versions': dict(self.versions),
+        }
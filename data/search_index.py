@@ -0,0 +1,219 @@
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Free-text fields of a map entry (items use field_* keys instead)
+MAP_TEXT_FIELDS = ('title', 'terrain', 'points', 'infantry', 'armor')
+# Keys that mark a dict as an item rather than a faction grouping
+ITEM_MARKERS = ('display_name', 'title') + MAP_TEXT_FIELDS
+
+# 'at' is deliberately kept: "AT gun" means anti-tank here
+STOPWORDS = frozenset(
+    'a an and are as be but by for from has have if in into is it its of on or '
+    'so than that the their them then there these they this to was were will with'.split()
+)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# (category, faction, key)
+DocId = Tuple[str, Optional[str], str]
+
+
+def stem(token: str) -> str:
+    """Strip common English suffixes so 'tanks'/'tank' and 'flanking'/'flank' match"""
+    if len(token) <= 3 or token.isdigit():
+        return token
+    if token.endswith('ies') and len(token) > 4:
+        return token[:-3] + 'y'
+    if token.endswith('sses'):
+        return token[:-2]
+    for suffix in ('ing', 'ed'):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            # flanking -> flank, but stopped -> stop
+            if len(token) > 3 and token[-1] == token[-2] and token[-1] not in 'lsz':
+                token = token[:-1]
+            return token
+    if token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and stem"""
+    return [stem(token) for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+@dataclass
+class SearchHit:
+    category: str
+    faction: Optional[str]
+    key: str
+    title: str
+    score: float
+    snippet: str
+
+
+def is_item(value: Any) -> bool:
+    """Whether a value is a content item rather than a faction grouping"""
+    return isinstance(value, dict) and any(
+        key.startswith('field_') or key in ITEM_MARKERS for key in value
+    )
+
+
+def iter_items(data: Dict[str, Any]) -> Iterator[Tuple[Optional[str], str, Dict[str, Any]]]:
+    """Yield (faction, key, item) for a category, whether or not it is grouped by faction"""
+    for key, value in data.items():
+        if is_item(value):
+            yield None, key, value
+        elif isinstance(value, dict):
+            for item_key, item in value.items():
+                if is_item(item):
+                    yield key, item_key, item
+
+
+def item_segments(item: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(name, text) pairs of an item's searchable text"""
+    segments = []
+    for name in ('display_name', 'short_description'):
+        if item.get(name):
+            segments.append((name, str(item[name])))
+    for name in MAP_TEXT_FIELDS:
+        if isinstance(item.get(name), str):
+            segments.append((name, item[name]))
+    for field_key, value in item.items():
+        if field_key.startswith('field_') and not field_key.endswith('_inline'):
+            field_name = field_key.replace('field_', '').replace('_', ' ')
+            segments.append((field_name, f"{field_name}: {value}"))
+    return segments
+
+
+class SearchIndex:
+    """In-memory inverted index over every loaded category, ranked with BM25
+    
+    Categories are indexed per content version; sync() re-indexes only the
+    categories whose version changed since they were last indexed.
+    """
+    
+    K1 = 1.2
+    B = 0.75
+    
+    def __init__(self):
+        # term -> {doc: term frequency}
+        self._postings: Dict[str, Dict[DocId, int]] = {}
+        self._doc_terms: Dict[DocId, Counter] = {}
+        self._doc_lengths: Dict[DocId, int] = {}
+        self._doc_titles: Dict[DocId, str] = {}
+        self._doc_segments: Dict[DocId, List[Tuple[str, str]]] = {}
+        self._category_docs: Dict[str, List[DocId]] = {}
+        self._versions: Dict[str, int] = {}
+        self._total_length = 0
+    
+    def sync(self, versions: Dict[str, int], load: Callable[[str], Dict[str, Any]]):
+        """Bring the index up to date with {category: version}
+        
+        load(category) is only called for categories that changed, one at a
+        time, so their content needn't be held in memory together.
+        """
+        for category in list(self._category_docs):
+            if category not in versions:
+                self.remove_category(category)
+        for category, version in versions.items():
+            if self._versions.get(category) != version:
+                self.index_category(category, load(category), version)
+    
+    def index_category(self, category: str, data: Dict[str, Any], version: int):
+        """(Re)index every item of a category"""
+        self.remove_category(category)
+        docs = []
+        for faction, key, item in iter_items(data):
+            doc = (category, faction, key)
+            segments = item_segments(item)
+            terms = Counter()
+            for _, text in segments:
+                terms.update(tokenize(text))
+            if not terms:
+                continue
+            
+            for term, count in terms.items():
+                self._postings.setdefault(term, {})[doc] = count
+            length = sum(terms.values())
+            self._doc_terms[doc] = terms
+            self._doc_lengths[doc] = length
+            self._doc_titles[doc] = item.get('display_name') or item.get('title') or key.title()
+            self._doc_segments[doc] = segments
+            self._total_length += length
+            docs.append(doc)
+        
+        self._category_docs[category] = docs
+        self._versions[category] = version
+        logger.info(f"🔎 Indexed {len(docs)} {category} entries for search (version {version})")
+    
+    def remove_category(self, category: str):
+        for doc in self._category_docs.pop(category, []):
+            for term in self._doc_terms.pop(doc):
+                postings = self._postings[term]
+                del postings[doc]
+                if not postings:
+                    del self._postings[term]
+            self._total_length -= self._doc_lengths.pop(doc)
+            del self._doc_titles[doc]
+            del self._doc_segments[doc]
+        self._versions.pop(category, None)
+    
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Rank documents matching any query term with BM25"""
+        terms = set(tokenize(query))
+        doc_count = len(self._doc_lengths)
+        if not terms or not doc_count:
+            return []
+        
+        average_length = self._total_length / doc_count
+        scores: Dict[DocId, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, frequency in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * self._doc_lengths[doc] / average_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * frequency * (self.K1 + 1) / (frequency + norm)
+        
+        ranked = sorted(scores.items(), key=lambda entry: entry[1], reverse=True)[:limit]
+        return [
+            SearchHit(
+                category=doc[0],
+                faction=doc[1],
+                key=doc[2],
+                title=self._doc_titles[doc],
+                score=score,
+                snippet=self._snippet(doc, terms)
+            )
+            for doc, score in ranked
+        ]
+    
+    def _snippet(self, doc: DocId, terms: set, width: int = 120) -> str:
+        """Text around the first query term in the document"""
+        for _, text in self._doc_segments[doc]:
+            words = text.split()
+            for index, word in enumerate(words):
+                if set(tokenize(word)) & terms:
+                    start = max(0, index - 6)
+                    snippet = ' '.join(words[start:])
+                    if len(snippet) > width:
+                        snippet = snippet[:width].rsplit(' ', 1)[0] + '…'
+                    return ('…' if start else '') + snippet
+        text = self._doc_segments[doc][0][1]
+        return text if len(text) <= width else text[:width].rsplit(' ', 1)[0] + '…'
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'documents': len(self._doc_lengths),
+            'terms': len(self._postings),
+            'categories': len(self._category_docs),
+        }
@@ -0,0 +1,103 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = 'content.snapshot'
+
+def _sha256(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+def build_snapshot(data_dir: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+    """Compile every data/*.json file into one pickled snapshot keyed by source hashes"""
+    start = time.perf_counter()
+    output_path = output_path or os.path.join(data_dir, SNAPSHOT_FILENAME)
+    
+    sources = {}
+    data = {}
+    for file_path in sorted(glob.glob(os.path.join(data_dir, '*.json'))):
+        category = os.path.splitext(os.path.basename(file_path))[0]
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        try:
+            parsed = json.loads(raw.decode('utf-8'))
+        except Exception as e:
+            logger.error(f"❌ Skipping {category}.json in snapshot: {e}")
+            continue
+        
+        stat = os.stat(file_path)
+        sources[category] = {
+            'sha256': _sha256(raw),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        data[category] = parsed
+    
+    snapshot = {'version': SNAPSHOT_VERSION, 'sources': sources, 'data': data}
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, output_path)
+    
+    logger.info(f"📦 Built content snapshot with {len(data)} categories in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return snapshot
+
+def load_snapshot(data_dir: str, snapshot_path: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Tuple[int, int]], list]:
+    """Load categories from the snapshot whose source JSON is unchanged
+    
+    Returns (data, stats, stale) where stats holds the current (mtime_ns, size)
+    of each fresh source and stale lists categories that must be parsed from JSON.
+    """
+    snapshot_path = snapshot_path or os.path.join(data_dir, SNAPSHOT_FILENAME)
+    if not os.path.exists(snapshot_path):
+        return {}, {}, []
+    
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable content snapshot: {e}")
+        return {}, {}, []
+    
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        logger.info("📦 Content snapshot is from an older format, ignoring it")
+        return {}, {}, []
+    
+    data = {}
+    stats = {}
+    stale = []
+    for category, source in snapshot['sources'].items():
+        file_path = os.path.join(data_dir, f"{category}.json")
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stale.append(category)
+            continue
+        
+        fresh = (stat.st_size == source['size'] and stat.st_mtime_ns == source['mtime_ns'])
+        if not fresh and stat.st_size == source['size']:
+            # mtimes change on checkout/deploy - fall back to comparing content
+            with open(file_path, 'rb') as f:
+                fresh = _sha256(f.read()) == source['sha256']
+        
+        if fresh:
+            data[category] = snapshot['data'][category]
+            stats[category] = (stat.st_mtime_ns, stat.st_size)
+        else:
+            stale.append(category)
+    
+    return data, stats, stale
+
+
+if __name__ == '__main__':
+    # Build step: python -m data.snapshot
+    logging.basicConfig(level=logging.INFO)
+    build_snapshot(os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,294 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .search_index import SearchHit, STOPWORDS, TOKEN_PATTERN, is_item, item_segments
+from .store import ContentStore
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    category TEXT PRIMARY KEY,
+    factions TEXT,              -- JSON list in file order, NULL when not grouped by faction
+    version INTEGER NOT NULL,
+    source_sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    category TEXT NOT NULL,
+    faction TEXT NOT NULL,      -- '' for categories not grouped by faction
+    key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (category, faction, key)
+);
+CREATE INDEX IF NOT EXISTS items_by_position ON items (category, position);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, body, category UNINDEXED, faction UNINDEXED, key UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+# Statements are module constants so sqlite3's per-connection statement cache
+# keeps them prepared across calls
+SELECT_VERSIONS = "SELECT category, version FROM categories"
+SELECT_CATEGORY = "SELECT factions FROM categories WHERE category = ?"
+SELECT_CATEGORY_ITEMS = "SELECT faction, key, data FROM items WHERE category = ? ORDER BY position"
+SELECT_FACTION_ITEMS = "SELECT key, data FROM items WHERE category = ? AND faction = ? ORDER BY position"
+SELECT_ITEM = "SELECT data FROM items WHERE category = ? AND faction = ? AND key = ?"
+SELECT_KEYS = "SELECT key FROM items WHERE category = ? ORDER BY position"
+SEARCH_FTS = """
+SELECT category, faction, key, title, bm25(items_fts, 5.0, 1.0) AS rank,
+       snippet(items_fts, 1, '', '', '…', 20)
+FROM items_fts WHERE items_fts MATCH ? ORDER BY rank LIMIT ?
+"""
+
+_MISSING = object()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    # WAL lets the bot keep reading while the importer writes
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _has_fts5(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class SQLiteContentStore(ContentStore):
+    """Content stored one row per item in SQLite, searched with FTS5
+    
+    Lookups by faction or key fetch just the rows they need instead of
+    materializing whole categories. Populate it with import_json().
+    """
+    
+    name = 'sqlite'
+    
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        # sqlite3 connections can't be shared across threads; reloads run in executors
+        self._local = threading.local()
+        self.fts = _has_fts5(self._conn())
+        if not self.fts:
+            logger.warning("⚠️ SQLite has no FTS5, search will use the in-memory index")
+    
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.db_path)
+        return conn
+    
+    def _factions(self, category: str):
+        """Faction list of a category, None if not grouped, _MISSING if unknown"""
+        row = self._conn().execute(SELECT_CATEGORY, (category,)).fetchone()
+        if row is None:
+            return _MISSING
+        return json.loads(row[0]) if row[0] is not None else None
+    
+    def versions(self) -> Dict[str, int]:
+        return dict(self._conn().execute(SELECT_VERSIONS).fetchall())
+    
+    def load_category(self, category: str) -> Dict[str, Any]:
+        factions = self._factions(category)
+        if factions is _MISSING:
+            return {}
+        
+        rows = self._conn().execute(SELECT_CATEGORY_ITEMS, (category,)).fetchall()
+        if factions is None:
+            return {key: json.loads(data) for _, key, data in rows}
+        
+        content = {faction: {} for faction in factions}
+        for faction, key, data in rows:
+            content[faction][key] = json.loads(data)
+        return content
+    
+    def get_factions(self, category: str) -> List[str]:
+        factions = self._factions(category)
+        if factions is _MISSING:
+            return []
+        if factions is None:
+            # Same as the JSON layout: the top-level keys
+            return [key for key, in self._conn().execute(SELECT_KEYS, (category,))]
+        return factions
+    
+    def get_items(self, category: str, faction: str = None) -> Dict[str, Any]:
+        factions = self._factions(category)
+        if factions is _MISSING:
+            return {}
+        if faction and factions is not None and faction in factions:
+            rows = self._conn().execute(SELECT_FACTION_ITEMS, (category, faction))
+            return {key: json.loads(data) for key, data in rows}
+        if faction and factions is None:
+            item = self._fetch_item(category, '', faction)
+            if item is not None:
+                return item
+        return self.load_category(category)
+    
+    def get_item(self, category: str, item_key: str, faction: str = None) -> Dict[str, Any]:
+        factions = self._factions(category)
+        if factions is _MISSING:
+            return {}
+        if factions is None:
+            return self._fetch_item(category, '', item_key) or {}
+        if faction and faction in factions:
+            return self._fetch_item(category, faction, item_key) or {}
+        # No faction picked: the "items" are the factions themselves
+        if item_key in factions:
+            return self.get_items(category, item_key)
+        return {}
+    
+    def is_item(self, category: str, key: str) -> bool:
+        # Ungrouped categories have items at the top level, grouped ones factions
+        factions = self._factions(category)
+        return factions is None and self._fetch_item(category, '', key) is not None
+    
+    def _fetch_item(self, category: str, faction: str, item_key: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(SELECT_ITEM, (category, faction, item_key)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def search(self, query: str, limit: int = 10) -> Optional[List[SearchHit]]:
+        if not self.fts:
+            return None
+        terms = [token for token in TOKEN_PATTERN.findall(query.lower()) if token not in STOPWORDS]
+        if not terms:
+            return []
+        match = ' OR '.join(f'"{term}"' for term in terms)
+        rows = self._conn().execute(SEARCH_FTS, (match, limit)).fetchall()
+        return [
+            SearchHit(
+                category=category,
+                faction=faction or None,
+                key=key,
+                title=title,
+                score=-rank,
+                snippet=' '.join(snippet.split())
+            )
+            for category, faction, key, title, rank, snippet in rows
+        ]
+    
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _rows(content: Dict[str, Any]) -> Tuple[Optional[List[str]], List[Tuple[str, str, Dict[str, Any]]]]:
+    """(factions or None, [(faction, key, item)]) in file order"""
+    factions = [key for key, value in content.items() if isinstance(value, dict) and not is_item(value)]
+    rows = []
+    for key, value in content.items():
+        if not isinstance(value, dict):
+            continue
+        if is_item(value):
+            rows.append(('', key, value))
+        elif factions:
+            rows.extend((key, item_key, item) for item_key, item in value.items() if isinstance(item, dict))
+    return (factions or None), rows
+
+
+def import_json(data_dir: str, db_path: str) -> Dict[str, int]:
+    """Mirror data/*.json into the SQLite store, bumping versions of changed categories
+    
+    Unchanged files (same SHA-256) are skipped, so this is cheap to run at
+    every boot. Returns {category: item count} for the categories imported.
+    """
+    start = time.perf_counter()
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = _connect(db_path)
+    imported = {}
+    try:
+        conn.executescript(SCHEMA)
+        fts = _has_fts5(conn)
+        if fts:
+            conn.executescript(FTS_SCHEMA)
+        
+        known = dict(conn.execute("SELECT category, source_sha256 FROM categories").fetchall())
+        seen = set()
+        for file_path in sorted(glob.glob(os.path.join(data_dir, '*.json'))):
+            category = os.path.splitext(os.path.basename(file_path))[0]
+            seen.add(category)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            source_sha256 = hashlib.sha256(raw).hexdigest()
+            if known.get(category) == source_sha256:
+                continue
+            
+            try:
+                content = json.loads(raw.decode('utf-8'))
+                if not isinstance(content, dict):
+                    raise ValueError(f"{category}.json root should be a dictionary")
+            except Exception as e:
+                logger.error(f"❌ Not importing {category}.json: {e}")
+                continue
+            
+            factions, rows = _rows(content)
+            with conn:
+                conn.execute("DELETE FROM items WHERE category = ?", (category,))
+                conn.executemany(
+                    "INSERT INTO items (category, faction, key, position, data) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (category, faction, key, position, json.dumps(item, ensure_ascii=False))
+                        for position, (faction, key, item) in enumerate(rows)
+                    ]
+                )
+                if fts:
+                    conn.execute("DELETE FROM items_fts WHERE category = ?", (category,))
+                    conn.executemany(
+                        "INSERT INTO items_fts (title, body, category, faction, key) VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (
+                                item.get('display_name') or item.get('title') or key.title(),
+                                '\n'.join(text for _, text in item_segments(item)),
+                                category, faction, key
+                            )
+                            for faction, key, item in rows
+                        ]
+                    )
+                conn.execute(
+                    "INSERT INTO categories (category, factions, version, source_sha256) VALUES (?, ?, 1, ?) "
+                    "ON CONFLICT(category) DO UPDATE SET factions = excluded.factions, "
+                    "version = version + 1, source_sha256 = excluded.source_sha256",
+                    (category, json.dumps(factions) if factions is not None else None, source_sha256)
+                )
+            imported[category] = len(rows)
+            logger.info(f"🗄️ Imported {len(rows)} {category} entries")
+        
+        for category in set(known) - seen:
+            # Data file was removed - drop the category
+            with conn:
+                conn.execute("DELETE FROM items WHERE category = ?", (category,))
+                if fts:
+                    conn.execute("DELETE FROM items_fts WHERE category = ?", (category,))
+                conn.execute("DELETE FROM categories WHERE category = ?", (category,))
+            logger.info(f"🗑️ Removed {category} from the content store")
+    finally:
+        conn.close()
+    
+    logger.info(f"🗄️ Content import finished in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return imported
+
+
+if __name__ == '__main__':
+    # Import step: python -m data.sqlite_store [db_path]
+    logging.basicConfig(level=logging.INFO)
+    from config.settings import Settings
+    import_json(str(Settings.DATA_DIR), sys.argv[1] if len(sys.argv) > 1 else str(Settings.CONTENT_DB_PATH))
@@ -0,0 +1,46 @@
+from typing import Any, Dict, List, Optional
+
+from .search_index import SearchHit, is_item
+
+
+class ContentStore:
+    """Storage backend DataManager reads content from instead of data/*.json
+    
+    Implementations return the same shapes as the JSON layout: categories map
+    factions to items, or keys straight to items for ungrouped categories
+    like maps. Versions change whenever a category's content changes.
+    """
+    
+    name = 'store'
+    
+    def versions(self) -> Dict[str, int]:
+        """Content version of every stored category"""
+        raise NotImplementedError
+    
+    def load_category(self, category: str) -> Dict[str, Any]:
+        """Materialize a whole category"""
+        raise NotImplementedError
+    
+    def prepare(self, category: str):
+        """Get a category ready so its first reads are cheap (optional)"""
+        pass
+    
+    def get_factions(self, category: str) -> List[str]:
+        raise NotImplementedError
+    
+    def get_items(self, category: str, faction: str = None) -> Dict[str, Any]:
+        raise NotImplementedError
+    
+    def get_item(self, category: str, item_key: str, faction: str = None) -> Dict[str, Any]:
+        raise NotImplementedError
+    
+    def is_item(self, category: str, key: str) -> bool:
+        """Whether a top-level key is an item rather than a faction"""
+        return is_item(self.get_item(category, key))
+    
+    def search(self, query: str, limit: int = 10) -> Optional[List[SearchHit]]:
+        """Full-text search, or None to let DataManager use its in-memory index"""
+        return None
+    
+    def close(self):
+        pass
@@ -0,0 +1,273 @@
+import glob
+import json
+import logging
+import mmap
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .search_index import ITEM_MARKERS
+from .store import ContentStore
+
+logger = logging.getLogger(__name__)
+
+# Structural bytes; commas and colons only matter in the two levels that are indexed
+TOKEN = re.compile(rb'["{}\[\]:,]')
+NESTED_TOKEN = re.compile(rb'["{}\[\]]')
+STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+
+# (start, end) byte offsets of a value in its file
+Span = Tuple[int, int]
+
+_MISSING = object()
+
+
+def scan_offsets(buf) -> 'OrderedDict[str, Tuple[Span, Dict[str, Span]]]':
+    """Byte spans of every top-level value and of the values one level below it
+    
+    One pass over buf (bytes or an mmap) without building any of the values:
+    strings are skipped by regex and nothing below the second level is decoded.
+    """
+    start = re.compile(rb'\s*').match(buf).end()
+    if buf[start:start + 1] != b'{':
+        raise ValueError("root should be a dictionary")
+    
+    top = OrderedDict()
+    children: Dict[str, Span] = {}
+    keys: List[Optional[str]] = [None, None, None]
+    starts: List[Optional[int]] = [None, None, None]
+    containers = []
+    expect_key = False
+    pos = start
+    while True:
+        depth = len(containers)
+        match = (TOKEN if depth <= 2 else NESTED_TOKEN).search(buf, pos)
+        if match is None:
+            break
+        index = match.start()
+        token = buf[index:index + 1]
+        pos = index + 1
+        
+        if token == b'"':
+            end = STRING_END.match(buf, pos)
+            if end is None:
+                raise ValueError(f"unterminated string at byte {index}")
+            pos = end.end()
+            if expect_key and depth <= 2:
+                keys[depth] = json.loads(buf[index:pos])
+            expect_key = False
+        elif token == b':':
+            starts[depth] = pos
+            if depth == 1:
+                children = {}
+        elif token == b'{':
+            containers.append(token)
+            expect_key = True
+        elif token == b'[':
+            containers.append(token)
+            expect_key = False
+        else:
+            # , } or ] - ends the value in progress at this depth
+            if depth <= 2 and starts[depth] is not None:
+                span = (starts[depth], index)
+                if depth == 1:
+                    top[keys[1]] = (span, children)
+                else:
+                    children[keys[2]] = span
+                starts[depth] = None
+            if token == b',':
+                expect_key = containers[-1:] == [b'{']
+            else:
+                if not containers or containers.pop() != (b'{' if token == b'}' else b'['):
+                    raise ValueError(f"unbalanced {token.decode()} at byte {index}")
+                if not containers:
+                    break
+    
+    if containers:
+        raise ValueError("unexpected end of file")
+    return top
+
+
+class CategoryIndex:
+    """Offsets of one data file, valid while the file's (mtime, size) is unchanged"""
+    
+    __slots__ = ('stat', 'top')
+    
+    def __init__(self, stat: Tuple[int, int], top: 'OrderedDict[str, Tuple[Span, Dict[str, Span]]]'):
+        self.stat = stat
+        self.top = top
+    
+    def is_item(self, key: str) -> bool:
+        """Whether a top-level value is an item (judged by its keys, without decoding it)"""
+        _, children = self.top[key]
+        return any(child.startswith('field_') or child in ITEM_MARKERS for child in children)
+
+
+class StreamingJSONStore(ContentStore):
+    """Reads data/*.json in place, decoding only the factions and items asked for
+    
+    A file is scanned once for the byte offsets of its top-level keys and the
+    keys nested one level below; factions and items are then decoded straight
+    from those slices and kept in an LRU of max_items entries. Memory stays
+    flat as files grow: only offsets and recently used items are held.
+    """
+    
+    name = 'stream'
+    
+    def __init__(self, data_dir: str, max_items: int = 256):
+        self.data_dir = str(data_dir)
+        self.max_items = max_items
+        self._lock = threading.RLock()
+        self._indexes: Dict[str, CategoryIndex] = {}
+        # Versions bump whenever a file's (mtime, size) changes
+        self._stats: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._versions: Dict[str, int] = {}
+        # (category, path) -> decoded value, least recently used first
+        self._items: 'OrderedDict[Tuple[str, Tuple[str, ...]], Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def _file_path(self, category: str) -> str:
+        return os.path.join(self.data_dir, f"{category}.json")
+    
+    def _stat(self, category: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._file_path(category))
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def _forget(self, category: str):
+        self._indexes.pop(category, None)
+        for entry in [entry for entry in self._items if entry[0] == category]:
+            del self._items[entry]
+    
+    def _track(self, category: str, stat: Optional[Tuple[int, int]]):
+        """Bump the category's version (and drop what was read) if its file changed"""
+        if stat == self._stats.get(category, _MISSING):
+            return
+        self._forget(category)
+        self._stats[category] = stat
+        if stat is None:
+            self._versions.pop(category, None)
+        else:
+            self._versions[category] = self._versions.get(category, 0) + 1
+    
+    def versions(self) -> Dict[str, int]:
+        with self._lock:
+            categories = {
+                os.path.splitext(os.path.basename(file_path))[0]
+                for file_path in glob.glob(os.path.join(self.data_dir, '*.json'))
+            }
+            for category in categories | set(self._stats):
+                self._track(category, self._stat(category))
+            return dict(self._versions)
+    
+    def _index(self, category: str) -> Optional[CategoryIndex]:
+        with self._lock:
+            stat = self._stat(category)
+            self._track(category, stat)
+            if stat is None:
+                return None
+            index = self._indexes.get(category)
+            if index is not None:
+                return index
+            
+            start = time.perf_counter()
+            with open(self._file_path(category), 'rb') as f:
+                if stat[1] == 0:
+                    raise ValueError(f"{category}.json is empty")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    top = scan_offsets(buf)
+            index = self._indexes[category] = CategoryIndex(stat, top)
+            logger.info(
+                f"📑 Indexed {len(top)} top-level entries of {category}.json "
+                f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+            )
+            return index
+    
+    def _read(self, category: str, path: Tuple[str, ...]) -> Any:
+        """Decode the value at path (one or two keys deep), or None if it doesn't exist"""
+        with self._lock:
+            entry = (category, path)
+            if entry in self._items:
+                self._items.move_to_end(entry)
+                self.hits += 1
+                return self._items[entry]
+            
+            index = self._index(category)
+            if index is None or path[0] not in index.top:
+                return None
+            span, children = index.top[path[0]]
+            if len(path) > 1:
+                span = children.get(path[1])
+                if span is None:
+                    return None
+            
+            with open(self._file_path(category), 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_mtime_ns, stat.st_size) != index.stat:
+                    # Edited since it was indexed - the offsets are stale
+                    self._track(category, self._stat(category))
+                    return self._read(category, path)
+                f.seek(span[0])
+                value = json.loads(f.read(span[1] - span[0]))
+            
+            self.misses += 1
+            self._items[entry] = value
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+            return value
+    
+    def load_category(self, category: str) -> Dict[str, Any]:
+        file_path = self._file_path(category)
+        if not os.path.exists(file_path):
+            return {}
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{category}.json root should be a dictionary")
+        return data
+    
+    def prepare(self, category: str):
+        self._index(category)
+    
+    def get_factions(self, category: str) -> List[str]:
+        index = self._index(category)
+        return list(index.top) if index else []
+    
+    def get_items(self, category: str, faction: str = None) -> Dict[str, Any]:
+        index = self._index(category)
+        if index is None:
+            return {}
+        if faction and faction in index.top:
+            return self._read(category, (faction,))
+        return self.load_category(category)
+    
+    def get_item(self, category: str, item_key: str, faction: str = None) -> Dict[str, Any]:
+        index = self._index(category)
+        if index is None:
+            return {}
+        if faction and faction in index.top:
+            if index.is_item(faction):
+                # Same as the JSON layout: the "faction" is an item, look inside it
+                item = self._read(category, (faction,))
+                return item.get(item_key, {}) if isinstance(item, dict) else {}
+            return self._read(category, (faction, item_key)) or {}
+        return self._read(category, (item_key,)) or {}
+    
+    def is_item(self, category: str, key: str) -> bool:
+        index = self._index(category)
+        return bool(index) and key in index.top and index.is_item(key)
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'indexed_categories': len(self._indexes),
+            'cached_items': len(self._items),
+            'max_items': self.max_items,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
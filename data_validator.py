@@ -149,10 +149,36 @@ class DataValidator:
                 elif not map_data[field].strip():
                     report['warnings'].append(f"Map '{map_key}' has empty field: {field}")
             
+            # Optional overlay points: {"hq": [[x, y], ...], "garrisons": [[x, y], ...]} in 0-1 map coordinates
+            overlays = map_data.get('overlays')
+            if overlays is not None:
+                self._validate_map_overlays(map_key, overlays, report)
+            
             # Check for old thumbnail references (should be removed)
             if 'thumbnail' in map_data:
                 report['warnings'].append(f"Map '{map_key}' has deprecated thumbnail field - remove this as maps use variants")
     
+    def _validate_map_overlays(self, map_key: str, overlays: Any, report: Dict[str, Any]):
+        """Validate vector overlay points used by the map compositor"""
+        if not isinstance(overlays, dict):
+            report['errors'].append(f"Map '{map_key}' overlays should be a dictionary of layer → points")
+            report['valid'] = False
+            return
+        
+        for layer, points in overlays.items():
+            if layer not in ['hq', 'garrisons']:
+                report['warnings'].append(f"Map '{map_key}' has unknown overlay layer: {layer}")
+                continue
+            if not isinstance(points, list):
+                report['errors'].append(f"Map '{map_key}' overlay '{layer}' should be a list of [x, y] points")
+                report['valid'] = False
+                continue
+            for point in points:
+                if (not isinstance(point, list) or len(point) < 2
+                        or not all(isinstance(v, (int, float)) and 0 <= v <= 1 for v in point[:2])):
+                    report['errors'].append(f"Map '{map_key}' overlay '{layer}' has invalid point {point} (expected [x, y] between 0 and 1)")
+                    report['valid'] = False
+    
     def _validate_generic_data(self, data: Dict[str, Any], report: Dict[str, Any]):
         """Validate generic data structure"""
         if not isinstance(data, dict):
@@ -173,7 +199,9 @@ class DataValidator:
         # Remove attachment:// prefix if present
         clean_path = asset_path.replace('attachment://', '')
         
-        # Check if asset exists
+        # Check if asset exists (manifest lookup first, disk only for unlisted files)
+        if Settings.get_asset_info(clean_path) is not None:
+            return
         full_path = self.assets_dir / clean_path
         if not full_path.exists():
             report['warnings'].append(f"{context}: Asset '{clean_path}' not found")
@@ -191,9 +219,7 @@ class DataValidator:
         
         # Get all available assets
         if self.assets_dir.exists():
-            for asset in self.assets_dir.glob('*'):
-                if asset.is_file() and asset.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
-                    report['available_assets'].add(asset.name)
+            report['available_assets'].update(Settings.list_available_assets())
         
         # Find all asset references in data files
         for json_file in self.data_dir.glob('*.json'):
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Discord accepts at most 10 attachments per message
+MAX_ATTACHMENTS_PER_MESSAGE = 10
+
+@dataclass
+class PlannedAttachment:
+    """An asset as it will be attached: the referenced asset, the sent name and its size
+    
+    path is set for generated images (e.g. collages) that aren't assets themselves.
+    """
+    source: str
+    filename: str
+    size: int
+    path: Optional[Path] = None
+
+def plan_attachments(attachments: List[PlannedAttachment], budget: int,
+                     max_files: int = MAX_ATTACHMENTS_PER_MESSAGE
+                     ) -> Tuple[List[List[PlannedAttachment]], List[PlannedAttachment]]:
+    """Pack attachments into messages that each stay under the upload budget
+    
+    Attachments are taken in priority order and placed first-fit, so the
+    first message (the one carrying the embed) is filled with the most
+    useful images that fit and the rest spill into follow-up messages.
+    Returns (batches, dropped) where dropped items exceed the budget alone.
+    """
+    batches: List[List[PlannedAttachment]] = []
+    totals: List[int] = []
+    dropped: List[PlannedAttachment] = []
+    
+    for attachment in attachments:
+        if attachment.size > budget:
+            dropped.append(attachment)
+            continue
+        
+        for i, batch in enumerate(batches):
+            if totals[i] + attachment.size <= budget and len(batch) < max_files:
+                batch.append(attachment)
+                totals[i] += attachment.size
+                break
+        else:
+            batches.append([attachment])
+            totals.append(attachment.size)
+    
+    return batches, dropped
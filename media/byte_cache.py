@@ -0,0 +1,85 @@
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+class AssetByteCache:
+    """Bounded, size-aware LRU cache of asset file contents"""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for key, marking it as most recently used"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+    
+    def put(self, key: str, data: bytes):
+        """Store bytes for key, evicting least recently used entries to fit"""
+        size = len(data)
+        if not self.enabled or size > self.max_bytes:
+            # Never let one oversized asset flush the whole cache
+            return
+        
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+            
+            while self._entries and self.current_bytes + size > self.max_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+                logger.debug(f"♻️ Evicted {evicted_key} from asset byte cache")
+            
+            self._entries[key] = data
+            self.current_bytes += size
+    
+    def read(self, key: str, path: Path) -> bytes:
+        """Return asset bytes from memory, reading from disk on a miss"""
+        data = self.get(key)
+        if data is not None:
+            return data
+        
+        data = Path(path).read_bytes()
+        self.put(key, data)
+        return data
+    
+    def clear(self):
+        """Drop all cached bytes (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters and current usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0
+            }
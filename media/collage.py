@@ -0,0 +1,122 @@
+import hashlib
+import io
+import logging
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional - images are sent separately without it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Discord shows wide images best; layouts are scored against this aspect ratio
+TARGET_ASPECT = 16 / 9
+
+def candidate_layouts(count: int) -> List[List[int]]:
+    """Row splits to try: one row, one column, and rows of two or three"""
+    layouts = [[count], [1] * count]
+    for per_row in (2, 3):
+        if 1 < per_row < count:
+            rows = [per_row] * (count // per_row)
+            if count % per_row:
+                rows.append(count % per_row)
+            layouts.append(rows)
+    return layouts
+
+def choose_layout(aspects: List[float], width: int) -> Tuple[List[int], List[int]]:
+    """Pick the row split whose collage is closest to TARGET_ASPECT
+    
+    Every row is scaled to the full width, so a row's height is width
+    divided by the sum of its images' aspect ratios. Returns (rows, heights).
+    """
+    best = None
+    for rows in candidate_layouts(len(aspects)):
+        heights = []
+        index = 0
+        for count in rows:
+            heights.append(max(1, round(width / sum(aspects[index:index + count]))))
+            index += count
+        score = abs(math.log((width / sum(heights)) / TARGET_ASPECT))
+        if best is None or score < best[0]:
+            best = (score, rows, heights)
+    return best[1], best[2]
+
+class CollageRenderer:
+    """Composes an item's additional images into one cached contact sheet"""
+    
+    def __init__(self, output_dir: Path, width: int = 1600, gap: int = 6):
+        self.output_dir = Path(output_dir)
+        self.width = width
+        self.gap = gap
+        self._lock = threading.Lock()
+        # collage key -> lock held while that collage renders
+        self._render_locks: Dict[str, threading.Lock] = {}
+    
+    @property
+    def available(self) -> bool:
+        return Image is not None
+    
+    @staticmethod
+    def cache_key(content_hashes: List[str]) -> str:
+        """Key a collage by its ordered image list"""
+        return hashlib.sha256('\n'.join(content_hashes).encode('utf-8')).hexdigest()
+    
+    def _render(self, paths: List[Path]) -> bytes:
+        images = []
+        for path in paths:
+            with Image.open(path) as image:
+                images.append(image.convert('RGB'))
+        
+        aspects = [image.width / image.height for image in images]
+        rows, heights = choose_layout(aspects, self.width)
+        
+        total_height = sum(heights) + self.gap * (len(rows) - 1)
+        sheet = Image.new('RGB', (self.width, total_height), (32, 34, 37))
+        
+        index = 0
+        y = 0
+        for count, height in zip(rows, heights):
+            x = 0
+            row_images = images[index:index + count]
+            # Gaps come out of the row width, so shrink images proportionally
+            usable = self.width - self.gap * (count - 1)
+            for image in row_images:
+                w = max(1, round(usable * (image.width / image.height) / sum(aspects[index:index + count])))
+                sheet.paste(image.resize((w, height), Image.LANCZOS), (x, y))
+                x += w + self.gap
+            index += count
+            y += height + self.gap
+        
+        buffer = io.BytesIO()
+        sheet.save(buffer, format='WEBP', quality=85, method=4)
+        return buffer.getvalue()
+    
+    def render(self, paths: List[Path], content_hashes: List[str]) -> Optional[Path]:
+        """Get the path of the collage for these images, rendering on a miss"""
+        key = self.cache_key(content_hashes)
+        output_path = self.output_dir / f"{key[:16]}.webp"
+        if output_path.exists():
+            return output_path
+        if not self.available:
+            return None
+        
+        with self._lock:
+            render_lock = self._render_locks.setdefault(key, threading.Lock())
+        
+        # Different collages render in parallel; the same one renders once
+        with render_lock:
+            if output_path.exists():
+                return output_path
+            data = self._render(paths)
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = output_path.with_suffix('.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, output_path)
+        
+        logger.info(f"🖼️ Rendered collage of {len(paths)} images ({len(data) / 1024:.0f} KB)")
+        return output_path
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from media.tiles import GRID_COLUMNS, GRID_ROWS
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Pillow is optional - only prebuilt variants are served without it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Overlay layers in drawing order
+LAYERS = ('grid', 'hq', 'garrisons')
+
+LAYER_LABELS = {
+    'grid': 'Grid',
+    'hq': 'HQ Markers',
+    'garrisons': 'Default Garrisons',
+}
+
+# Marker styles for vector point layers: (fill, outline)
+MARKER_STYLES = {
+    'hq': ((220, 40, 40, 230), (255, 255, 255, 255)),
+    'garrisons': ((40, 110, 230, 230), (255, 255, 255, 255)),
+}
+
+def normalize_layers(layers: Sequence[str]) -> Tuple[str, ...]:
+    """Deduplicate layers and put them in drawing order"""
+    unknown = set(layers) - set(LAYERS)
+    if unknown:
+        raise ValueError(f"Unknown overlay layers: {', '.join(sorted(unknown))}")
+    return tuple(layer for layer in LAYERS if layer in layers)
+
+class OverlayCompositor:
+    """Composes map base images with grid, HQ and garrison overlays on demand
+    
+    Each layer comes from a transparent PNG overlay when one exists, otherwise
+    from vector points (normalised 0-1 coordinates) in maps.json; the grid
+    can always be drawn procedurally.
+    """
+    
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self._lock = threading.Lock()
+    
+    @property
+    def available(self) -> bool:
+        return Image is not None
+    
+    @staticmethod
+    def cache_key(base_hash: str, layers: Tuple[str, ...], overlay_hashes: Dict[str, str],
+                  points: Dict[str, List]) -> str:
+        """Hash everything that affects the output so edits re-render"""
+        payload = json.dumps({
+            'base': base_hash,
+            'layers': layers,
+            'overlays': {layer: overlay_hashes.get(layer) for layer in layers},
+            'points': {layer: points.get(layer) for layer in layers},
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _font(self, size: int):
+        try:
+            return ImageFont.load_default(size=size)
+        except TypeError:
+            # Older Pillow without scalable default font
+            return ImageFont.load_default()
+    
+    def _draw_grid(self, canvas: 'Image.Image'):
+        draw = ImageDraw.Draw(canvas)
+        width, height = canvas.size
+        line_width = max(1, width // 800)
+        font = self._font(max(12, width // 60))
+        
+        for i in range(1, len(GRID_COLUMNS)):
+            x = width * i // len(GRID_COLUMNS)
+            draw.line([(x, 0), (x, height)], fill=(0, 0, 0, 170), width=line_width)
+        for i in range(1, GRID_ROWS):
+            y = height * i // GRID_ROWS
+            draw.line([(0, y), (width, y)], fill=(0, 0, 0, 170), width=line_width)
+        
+        margin = max(4, width // 200)
+        for col, letter in enumerate(GRID_COLUMNS):
+            for row in range(GRID_ROWS):
+                x = width * col // len(GRID_COLUMNS) + margin
+                y = height * row // GRID_ROWS + margin
+                draw.text((x, y), f"{letter}{row + 1}", fill=(255, 255, 255, 220), font=font,
+                          stroke_width=2, stroke_fill=(0, 0, 0, 200))
+    
+    def _draw_points(self, canvas: 'Image.Image', layer: str, points: List):
+        draw = ImageDraw.Draw(canvas)
+        width, height = canvas.size
+        radius = max(6, width // 150)
+        fill, outline = MARKER_STYLES[layer]
+        
+        for point in points:
+            x, y = point[0] * width, point[1] * height
+            box = [x - radius, y - radius, x + radius, y + radius]
+            if layer == 'hq':
+                draw.ellipse(box, fill=fill, outline=outline, width=max(2, radius // 3))
+            else:
+                draw.rectangle(box, fill=fill, outline=outline, width=max(2, radius // 3))
+    
+    def render(self, base_path: Path, base_hash: str, layers: Sequence[str],
+               overlay_paths: Optional[Dict[str, Path]] = None,
+               overlay_hashes: Optional[Dict[str, str]] = None,
+               points: Optional[Dict[str, List]] = None) -> Tuple[Path, str]:
+        """Get (path, cache key) of the base image composed with the given layers"""
+        layers = normalize_layers(layers)
+        overlay_paths = overlay_paths or {}
+        overlay_hashes = overlay_hashes or {}
+        points = points or {}
+        
+        key = self.cache_key(base_hash, layers, overlay_hashes, points)
+        output_path = self.output_dir / f"{key[:16]}.png"
+        if output_path.exists():
+            return output_path, key
+        if not self.available:
+            raise RuntimeError("Pillow is not installed")
+        
+        with self._lock:
+            if output_path.exists():
+                return output_path, key
+            
+            with Image.open(base_path) as base:
+                canvas = base.convert('RGBA')
+            
+            for layer in layers:
+                if layer in overlay_paths:
+                    with Image.open(overlay_paths[layer]) as overlay:
+                        overlay = overlay.convert('RGBA')
+                        if overlay.size != canvas.size:
+                            overlay = overlay.resize(canvas.size, Image.LANCZOS)
+                        canvas.alpha_composite(overlay)
+                elif layer == 'grid':
+                    grid = Image.new('RGBA', canvas.size, (0, 0, 0, 0))
+                    self._draw_grid(grid)
+                    canvas.alpha_composite(grid)
+                elif points.get(layer):
+                    markers = Image.new('RGBA', canvas.size, (0, 0, 0, 0))
+                    self._draw_points(markers, layer, points[layer])
+                    canvas.alpha_composite(markers)
+                else:
+                    logger.warning(f"⚠️ No overlay data for layer '{layer}' of {base_path.name}")
+            
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = output_path.with_suffix('.tmp')
+            canvas.convert('RGB').save(tmp_path, format='PNG', optimize=True)
+            os.replace(tmp_path, output_path)
+        
+        logger.info(f"🧩 Composed {base_path.name} with layers {', '.join(layers) or 'none'}")
+        return output_path, key
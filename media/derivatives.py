@@ -0,0 +1,156 @@
+import io
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional - without it originals are always sent
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Derivative recipes in order of preference (best quality first):
+# (label, scale, format, save options)
+DERIVATIVE_RECIPES = [
+    ('png_opt', 1.0, 'PNG', {'optimize': True}),
+    ('webp_q90', 1.0, 'WEBP', {'quality': 90, 'method': 4}),
+    ('png_q256', 1.0, 'PNG', {'optimize': True, 'quantize': 256}),
+    ('webp_s75', 0.75, 'WEBP', {'quality': 85, 'method': 4}),
+    ('webp_s50', 0.5, 'WEBP', {'quality': 85, 'method': 4}),
+    ('webp_s35', 0.35, 'WEBP', {'quality': 80, 'method': 4}),
+]
+
+FORMAT_EXTENSIONS = {'PNG': '.png', 'WEBP': '.webp'}
+
+class DerivativeRenderer:
+    """Renders and caches size-targeted derivatives of large image assets"""
+    
+    def __init__(self, derivatives_dir: Path):
+        self.derivatives_dir = Path(derivatives_dir)
+        self._lock = threading.Lock()
+        # source hash -> lock held while that source's derivatives render
+        self._render_locks: Dict[str, threading.Lock] = {}
+        # source hash -> {label: (path, size)}
+        self._known: Dict[str, Dict[str, Tuple[Path, int]]] = {}
+    
+    @property
+    def available(self) -> bool:
+        return Image is not None
+    
+    @staticmethod
+    def derivative_filename(filename: str, label: str) -> str:
+        """Filename a derivative is sent under (keeps the original stem)"""
+        recipe = next(r for r in DERIVATIVE_RECIPES if r[0] == label)
+        return Path(filename).stem + FORMAT_EXTENSIONS[recipe[2]]
+    
+    def _render_lock(self, source_hash: str) -> threading.Lock:
+        with self._lock:
+            return self._render_locks.setdefault(source_hash, threading.Lock())
+    
+    def _scan(self, source_hash: str) -> Dict[str, Tuple[Path, int]]:
+        if source_hash in self._known:
+            return self._known[source_hash]
+        
+        known = {}
+        prefix = source_hash[:16]
+        if self.derivatives_dir.exists():
+            for label, _, fmt, _ in DERIVATIVE_RECIPES:
+                path = self.derivatives_dir / f"{prefix}_{label}{FORMAT_EXTENSIONS[fmt]}"
+                if path.exists():
+                    known[label] = (path, path.stat().st_size)
+        self._known[source_hash] = known
+        return known
+    
+    def _render(self, source: 'Image.Image', scale: float, fmt: str, options: dict) -> bytes:
+        image = source
+        if scale < 1.0:
+            size = (max(1, int(source.width * scale)), max(1, int(source.height * scale)))
+            image = source.resize(size, Image.LANCZOS)
+        
+        options = dict(options)
+        colors = options.pop('quantize', None)
+        if colors:
+            image = image.convert('RGBA').quantize(colors=colors, method=Image.FASTOCTREE)
+        elif fmt == 'WEBP' and image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt, **options)
+        return buffer.getvalue()
+    
+    def find(self, source_hash: str, max_bytes: int) -> Optional[Tuple[str, Path]]:
+        """Get the best already-rendered derivative under max_bytes, if any"""
+        known = self._scan(source_hash)
+        for label, _, _, _ in DERIVATIVE_RECIPES:
+            if label in known and known[label][1] <= max_bytes:
+                return label, known[label][0]
+        return None
+    
+    def get_derivative(self, source_path: Path, source_hash: str, max_bytes: int) -> Optional[Tuple[str, Path]]:
+        """Get (label, path) of the best derivative under max_bytes, rendering as needed"""
+        found = self.find(source_hash, max_bytes)
+        if found or not self.available:
+            return found
+        
+        # Renders of different assets run in parallel; the same asset renders once
+        with self._render_lock(source_hash):
+            known = self._scan(source_hash)
+            prefix = source_hash[:16]
+            
+            try:
+                with Image.open(source_path) as source:
+                    source.load()
+                    for label, scale, fmt, options in DERIVATIVE_RECIPES:
+                        if label in known:
+                            if known[label][1] <= max_bytes:
+                                return label, known[label][0]
+                            continue
+                        if label == 'png_opt' and source_path.suffix.lower() != '.png':
+                            # Re-encoding photos as PNG only makes them bigger
+                            continue
+                        
+                        try:
+                            data = self._render(source, scale, fmt, options)
+                        except Exception as e:
+                            logger.warning(f"⚠️ Could not render {label} derivative of {source_path.name}: {e}")
+                            continue
+                        
+                        path = self.derivatives_dir / f"{prefix}_{label}{FORMAT_EXTENSIONS[fmt]}"
+                        self.derivatives_dir.mkdir(parents=True, exist_ok=True)
+                        path.write_bytes(data)
+                        known[label] = (path, len(data))
+                        logger.info(f"🖼️ Rendered {label} derivative of {source_path.name} ({len(data) / 1024 / 1024:.1f} MB)")
+                        
+                        if len(data) <= max_bytes:
+                            return label, path
+            except Exception as e:
+                logger.error(f"❌ Error rendering derivatives for {source_path.name}: {e}")
+        
+        logger.warning(f"⚠️ No derivative of {source_path.name} fits in {max_bytes / 1024 / 1024:.1f} MB")
+        return None
+    
+    def build_all(self, assets: List[Tuple[Path, str]], max_bytes: int) -> int:
+        """Pre-render derivatives for every (path, hash) asset larger than max_bytes"""
+        if not self.available:
+            logger.warning("⚠️ Pillow not installed, skipping derivative pre-rendering")
+            return 0
+        
+        built = 0
+        for source_path, source_hash in assets:
+            try:
+                if source_path.stat().st_size <= max_bytes:
+                    continue
+            except OSError:
+                continue
+            if self.get_derivative(source_path, source_hash, max_bytes):
+                built += 1
+        
+        logger.info(f"🖼️ {built} oversized assets have derivatives under {max_bytes / 1024 / 1024:.1f} MB")
+        return built
+    
+    def clear(self):
+        """Forget known derivatives (files on disk stay valid, keyed by source hash)"""
+        with self._lock:
+            self._known.clear()
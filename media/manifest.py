@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional - dimensions are left empty without it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+class AssetManifest:
+    """Persisted per-file size, mtime, pixel dimensions and SHA-256 of the assets directory
+    
+    Every file's (size, mtime) is checked against its entry on load and only
+    files that differ are re-hashed, so edits made in place are picked up.
+    The directory mtime only tells whether files were added or removed.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+    
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _dimensions(file_path: Path):
+        if Image is None:
+            return None, None
+        try:
+            # Only the header is read here
+            with Image.open(file_path) as image:
+                return image.width, image.height
+        except Exception:
+            return None, None
+    
+    def _read(self) -> Optional[Dict[str, Any]]:
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != MANIFEST_VERSION:
+                return None
+            return manifest
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable asset manifest {self.path}: {e}")
+            return None
+    
+    def _write(self, manifest: Dict[str, Any]):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"❌ Error saving asset manifest {self.path}: {e}")
+    
+    def load_or_build(self, assets_dir: Path, files: Iterable[Path]) -> Dict[str, Dict[str, Any]]:
+        """Load the manifest, re-hashing only files whose size or mtime changed"""
+        start = time.perf_counter()
+        assets_dir = Path(assets_dir)
+        dir_mtime_ns = assets_dir.stat().st_mtime_ns
+        
+        previous = self._read()
+        if previous and previous.get('assets_dir') != str(assets_dir):
+            previous = None
+        old_entries = previous['files'] if previous else {}
+        entries = {}
+        hashed = 0
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            
+            old = old_entries.get(file_path.name)
+            if old and old['size'] == stat.st_size and old['mtime_ns'] == stat.st_mtime_ns:
+                entries[file_path.name] = old
+                continue
+            
+            width, height = self._dimensions(file_path)
+            entries[file_path.name] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'width': width,
+                'height': height,
+                'sha256': self._hash_file(file_path),
+            }
+            hashed += 1
+        
+        self.entries = entries
+        # Same directory mtime: no files were added or removed
+        unchanged = (previous is not None and previous.get('dir_mtime_ns') == dir_mtime_ns
+                     and entries.keys() == old_entries.keys())
+        if unchanged and not hashed:
+            logger.info(f"📒 Loaded asset manifest ({len(entries)} files) in {(time.perf_counter() - start) * 1000:.1f} ms")
+            return entries
+        
+        self._write({
+            'version': MANIFEST_VERSION,
+            'assets_dir': str(assets_dir),
+            'dir_mtime_ns': dir_mtime_ns,
+            'files': entries,
+        })
+        logger.info(f"📒 Built asset manifest ({len(entries)} files, {hashed} hashed) in {time.perf_counter() - start:.2f} s")
+        return entries
+    
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(filename)
+    
+    def clear(self):
+        self.entries = {}
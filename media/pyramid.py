@@ -0,0 +1,121 @@
+import io
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+from media.byte_cache import AssetByteCache
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional - zooming is unavailable without it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Level 0 is the whole map, level 1 a 2x2 split, level 2 a 4x4 split
+ZOOM_LEVELS = 3
+
+def tiles_per_side(level: int) -> int:
+    return 2 ** level
+
+class PyramidRenderer:
+    """Builds and caches multi-resolution tile pyramids of map images"""
+    
+    def __init__(self, pyramid_dir: Path, memory_bytes: int, tile_size: int = 1024):
+        self.pyramid_dir = Path(pyramid_dir)
+        self.tile_size = tile_size
+        self._memory = AssetByteCache(memory_bytes)
+        self._lock = threading.Lock()
+    
+    @property
+    def available(self) -> bool:
+        return Image is not None
+    
+    def tile_path(self, source_hash: str, level: int, x: int, y: int) -> Path:
+        return self.pyramid_dir / source_hash[:16] / f"{level}_{x}_{y}.webp"
+    
+    def _render_tile(self, source: 'Image.Image', level: int, x: int, y: int) -> bytes:
+        n = tiles_per_side(level)
+        box = (
+            source.width * x // n,
+            source.height * y // n,
+            source.width * (x + 1) // n,
+            source.height * (y + 1) // n,
+        )
+        tile = source.crop(box)
+        # Only ever downscale - deeper levels show the source's native detail
+        tile.thumbnail((self.tile_size, self.tile_size), Image.LANCZOS)
+        if tile.mode not in ('RGB', 'RGBA'):
+            tile = tile.convert('RGBA')
+        
+        buffer = io.BytesIO()
+        tile.save(buffer, format='WEBP', quality=85, method=4)
+        return buffer.getvalue()
+    
+    def _write(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    
+    def _missing_tiles(self, source_hash: str) -> List[Tuple[int, int, int]]:
+        missing = []
+        for level in range(ZOOM_LEVELS):
+            n = tiles_per_side(level)
+            for y in range(n):
+                for x in range(n):
+                    if not self.tile_path(source_hash, level, x, y).exists():
+                        missing.append((level, x, y))
+        return missing
+    
+    def build(self, source_path: Path, source_hash: str) -> int:
+        """Render every missing tile of a source's pyramid with a single decode"""
+        if not self.available:
+            return 0
+        
+        with self._lock:
+            missing = self._missing_tiles(source_hash)
+            if not missing:
+                return 0
+            
+            with Image.open(source_path) as source:
+                source.load()
+                for level, x, y in missing:
+                    self._write(self.tile_path(source_hash, level, x, y), self._render_tile(source, level, x, y))
+        
+        logger.info(f"🔍 Built {len(missing)} zoom tiles for {source_path.name}")
+        return len(missing)
+    
+    def get_tile(self, source_path: Path, source_hash: str, level: int, x: int, y: int) -> bytes:
+        """Get WebP bytes of one pyramid tile, rendering it on a cold cache"""
+        n = tiles_per_side(level)
+        if not (0 <= level < ZOOM_LEVELS and 0 <= x < n and 0 <= y < n):
+            raise ValueError(f"Tile {level}/{x}/{y} is outside the pyramid")
+        
+        key = f"{source_hash[:16]}_{level}_{x}_{y}"
+        data = self._memory.get(key)
+        if data is not None:
+            return data
+        
+        path = self.tile_path(source_hash, level, x, y)
+        if not path.exists():
+            if not self.available:
+                raise RuntimeError("Pillow is not installed")
+            with self._lock:
+                # A prebuild or another click may have written it while we waited
+                if not path.exists():
+                    with Image.open(source_path) as source:
+                        self._write(path, self._render_tile(source, level, x, y))
+        data = path.read_bytes()
+        
+        self._memory.put(key, data)
+        return data
+
+
+if __name__ == '__main__':
+    # Offline build: python -m media.pyramid
+    logging.basicConfig(level=logging.INFO)
+    from config.settings import Settings
+    Settings.build_map_pyramids()
@@ -0,0 +1,117 @@
+import io
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Tuple
+
+from media.byte_cache import AssetByteCache
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional - tiles are unavailable without it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Hell Let Loose maps use a 10x10 grid: columns A-J, rows 1-10
+GRID_COLUMNS = 'ABCDEFGHIJ'
+GRID_ROWS = 10
+
+_CELL = r'([A-J])\s*(10|[1-9])'
+_REFERENCE_RE = re.compile(rf'^{_CELL}(?:\s*[-:]\s*{_CELL})?$', re.IGNORECASE)
+
+class GridReferenceError(ValueError):
+    """Raised for grid references that don't name a square on the map"""
+
+def parse_grid_reference(reference: str) -> Tuple[int, int, int, int]:
+    """Parse 'E6' or 'E6-F7' into inclusive zero-based (col0, row0, col1, row1)"""
+    match = _REFERENCE_RE.match(reference.strip())
+    if not match:
+        raise GridReferenceError(f"'{reference}' is not a grid reference like E6 or E6-F7")
+    
+    col_a, row_a, col_b, row_b = match.groups()
+    col0 = GRID_COLUMNS.index(col_a.upper())
+    row0 = int(row_a) - 1
+    col1 = GRID_COLUMNS.index(col_b.upper()) if col_b else col0
+    row1 = int(row_b) - 1 if row_b else row0
+    return min(col0, col1), min(row0, row1), max(col0, col1), max(row0, row1)
+
+def format_grid_reference(col0: int, row0: int, col1: int, row1: int) -> str:
+    """Format a parsed grid range back into its canonical form"""
+    start = f"{GRID_COLUMNS[col0]}{row0 + 1}"
+    if (col0, row0) == (col1, row1):
+        return start
+    return f"{start}-{GRID_COLUMNS[col1]}{row1 + 1}"
+
+class TileRenderer:
+    """Crops and caches grid-square tiles from map images"""
+    
+    def __init__(self, tiles_dir: Path, memory_bytes: int, tile_size: int = 1024, padding: float = 0.15):
+        self.tiles_dir = Path(tiles_dir)
+        self.tile_size = tile_size
+        # Fraction of a grid cell shown around the requested squares
+        self.padding = padding
+        self._memory = AssetByteCache(memory_bytes)
+        self._lock = threading.Lock()
+    
+    @property
+    def available(self) -> bool:
+        return Image is not None
+    
+    def _render(self, source_path: Path, bounds: Tuple[int, int, int, int]) -> bytes:
+        col0, row0, col1, row1 = bounds
+        with Image.open(source_path) as source:
+            cell_w = source.width / len(GRID_COLUMNS)
+            cell_h = source.height / GRID_ROWS
+            pad_w = cell_w * self.padding
+            pad_h = cell_h * self.padding
+            
+            box = (
+                max(0, int(col0 * cell_w - pad_w)),
+                max(0, int(row0 * cell_h - pad_h)),
+                min(source.width, int((col1 + 1) * cell_w + pad_w)),
+                min(source.height, int((row1 + 1) * cell_h + pad_h)),
+            )
+            tile = source.crop(box)
+        
+        # Upscale so a single square is readable, never beyond tile_size
+        scale = self.tile_size / max(tile.width, tile.height)
+        if scale > 1.0:
+            tile = tile.resize((int(tile.width * scale), int(tile.height * scale)), Image.LANCZOS)
+        
+        buffer = io.BytesIO()
+        tile.save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
+    
+    def get_tile(self, source_path: Path, source_hash: str, reference: str) -> Tuple[str, bytes]:
+        """Get (canonical reference, PNG bytes) for a grid reference, rendering on a miss"""
+        bounds = parse_grid_reference(reference)
+        canonical = format_grid_reference(*bounds)
+        key = f"{source_hash[:16]}_{canonical}"
+        
+        data = self._memory.get(key)
+        if data is not None:
+            return canonical, data
+        
+        tile_path = self.tiles_dir / f"{key}.png"
+        if not tile_path.exists():
+            if not self.available:
+                raise RuntimeError("Pillow is not installed")
+            with self._lock:
+                # Another request may have rendered it while we waited
+                if not tile_path.exists():
+                    data = self._render(source_path, bounds)
+                    self.tiles_dir.mkdir(parents=True, exist_ok=True)
+                    tmp_path = tile_path.with_suffix('.tmp')
+                    tmp_path.write_bytes(data)
+                    os.replace(tmp_path, tile_path)
+                    logger.info(f"🧩 Rendered tile {canonical} of {source_path.name} ({len(data) / 1024:.0f} KB)")
+        data = tile_path.read_bytes()
+        
+        self._memory.put(key, data)
+        return canonical, data
+    
+    def stats(self) -> dict:
+        return self._memory.stats()
@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+from urllib.parse import urlparse, parse_qs
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+class AssetUrlCache:
+    """Persistent mapping of uploaded asset content to Discord CDN URLs
+    
+    Changes are only made in memory; the caller writes them out with
+    pending_changes() and write(), off the event loop.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._write_lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(filename: str, content_hash: str, max_bytes: Optional[int] = None) -> str:
+        """Key entries by filename plus content hash so edited assets re-upload
+        
+        The upload limit is part of the key: an oversized asset is sent as a
+        derivative that fits it, so each limit has its own URL.
+        """
+        key = f"{filename}:{content_hash}"
+        return f"{key}:{max_bytes}" if max_bytes else key
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+        
+        self._entries = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+                logger.info(f"🔗 Loaded {len(self._entries)} cached asset URLs")
+            except Exception as e:
+                logger.error(f"❌ Error loading asset URL cache {self.path}: {e}")
+        return self._entries
+    
+    def pending_changes(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """A snapshot of the entries to write, or None if nothing changed since the last one"""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return {key: dict(entry) for key, entry in self.load().items()}
+    
+    def write(self, entries: Dict[str, Dict[str, Any]]):
+        """Write a snapshot from pending_changes() to disk (blocking)"""
+        with self._write_lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.error(f"❌ Error saving asset URL cache {self.path}: {e}")
+    
+    @staticmethod
+    def _is_expired(url: str) -> bool:
+        """Signed Discord CDN URLs carry a hex expiry timestamp in the 'ex' parameter"""
+        expires = parse_qs(urlparse(url).query).get('ex')
+        if not expires:
+            return False
+        try:
+            # Leave a minute of slack so the client can still fetch it
+            return time.time() >= int(expires[0], 16) - 60
+        except ValueError:
+            return False
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached URL if present and not known to be expired"""
+        entry = self.load().get(key)
+        if not entry:
+            return None
+        if self._is_expired(entry['url']):
+            self.discard(key)
+            return None
+        return entry['url']
+    
+    def put(self, key: str, url: str):
+        """Record the CDN URL for an uploaded asset"""
+        self.load()[key] = {'url': url, 'checked_at': time.time()}
+        self._dirty = True
+    
+    def discard(self, key: str):
+        """Forget a URL that no longer resolves"""
+        if self.load().pop(key, None) is not None:
+            self._dirty = True
+    
+    async def _url_resolves(self, url: str) -> bool:
+        try:
+            timeout = aiohttp.ClientTimeout(total=1.5)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.head(url, allow_redirects=True) as response:
+                    return response.status == 200
+        except Exception as e:
+            logger.debug(f"Asset URL check failed for {url}: {e}")
+            return False
+    
+    async def verify(self, key: str) -> bool:
+        """Check a cached URL with the CDN, forgetting it if it no longer resolves
+        
+        Meant to run after the URL was sent, so the check never delays a response.
+        """
+        url = self.get(key)
+        if not url:
+            return False
+        if await self._url_resolves(url):
+            return True
+        
+        logger.info(f"🔗 Cached URL for {key} no longer resolves, will re-upload")
+        self.discard(key)
+        return False